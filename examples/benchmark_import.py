@@ -0,0 +1,34 @@
+# benchmark_import.py
+
+import statistics
+import subprocess
+import sys
+
+# Measures the wall time of `import speckit` in fresh interpreters, so that
+# regressions from eagerly imported optional dependencies show up clearly.
+NUM_RUNS = 10
+STATEMENTS = ["import numpy", "import speckit", "import speckit.systems"]
+
+
+def time_import(statement):
+    code = (
+        "import time; t0 = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - t0)"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(out.stdout.strip())
+
+
+def main():
+    for statement in STATEMENTS:
+        times = [time_import(statement) for _ in range(NUM_RUNS)]
+        print(
+            f"{statement:<28s} median {statistics.median(times) * 1e3:8.1f} ms"
+            f"   min {min(times) * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmark_miso.py
+
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# Compares the analytic (symbolic) and numeric MISO solvers across the number
+# of inputs. The analytic solver is timed with an empty solution cache, with
+# the solution cached on disk only (a new process), and cached in memory.
+os.environ["SPECKIT_CACHE_DIR"] = tempfile.mkdtemp(prefix="speckit_bench_")
+
+from speckit import systems  # noqa: E402
+
+N = int(1e5)
+FS = 10.0
+# A cold symbolic solve for 5 inputs already takes several minutes
+MAX_INPUTS = 4
+KWARGS = dict(Jdes=500, band=(0.01, 4.0))
+
+
+def timed(func, *args, **kwargs):
+    t0 = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - t0
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"{'q':>2s} {'cold':>10s} {'disk':>10s} {'memory':>10s} {'numeric':>10s}")
+    for q in range(1, MAX_INPUTS + 1):
+        inputs = [rng.normal(size=N) for _ in range(q)]
+        output = sum(inputs) + 0.1 * rng.normal(size=N)
+        args = (inputs, output, FS)
+
+        analytic = systems.MISO_analytic_optimal_spectral_analysis
+        t_cold = timed(analytic, *args, **KWARGS)
+        systems._miso_analytic_solution.cache_clear()
+        t_disk = timed(analytic, *args, **KWARGS)
+        t_mem = timed(analytic, *args, **KWARGS)
+        t_num = timed(systems.MISO_numeric_optimal_spectral_analysis, *args, **KWARGS)
+        print(
+            f"{q:2d} {t_cold * 1e3:8.1f}ms {t_disk * 1e3:8.1f}ms "
+            f"{t_mem * 1e3:8.1f}ms {t_num * 1e3:8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
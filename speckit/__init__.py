@@ -1,14 +1,18 @@
 import os
 os.environ.setdefault("NUMBA_THREADING_LAYER", "workqueue")
-os.environ.setdefault("NUMBA_NUM_THREADS", str(max(1, (os.cpu_count() or 1))))
-os.environ.setdefault("OMP_NUM_THREADS", "1")
-os.environ.setdefault("MKL_NUM_THREADS", "1")
-os.environ.setdefault("OPENBLAS_NUM_THREADS", "1")
 
 from .analysis import (
     compute_spectrum, 
+    compute_csd_matrix,
     compute_single_bin, 
     lpsd, 
     SpectrumAnalyzer, 
     SpectrumResult
 )
+from .parallel import (
+    get_num_threads,
+    set_num_threads,
+    num_threads,
+    threads_per_worker,
+    init_worker,
+)
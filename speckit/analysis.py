@@ -33,21 +33,37 @@
 # export authority as may be required before exporting such information to
 # foreign countries or providing access to foreign persons.
 #
+import os
+import sys
 import time
+import heapq
 import logging
-from typing import List, Dict, Any, Union, Callable, Optional, Tuple
+from concurrent.futures import Executor
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Dict,
+    Any,
+    Union,
+    Callable,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 import numpy as np
 from numpy import kaiser as np_kaiser
-from scipy.signal.windows import kaiser as sp_kaiser
-import pandas as pd
-import control as ct
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.axes import Axes
 
 from speckit.flattop import olap_dict, win_dict
-from speckit.dsp import integral_rms, polynomial_detrend
+from speckit.distributed import SpectrumExecutor, data_source
+from speckit.parallel import (
+    num_threads,
+    threads_per_worker,
+    share_array,
+    call_with_shared_array,
+)
+from speckit.dsp import band_powers, cumulative_power, polynomial_detrend
+from speckit.io import load_result, save_result
 from speckit.schedulers import lpsd_plan, ltf_plan, new_ltf_plan
 from speckit.utils import (
     kaiser_alpha,
@@ -60,6 +76,7 @@ from speckit.utils import (
 )
 from .core import (_HAS_NUMBA,
     _build_Q,
+    _merge_stats,
     _stats_detrend0_auto, 
     _stats_detrend0_csd,
     _stats_poly_auto_np,
@@ -70,6 +87,31 @@ from .core import (_HAS_NUMBA,
     _stats_poly_csd,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from matplotlib.figure import Figure
+    from matplotlib.axes import Axes
+
+
+def _is_kaiser(func: Any) -> bool:
+    """True if `func` is NumPy's or SciPy's Kaiser window.
+
+    SciPy is only consulted when the caller has already imported
+    `scipy.signal`, since a SciPy window can't be passed in otherwise.
+    """
+    if func is np_kaiser:
+        return True
+    if "scipy.signal" not in sys.modules:
+        return False
+    from scipy.signal.windows import kaiser as sp_kaiser
+
+    return func is sp_kaiser
+
+
+def _mag2db(mag: np.ndarray) -> np.ndarray:
+    """Converts magnitude to decibels (same as `control.mag2db`)."""
+    return 20.0 * np.log10(mag)
+
 
 class SpectrumAnalyzer:
     """
@@ -169,15 +211,21 @@ class SpectrumAnalyzer:
             "force_target_nf": force_target_nf,
         }
 
+        # File-backed inputs are kept so distributed workers can map the file
+        self._memmap = data if isinstance(data, np.memmap) else None
+
         # --- Process and validate input data ---
         x = np.asarray(data)
         if len(x.shape) == 2 and (x.shape[0] == 2 or x.shape[1] == 2):
             self.iscsd = True
-            self.data = x.T if x.shape[0] == 2 else x
+            # Axis of the input that indexes the two channels
+            self._channel_axis = 0 if x.shape[0] == 2 else 1
+            self.data = x.T if self._channel_axis == 0 else x
             if self.verbose:
                 logging.info(f"Detected two-channel data with length {len(self.data)}")
         elif len(x.shape) == 1:
             self.iscsd = False
+            self._channel_axis = None
             self.data = x
             if self.verbose:
                 logging.info(
@@ -215,7 +263,7 @@ class SpectrumAnalyzer:
                 raise ValueError(f"Window function '{win_param}' not recognized.")
         elif callable(win_param):
             self.config["win_func"] = win_param
-            if win_param in [np_kaiser, sp_kaiser]:
+            if _is_kaiser(win_param):
                 self.config["win_func"] = np_kaiser
                 if psll is None:
                     raise ValueError("PSLL must be specified for the Kaiser window.")
@@ -323,6 +371,27 @@ class SpectrumAnalyzer:
         self._plan_cache = plan_output
         return self._plan_cache
 
+    def set_plan(self, plan: Dict[str, Any]) -> None:
+        """
+        Uses a precomputed plan, e.g., one restored with `speckit.io.load_plan`.
+
+        Parameters
+        ----------
+        plan : dict
+            A plan as returned by `plan`, generated for data of the same length.
+
+        Raises
+        ------
+        ValueError
+            If any segment of the plan extends past the end of the data.
+        """
+        ends = [int(d[-1]) + int(L) for d, L in zip(plan["D"], plan["L"]) if len(d)]
+        if ends and max(ends) > self.nx:
+            raise ValueError(
+                f"Plan requires at least {max(ends)} samples, data has {self.nx}."
+            )
+        self._plan_cache = plan
+
 
     def compute_single_bin(
         self, freq: float, *, fres: Optional[float] = None, L: Optional[int] = None
@@ -365,7 +434,7 @@ class SpectrumAnalyzer:
         m = freq / final_fres  # Fractional bin number
 
         # --- DFT Kernel Generation ---
-        if self.config["win_func"] in [np_kaiser, sp_kaiser]:
+        if _is_kaiser(self.config["win_func"]):
             window = self.config["win_func"](len + 1, self.config["alpha"] * np.pi)[:-1]
         else:
             window = self.config["win_func"](len)
@@ -455,13 +524,43 @@ class SpectrumAnalyzer:
         return SpectrumResult(single_bin_results, self.config, self.iscsd, self.fs)
 
 
-    def compute(self) -> "SpectrumResult":
+    def compute(
+        self,
+        *,
+        n_threads: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        n_workers: Optional[int] = None,
+    ) -> "SpectrumResult":
         """
         Executes the spectral analysis and returns a SpectrumResult object.
 
         This method performs the core computation. It uses the generated plan 
         to segment the data, apply windowing and FFTs, and average the results.
 
+        Parameters
+        ----------
+        n_threads : int, optional
+            Number of threads used by the compiled kernels for this call only.
+            Use `speckit.threads_per_worker` to pick a value when running many
+            analyses in an outer pool. Defaults to None (current setting,
+            see `speckit.set_num_threads`). With an `executor`, this is the
+            number of threads in each worker.
+        executor : concurrent.futures.Executor or SpectrumExecutor, optional
+            Distributes groups of frequency bins across workers. With a
+            process pool (e.g., `ProcessPoolExecutor`), the input data is
+            placed in shared memory once and mapped by the workers without
+            copying. With a `speckit.distributed.SpectrumExecutor`, the bin
+            groups become serializable tasks that read file-backed input
+            (a `np.memmap`, or data spilled to the executor's `scratch_dir`).
+            Either way, only the plan entries of each group are sent to the
+            workers. Defaults to None (compute in this process).
+        n_workers : int, optional
+            Number of concurrent workers of `executor`, used to size the bin
+            groups and the per-worker thread budget. Defaults to the
+            executor's `n_workers` attribute (part of the `SpectrumExecutor`
+            protocol), or else the number of CPUs. Pass it explicitly for a
+            `concurrent.futures` pool with fewer workers than CPUs.
+
         Returns
         -------
         SpectrumResult
@@ -474,7 +573,17 @@ class SpectrumAnalyzer:
         start_time = time.time()
 
         # Compute:
-        results_list = [self._lpsd_core(np.arange(plan["nf"]))]
+        if executor is None:
+            with num_threads(n_threads):
+                results_list = [self._lpsd_core(np.arange(plan["nf"]))]
+        elif isinstance(executor, SpectrumExecutor):
+            results_list = self._lpsd_distributed(
+                executor, n_threads, _executor_workers(executor, n_workers)
+            )
+        else:
+            results_list = self._lpsd_executor(
+                executor, n_threads, _executor_workers(executor, n_workers)
+            )
 
         if self.verbose:
             logging.info(
@@ -506,89 +615,462 @@ class SpectrumAnalyzer:
                         "compute_t": tms}
         return SpectrumResult(final_results, self.config, self.iscsd, self.fs)
 
-    def _lpsd_core(self, f_indices: np.ndarray) -> List[Any]:
-        """Core processing loop for a block of frequency indices."""
-        plan = self._plan_cache
-        results_block: List[Any] = []
-
-        # Cache window (and sums) per L, and Q per (L, order)
-        window_cache: Dict[int, Tuple[np.ndarray, float, float]] = {}
-        Q_cache: Dict[Tuple[int, int], np.ndarray] = {}
-
-        # Contiguous views
+    def _channels(self) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """Returns contiguous float64 views of the input channel(s)."""
         if self.iscsd:
             x1 = np.ascontiguousarray(self.data[:, 0], dtype=np.float64)
             x2 = np.ascontiguousarray(self.data[:, 1], dtype=np.float64)
         else:
             x1 = np.ascontiguousarray(self.data, dtype=np.float64)
-            x2 = None  # type: ignore
-
-        for i in f_indices:
-            t0 = time.time()
-            L = int(plan["L"][i])
-            m = float(plan["m"][i])     # fractional bin
-            starts = plan["D"][i]       # np.ndarray of start indices
-
-            # Window cache
-            if L not in window_cache:
-                if self.config["win_func"] in (np_kaiser, sp_kaiser):
-                    w = self.config["win_func"](L + 1, self.config["alpha"] * np.pi)[:-1]
-                else:
-                    w = self.config["win_func"](L)
-                w = np.asarray(w, dtype=np.float64)
-                S1 = float(w.sum()); S2 = float((w*w).sum())
-                window_cache[L] = (w, S1, S2)
-            else:
-                w, S1, S2 = window_cache[L]
+            x2 = None
+        return x1, x2
 
-            omega = 2.0 * np.pi * (m / L)
-            order = int(self.config["order"])
+    def _plan_slice(self, f_indices: np.ndarray) -> Dict[str, Any]:
+        """Extracts the plan entries needed to compute the given bins."""
+        plan = self._plan_cache
+        f_indices = np.asarray(f_indices, dtype=np.int64)
+        return {
+            "i": f_indices,
+            "L": np.asarray(plan["L"])[f_indices],
+            "m": np.asarray(plan["m"])[f_indices],
+            "D": [plan["D"][i] for i in f_indices],
+        }
 
-            if order == -1:
-                if self.iscsd:
-                    if _HAS_NUMBA:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_win_only_csd(x1, x2, starts, L, w, omega)
-                    else: 
-                        _stats_poly_csd_np(x1, x2, starts, L, w, omega, np.zeros((L,1)))
+    def _window_spec(self) -> Tuple[Callable, Optional[float], int]:
+        return self.config["win_func"], self.config.get("alpha"), int(self.config["order"])
+
+    def _bin_groups(self, n_groups: int) -> List[np.ndarray]:
+        """Splits the plan's bins into groups of roughly equal cost.
+
+        The cost of a bin is taken as `navg * L` (samples processed); bins are
+        assigned greedily, most expensive first, to the least loaded group.
+        """
+        plan = self._plan_cache
+        cost = np.asarray(plan["navg"], dtype=np.float64) * np.asarray(plan["L"])
+        n_groups = max(1, min(int(n_groups), plan["nf"]))
+        loads = [(0.0, g) for g in range(n_groups)]
+        groups: List[List[int]] = [[] for _ in range(n_groups)]
+        for i in np.argsort(cost)[::-1]:
+            load, g = heapq.heappop(loads)
+            groups[g].append(int(i))
+            heapq.heappush(loads, (load + cost[i], g))
+        return [np.sort(np.array(g, dtype=np.int64)) for g in groups if g]
+
+    def _lpsd_executor(
+        self, executor: Executor, n_threads: Optional[int], n_workers: int
+    ) -> List[Any]:
+        """Distributes bin groups over a process pool with shared-memory input."""
+        if n_threads is None:
+            n_threads = threads_per_worker(n_workers)
+        # A few groups per worker smooths out load imbalance.
+        groups = self._bin_groups(4 * n_workers)
+
+        x1, x2 = self._channels()
+        shm, spec = share_array(x1 if x2 is None else np.stack([x1, x2]))
+        try:
+            futures = [
+                executor.submit(
+                    _lpsd_shared_worker,
+                    spec,
+                    self.iscsd,
+                    self._plan_slice(g),
+                    self._window_spec(),
+                    n_threads,
+                )
+                for g in groups
+            ]
+            return [fut.result() for fut in futures]
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _lpsd_distributed(
+        self, executor: SpectrumExecutor, n_threads: Optional[int], n_workers: int
+    ) -> List[Any]:
+        """Runs bin groups as serializable tasks through a `SpectrumExecutor`."""
+        if n_threads is None:
+            n_threads = threads_per_worker(n_workers)
+        groups = self._bin_groups(4 * n_workers)
+
+        if self._memmap is not None:
+            data, channel_axis = self._memmap, self._channel_axis
+        else:
+            # self.data stacks the channels as columns
+            data, channel_axis = self.data, 1
+        source = data_source(data, executor.scratch_dir)
+        try:
+            tasks = [
+                {
+                    "source": source,
+                    "iscsd": self.iscsd,
+                    "channel_axis": channel_axis if self.iscsd else None,
+                    "plan_slice": self._plan_slice(g),
+                    "win_spec": self._window_spec(),
+                    "n_threads": n_threads,
+                }
+                for g in groups
+            ]
+            return list(executor.run(tasks))
+        finally:
+            if source["spilled"]:
+                os.remove(source["path"])
+
+    def _lpsd_core(self, f_indices: np.ndarray) -> List[Any]:
+        """Core processing loop for a block of frequency indices."""
+        x1, x2 = self._channels()
+        return _lpsd_bins(x1, x2, self._plan_slice(f_indices), *self._window_spec())
+
+
+def _executor_workers(executor: Any, n_workers: Optional[int]) -> int:
+    """Number of concurrent workers of an executor passed to `compute`."""
+    if n_workers is None:
+        n_workers = getattr(executor, "n_workers", None)
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+    n_workers = int(n_workers)
+    if n_workers < 1:
+        raise ValueError(f"Number of workers must be >= 1 (got {n_workers}).")
+    return n_workers
+
+
+def _segment_window(
+    win_func: Callable, alpha: Optional[float], L: int
+) -> Tuple[np.ndarray, float, float]:
+    """Returns the length-`L` window and its sums `S1`, `S2`."""
+    if _is_kaiser(win_func):
+        w = win_func(L + 1, alpha * np.pi)[:-1]
+    else:
+        w = win_func(L)
+    w = np.asarray(w, dtype=np.float64)
+    return w, float(w.sum()), float((w * w).sum())
+
+
+def _lpsd_bins(
+    x1: np.ndarray,
+    x2: Optional[np.ndarray],
+    plan_slice: Dict[str, Any],
+    win_func: Callable,
+    alpha: Optional[float],
+    order: int,
+) -> List[Any]:
+    """Computes the averaged statistics for the bins in a plan slice.
+
+    Returns one `[i, XY, MXX, MYY, S1**2, S2, M2, elapsed]` entry per bin.
+    """
+    results_block: List[Any] = []
+    iscsd = x2 is not None
+
+    # Cache window (and sums) per L, and Q per (L, order)
+    window_cache: Dict[int, Tuple[np.ndarray, float, float]] = {}
+    Q_cache: Dict[Tuple[int, int], np.ndarray] = {}
+
+    for k, i in enumerate(plan_slice["i"]):
+        t0 = time.time()
+        L = int(plan_slice["L"][k])
+        m = float(plan_slice["m"][k])     # fractional bin
+        starts = plan_slice["D"][k]       # np.ndarray of start indices
+
+        # Window cache
+        if L not in window_cache:
+            window_cache[L] = _segment_window(win_func, alpha, L)
+        w, S1, S2 = window_cache[L]
+
+        omega = 2.0 * np.pi * (m / L)
+
+        if order == -1:
+            if _HAS_NUMBA:
+                if iscsd:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_win_only_csd(x1, x2, starts, L, w, omega)
+                else:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_win_only_auto(x1, starts, L, w, omega)
+            else:
+                # Projecting onto a zero basis leaves the segment untouched
+                Q = np.zeros((L, 1))
+                if iscsd:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_csd_np(x1, x2, starts, L, w, omega, Q)
+                else:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_auto_np(x1, starts, L, w, omega, Q)
+        elif order == 0:
+            if _HAS_NUMBA:
+                if iscsd:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_detrend0_csd(x1, x2, starts, L, w, omega)
                 else:
-                    if _HAS_NUMBA:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_win_only_auto(x1, starts, L, w, omega)
-                    else: 
-                        _stats_poly_auto_np(x1, starts, L, w, omega, np.zeros((L,1)))
-            elif order == 0:
-                if self.iscsd:
-                    if _HAS_NUMBA:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_detrend0_csd(x1, x2, starts, L, w, omega)
-                    else: 
-                        _stats_poly_csd_np(x1, x2, starts, L, w, omega, np.zeros((L,1)))
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_detrend0_auto(x1, starts, L, w, omega)
+            else:
+                # Projecting onto the normalized constant removes the mean
+                Q = np.full((L, 1), 1.0 / np.sqrt(L))
+                if iscsd:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_csd_np(x1, x2, starts, L, w, omega, Q)
                 else:
-                    if _HAS_NUMBA:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_detrend0_auto(x1, starts, L, w, omega)
-                    else:
-                        _stats_poly_auto_np(x1, starts, L, w, omega, np.zeros((L,1)))
-            elif order in (1, 2):
-                key = (L, order)
-                Q = Q_cache.get(key)
-                if Q is None:
-                    Q = _build_Q(L, order)
-                    Q_cache[key] = Q
-                if self.iscsd:
-                    if _HAS_NUMBA:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_poly_csd(x1, x2, starts, L, w, omega, Q)
-                    else:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_poly_csd_np(x1, x2, starts, L, w, omega, Q)
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_auto_np(x1, starts, L, w, omega, Q)
+        elif order in (1, 2):
+            key = (L, order)
+            Q = Q_cache.get(key)
+            if Q is None:
+                Q = _build_Q(L, order)
+                Q_cache[key] = Q
+            if iscsd:
+                if _HAS_NUMBA:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_csd(x1, x2, starts, L, w, omega, Q)
                 else:
-                    if _HAS_NUMBA:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_poly_auto(x1, starts, L, w, omega, Q)
-                    else:
-                        MXX, MYY, mu_r, mu_i, M2 = _stats_poly_auto_np(x1, starts, L, w, omega, Q)
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_csd_np(x1, x2, starts, L, w, omega, Q)
             else:
-                raise NotImplementedError
+                if _HAS_NUMBA:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_auto(x1, starts, L, w, omega, Q)
+                else:
+                    MXX, MYY, mu_r, mu_i, M2 = _stats_poly_auto_np(x1, starts, L, w, omega, Q)
+        else:
+            raise NotImplementedError
+
+        XY = complex(mu_r, mu_i)
+        results_block.append([int(i), XY, float(MXX), float(MYY), S1*S1, S2, float(M2), time.time() - t0])
 
-            XY = complex(mu_r, mu_i)
-            results_block.append([i, XY, float(MXX), float(MYY), S1*S1, S2, float(M2), time.time() - t0])
+    return results_block
+
+
+def _csd_matrix_bins(
+    X: np.ndarray,
+    plan: Dict[str, Any],
+    win_func: Callable,
+    alpha: Optional[float],
+    order: int,
+    block_size: int = 1 << 22,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Averaged cross-spectral matrix of all pairs of channels, per bin.
+
+    Detrending, windowing and the DFT at the bin frequency are folded into
+    a single analysis vector per bin, so every segment of every channel is
+    transformed with one matrix product. Segments are gathered in blocks of
+    at most `block_size` samples to bound memory.
+
+    Returns `M` of shape (nf, C, C) with ``M[k, a, b] = mean(Z_a * conj(Z_b))``
+    over the segments of bin `k` (the `XY` convention of the kernels), and
+    the window sums `S2` of shape (nf,).
+    """
+    C = X.shape[0]
+    nf = int(plan["nf"])
+    M = np.empty((nf, C, C), dtype=np.complex128)
+    S2 = np.empty(nf, dtype=np.float64)
+    window_cache: Dict[int, Tuple[np.ndarray, float, float]] = {}
+    Q_cache: Dict[int, np.ndarray] = {}
+
+    for k in range(nf):
+        L = int(plan["L"][k])
+        m = float(plan["m"][k])
+        starts = np.asarray(plan["D"][k], dtype=np.intp)
+
+        if L not in window_cache:
+            window_cache[L] = _segment_window(win_func, alpha, L)
+        w, _, S2[k] = window_cache[L]
+
+        # Real and imaginary parts of the windowed DFT vector, shape (L, 2)
+        phase = 2.0 * np.pi * (m / L) * np.arange(L)
+        V = np.stack([w * np.cos(phase), -w * np.sin(phase)], axis=1)
+
+        # Detrending y - Q Q^T y commutes into the analysis vector
+        if order == 0:
+            V = V - V.mean(axis=0)
+        elif order in (1, 2):
+            Q = Q_cache.get(L)
+            if Q is None:
+                Q = Q_cache[L] = _build_Q(L, order)
+            V = V - Q @ (Q.T @ V)
+        elif order != -1:
+            raise NotImplementedError
+
+        frames = np.lib.stride_tricks.sliding_window_view(X, L, axis=-1)
+        step = max(1, block_size // (C * L))
+        acc = np.zeros((C, C), dtype=np.complex128)
+        for j in range(0, len(starts), step):
+            R = frames[:, starts[j : j + step]] @ V  # (C, n_seg, 2)
+            Z = R[..., 0] + 1j * R[..., 1]
+            acc += Z @ Z.conj().T
+        M[k] = acc / len(starts)
+
+    return M, S2
+
+
+def _lpsd_on_shared(
+    data: np.ndarray,
+    iscsd: bool,
+    plan_slice: Dict[str, Any],
+    win_spec: Tuple[Callable, Optional[float], int],
+    n_threads: Optional[int],
+) -> List[Any]:
+    x1, x2 = (data[0], data[1]) if iscsd else (data, None)
+    with num_threads(n_threads):
+        return _lpsd_bins(x1, x2, plan_slice, *win_spec)
+
+
+def _lpsd_shared_worker(
+    spec: Dict[str, Any],
+    iscsd: bool,
+    plan_slice: Dict[str, Any],
+    win_spec: Tuple[Callable, Optional[float], int],
+    n_threads: Optional[int],
+) -> List[Any]:
+    """Process-pool entry point: computes a bin group on shared-memory input."""
+    return call_with_shared_array(
+        spec, _lpsd_on_shared, iscsd, plan_slice, win_spec, n_threads
+    )
+
+
+# ---------- DERIVED QUANTITIES ----------
+# Declarative registry of the quantities `SpectrumResult` derives from its raw
+# accumulators: name -> (kind, function of the result). `kind` is "all",
+# "auto" or "csd"; a quantity of the other kind evaluates to None. Functions
+# fetch their dependencies through `SpectrumResult._get`, which caches every
+# value, so intermediates shared by several quantities (names starting with
+# an underscore) are evaluated once per result.
+
+
+def _spectrum(r: "SpectrumResult", key: str) -> np.ndarray:
+    """One-sided spectral density from a raw accumulator."""
+    return 2.0 * r._data[key] / r.fs / r._data["S2"]
+
+
+def _nonzero_xx_yy(r: "SpectrumResult") -> np.ndarray:
+    return (r._data["XX"] != 0) & (r._data["YY"] != 0)
+
+
+def _Hxy(r: "SpectrumResult") -> np.ndarray:
+    XX = r._data["XX"]
+    return np.divide(
+        np.conj(r._data["XY"]),
+        XX,
+        out=np.zeros_like(XX, dtype=complex),
+        where=XX != 0,
+    )
+
+
+def _coh(r: "SpectrumResult") -> np.ndarray:
+    XX, YY = r._data["XX"], r._data["YY"]
+    return np.divide(
+        np.abs(r._data["XY"]) ** 2,
+        XX * YY,
+        out=np.zeros_like(XX),
+        where=r._get("_nonzero"),
+    )
+
+
+def _ccoh(r: "SpectrumResult") -> np.ndarray:
+    XX, YY = r._data["XX"], r._data["YY"]
+    return np.divide(
+        r._data["XY"],
+        np.sqrt(XX * YY),
+        out=np.zeros_like(XX, dtype=complex),
+        where=r._get("_nonzero"),
+    )
+
+
+def _GyySx(r: "SpectrumResult") -> np.ndarray:
+    Hxy, Hyx = r._get("Hxy"), r._get("Hyx")
+    return np.abs(
+        r._get("Gyy")
+        + Hxy * Hyx * r._get("Gxx")
+        - Hyx * r._get("Gxy")
+        - Hxy * r._get("Gyx")
+    )
+
+
+_DERIVED: Dict[str, Tuple[str, Callable[["SpectrumResult"], Any]]] = {
+    # --- Shared intermediates ---
+    "_nonzero": ("csd", _nonzero_xx_yy),
+    "_sqrt_navg": ("all", lambda r: np.sqrt(r._data["navg"])),
+    "_coh": (
+        "all",
+        lambda r: r._get("coh") if r.iscsd else np.ones_like(r._data["navg"]),
+    ),
+    "_sqrt_1mcoh": ("csd", lambda r: np.sqrt(np.abs(1 - r._get("_coh")))),
+    "_sqrt_2coh_navg": (
+        "csd",
+        lambda r: np.sqrt(r._get("_coh") * 2 * r._data["navg"]),
+    ),
+    # --- Base Quantities ---
+    "Gxx": ("all", lambda r: _spectrum(r, "XX")),
+    "Gyy": ("all", lambda r: _spectrum(r, "YY") if r.iscsd else r._get("Gxx")),
+    "Gxy": ("all", lambda r: _spectrum(r, "XY") if r.iscsd else r._get("Gxx")),
+    "ENBW": ("all", lambda r: r.fs * r._data["S2"] / r._data["S12"]),
+    # --- Derived Auto-Spectral Quantities ---
+    "psd": ("auto", lambda r: r._get("Gxx")),
+    "asd": ("auto", lambda r: np.sqrt(r._get("psd"))),
+    "ps": ("auto", lambda r: r._get("psd") * r._get("ENBW")),
+    # --- Derived Cross-Spectral Quantities ---
+    "csd": ("csd", lambda r: r._get("Gxy")),
+    "Gyx": ("csd", lambda r: np.conj(r._get("Gxy"))),
+    "Hxy": ("csd", _Hxy),
+    "Hyx": ("csd", lambda r: np.conj(r._get("Hxy"))),
+    "coh": ("csd", _coh),
+    "ccoh": ("csd", _ccoh),
+    "cs": ("csd", lambda r: r._get("csd") * r._get("ENBW")),
+    "tf": ("csd", lambda r: r._get("Hxy")),
+    "cf": ("csd", lambda r: np.abs(r._get("Hxy"))),
+    "cf_db": ("csd", lambda r: _mag2db(r._get("cf"))),
+    "cf_rad": ("csd", lambda r: np.angle(r._get("Hxy"))),
+    "cf_deg": ("csd", lambda r: np.angle(r._get("Hxy"), deg=True)),
+    "cf_rad_unwrapped": ("csd", lambda r: np.unwrap(r._get("cf_rad"))),
+    "cf_deg_unwrapped": ("csd", lambda r: np.rad2deg(r._get("cf_rad_unwrapped"))),
+    # --- Conditional Spectra ---
+    "GyyCx": ("csd", lambda r: r._get("coh") * r._get("Gyy")),
+    "GyyRx": ("csd", lambda r: (1 - r._get("coh")) * r._get("Gyy")),
+    "GyySx": ("csd", _GyySx),
+    # --- Standard Deviations ---
+    "Gxx_dev": ("all", lambda r: r._get("Gxx") / r._get("_sqrt_navg")),
+    "Gyy_dev": (
+        "all",
+        lambda r: r._get("Gyy") / r._get("_sqrt_navg")
+        if r.iscsd
+        else r._get("Gxx_dev"),
+    ),
+    "Hxy_dev": (
+        "csd",
+        lambda r: np.abs(r._get("Hxy"))
+        * r._get("_sqrt_1mcoh")
+        / r._get("_sqrt_2coh_navg"),
+    ),
+    "Gxy_dev": (
+        "csd",
+        lambda r: np.sqrt(
+            np.abs(r._get("Gxy")) ** 2 / r._get("_coh") / r._data["navg"]
+        ),
+    ),
+    "coh_dev": (
+        "csd",
+        lambda r: np.sqrt(
+            np.abs((2 * r._get("_coh") / r._data["navg"]) * (1 - r._get("_coh")) ** 2)
+        ),
+    ),
+    # --- Normalized Random Errors ---
+    "Gxx_error": ("all", lambda r: 1 / r._get("_sqrt_navg")),
+    "Gyy_error": ("all", lambda r: r._get("Gxx_error")),
+    "Gxy_error": (
+        "csd",
+        lambda r: 1 / np.sqrt(r._get("_coh") * r._data["navg"]),
+    ),
+    "Hxy_mag_error": (
+        "csd",
+        lambda r: r._get("_sqrt_1mcoh") / r._get("_sqrt_2coh_navg"),
+    ),
+    "Hxy_rad_error": (
+        "csd",
+        lambda r: np.arcsin(r._get("_sqrt_1mcoh")) / r._get("_sqrt_2coh_navg"),
+    ),
+    "Hxy_deg_error": ("csd", lambda r: np.rad2deg(r._get("Hxy_rad_error"))),
+    "coh_error": (
+        "csd",
+        lambda r: np.sqrt(2)
+        * (1 - r._get("_coh"))
+        / (np.sqrt(r._get("_coh")) * r._get("_sqrt_navg")),
+    ),
+}
+
+# Alternative names resolving to a registered quantity
+_ALIASES: Dict[str, str] = {"G": "psd"}
+
+_DERIVED_PUBLIC: Tuple[str, ...] = tuple(
+    name for name in _DERIVED if not name.startswith("_")
+)
 
-        return results_block
 
 class SpectrumResult:
     """
@@ -620,6 +1102,8 @@ class SpectrumResult:
     ... and many others. Use tab-completion to explore.
     """
 
+    __slots__ = ("_data", "_config", "iscsd", "fs", "_cache")
+
     def __init__(
         self,
         results_dict: Dict[str, Any],
@@ -647,233 +1131,85 @@ class SpectrumResult:
 
     def __getattr__(self, name: str) -> Any:
         """Lazy computation and caching of spectral properties."""
-        if name in self._cache:
-            return self._cache[name]
-
-        val: Any = None
-        # --- Base Quantities ---
-        if name == "Gxx":
-            val = 2.0 * self._data["XX"] / self.fs / self._data["S2"]
-        elif name == "Gyy":
-            val = (
-                2.0 * self._data["YY"] / self.fs / self._data["S2"]
-                if self.iscsd
-                else self.Gxx
-            )
-        elif name == "Gxy":
-            val = (
-                2.0 * self._data["XY"] / self.fs / self._data["S2"]
-                if self.iscsd
-                else self.Gxx
-            )
-        elif name == "ENBW":
-            val = self.fs * self._data["S2"] / self._data["S12"]
-
-        # --- Derived Auto-Spectral Quantities ---
-        elif name in ["psd", "G", "asd", "ps"]:
-            if self.iscsd:
-                val = None
-            else:
-                if name in ["psd", "G"]:
-                    val = self.Gxx
-                elif name == "asd":
-                    val = np.sqrt(self.psd)
-                elif name == "ps":
-                    val = self.psd * self.ENBW
-
-        # --- Derived Cross-Spectral Quantities ---
-        elif name in [
-            "csd",
-            "Gyx",
-            "Hxy",
-            "Hyx",
-            "coh",
-            "ccoh",
-            "cs",
-            "tf",
-            "cf",
-            "cf_db",
-            "cf_rad",
-            "cf_deg",
-            "cf_rad_unwrapped",
-            "cf_deg_unwrapped",
-        ]:
-            if not self.iscsd:
-                val = None
-            else:
-                if name == "csd":
-                    val = self.Gxy
-                elif name == "Gyx":
-                    val = np.conj(self.Gxy)
-                elif name == "Hxy":
-                    val = np.divide(
-                        np.conj(self._data["XY"]),
-                        self._data["XX"],
-                        out=np.zeros_like(self._data["XX"], dtype=complex),
-                        where=self._data["XX"] != 0,
-                    )
-                elif name == "Hyx":
-                    val = np.conj(self.Hxy)
-                elif name == "coh":
-                    val = np.divide(
-                        np.abs(self._data["XY"]) ** 2,
-                        self._data["XX"] * self._data["YY"],
-                        out=np.zeros_like(self._data["XX"]),
-                        where=(self._data["XX"] != 0) & (self._data["YY"] != 0),
-                    )
-                elif name == "ccoh":
-                    val = np.divide(
-                        self._data["XY"],
-                        np.sqrt(self._data["XX"] * self._data["YY"]),
-                        out=np.zeros_like(self._data["XX"], dtype=complex),
-                        where=(self._data["XX"] != 0) & (self._data["YY"] != 0),
-                    )
-                elif name == "cs":
-                    val = self.csd * self.ENBW
-                elif name == "tf":
-                    val = self.Hxy
-                elif name == "cf":
-                    val = np.abs(self.Hxy)
-                elif name == "cf_db":
-                    val = ct.mag2db(self.cf)
-                elif name == "cf_rad":
-                    val = np.angle(self.Hxy)
-                elif name == "cf_deg":
-                    val = np.angle(self.Hxy, deg=True)
-                elif name == "cf_rad_unwrapped":
-                    val = np.unwrap(self.cf_rad)
-                elif name == "cf_deg_unwrapped":
-                    val = np.rad2deg(self.cf_rad_unwrapped)
-
-        # --- Conditional Spectra ---
-        elif name in ["GyyCx", "GyyRx", "GyySx"]:
-            if not self.iscsd:
-                val = None
-            else:
-                if name == "GyyCx":
-                    val = self.coh * self.Gyy
-                elif name == "GyyRx":
-                    val = (1 - self.coh) * self.Gyy
-                elif name == "GyySx":
-                    val = np.abs(
-                        self.Gyy
-                        + self.Hxy * self.Hyx * self.Gxx
-                        - self.Hyx * self.Gxy
-                        - self.Hxy * self.Gyx
-                    )
-
-        # --- Errors and Deviations ---
-        elif name.endswith(("_dev", "_error")):
-            navg = self._data["navg"]
-            coh = self.coh if self.iscsd else np.ones_like(navg)
-
-            # Standard Deviations
-            if name == "Gxx_dev":
-                val = self.Gxx / np.sqrt(navg)
-            elif name == "Gyy_dev":
-                val = self.Gyy / np.sqrt(navg) if self.iscsd else self.Gxx_dev
-            elif name == "Hxy_dev":
-                val = (
-                    np.abs(self.Hxy)
-                    * np.sqrt(np.abs(1 - coh))
-                    / np.sqrt(coh * 2 * navg)
-                    if self.iscsd
-                    else None
-                )
-            elif name == "Gxy_dev":
-                val = (
-                    np.sqrt(np.abs(self.Gxy) ** 2 / coh / navg) if self.iscsd else None
-                )
-            elif name == "coh_dev":
-                val = (
-                    np.sqrt(np.abs((2 * coh / navg) * (1 - coh) ** 2))
-                    if self.iscsd
-                    else None
-                )
-
-            # Normalized Random Errors
-            elif name == "Gxx_error":
-                val = 1 / np.sqrt(navg)
-            elif name == "Gyy_error":
-                val = 1 / np.sqrt(navg) if self.iscsd else self.Gxx_error
-            elif name == "Gxy_error":
-                val = 1 / np.sqrt(coh * navg) if self.iscsd else None
-            elif name == "Hxy_mag_error":
-                val = (
-                    np.sqrt(np.abs(1 - coh)) / (np.sqrt(coh * 2 * navg))
-                    if self.iscsd
-                    else None
-                )
-            elif name == "Hxy_rad_error":
-                val = (
-                    np.arcsin(np.sqrt(np.abs(1 - coh))) / np.sqrt(coh * 2 * navg)
-                    if self.iscsd
-                    else None
-                )
-            elif name == "Hxy_deg_error":
-                val = np.rad2deg(self.Hxy_rad_error) if self.iscsd else None
-            elif name == "coh_error":
-                val = (
-                    np.sqrt(2) * (1 - coh) / (np.sqrt(coh) * np.sqrt(navg))
-                    if self.iscsd
-                    else None
-                )
-
-        elif name in self._data:
-            val = self._data[name]
-        else:
+        if name.startswith("_"):
             raise AttributeError(
                 f"'{type(self).__name__}' object has no attribute '{name}'"
             )
+        name = _ALIASES.get(name, name)
+        if name in _DERIVED:
+            return self._get(name)
+        data = self._data
+        if name in data:
+            return data[name]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
-        self._cache[name] = val
+    def _get(self, name: str) -> Any:
+        """Evaluates (once) a registered quantity, including private intermediates."""
+        cache = self._cache
+        if name in cache:
+            return cache[name]
+        kind, func = _DERIVED[name]
+        if kind == "all" or (kind == "csd") == self.iscsd:
+            val = func(self)
+        else:
+            val = None
+        cache[name] = val
         return val
 
     def __dir__(self) -> List[str]:
         """Enhances tab-completion to include dynamic attributes."""
         default_attrs = super().__dir__()
-        dynamic_attrs = [
-            "Gxx",
-            "Gyy",
-            "Gxy",
-            "ENBW",
-            "psd",
-            "asd",
-            "ps",
-            "csd",
-            "Gyx",
-            "Hxy",
-            "Hyx",
-            "coh",
-            "ccoh",
-            "cs",
-            "tf",
-            "cf",
-            "cf_db",
-            "cf_rad",
-            "cf_deg",
-            "cf_rad_unwrapped",
-            "cf_rad_unwrapped",
-            "GyyCx",
-            "GyyRx",
-            "GyySx",
-            "Gxx_dev",
-            "Gyy_dev",
-            "Gxy_dev",
-            "Hxy_dev",
-            "coh_dev",
-            "Gxx_error",
-            "Gyy_error",
-            "Gxy_error",
-            "Hxy_mag_error",
-            "Hxy_rad_error",
-            "Hxy_deg_error",
-            "coh_error",
-        ]
         return sorted(
-            list(set(default_attrs + list(self._data.keys()) + dynamic_attrs))
+            set(default_attrs) | set(self._data.keys()) | set(_DERIVED_PUBLIC)
         )
 
+    def compute_all(
+        self, names: Optional[Sequence[str]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluates many derived quantities in a single pass.
+
+        All quantities are vectorized over the frequency bins, and shared
+        intermediates (e.g., `coh`, `Hxy`, `sqrt(navg)`) are computed only
+        once and reused. Results are cached on the object, so subsequent
+        attribute access is free.
+
+        Parameters
+        ----------
+        names : sequence of str, optional
+            The quantities to evaluate. Both derived quantities and raw
+            result fields (e.g., 'navg') are accepted. If None, all derived
+            quantities applicable to this result (auto or cross spectrum)
+            are evaluated. Defaults to None.
+
+        Returns
+        -------
+        dict
+            Mapping of name to array. Quantities that do not apply to this
+            kind of result (e.g., 'coh' for an auto-spectrum) are omitted.
+
+        Raises
+        ------
+        ValueError
+            If a requested name is not a known quantity.
+        """
+        if names is None:
+            names = _DERIVED_PUBLIC
+        out: Dict[str, np.ndarray] = {}
+        for name in names:
+            key = _ALIASES.get(name, name)
+            if key in _DERIVED and not key.startswith("_"):
+                val = self._get(key)
+            elif key in self._data:
+                val = self._data[key]
+            else:
+                raise ValueError(f"Unknown spectral quantity '{name}'.")
+            if val is not None:
+                out[name] = val
+        return out
+
     def get_rms(self, pass_band: Optional[Tuple[float, float]] = None) -> float:
         """
         Computes the Root Mean Square (RMS) of the signal by integrating the ASD.
@@ -893,7 +1229,44 @@ class SpectrumResult:
             raise NotImplementedError(
                 "RMS calculation is only available for auto-spectra."
             )
-        return integral_rms(self.f, self.asd, pass_band)
+        if pass_band is None:
+            pass_band = (-np.inf, np.inf)
+        return float(np.sqrt(self.band_powers(pass_band)))
+
+    def band_powers(self, bands: np.ndarray, which: str = "Gxx") -> np.ndarray:
+        """
+        Integrated power of a spectral density in many frequency bands.
+
+        The running integral of the spectrum is computed once and cached, so
+        each band costs only two binary searches. Bands are integrated over
+        the frequencies they contain with the trapezoidal rule, matching
+        `get_rms`. For stacks of spectra, see `speckit.dsp.band_powers`.
+
+        Parameters
+        ----------
+        bands : array-like
+            A single band `(f_min, f_max)` or an array of shape `(n_bands, 2)`.
+        which : str, optional
+            The real-valued spectral density to integrate (e.g., 'Gxx', 'Gyy',
+            'GyySx'). Defaults to 'Gxx', the PSD of an auto-spectrum.
+
+        Returns
+        -------
+        np.ndarray
+            Band powers (mean-square values); the band-limited RMS is the
+            square root. A scalar for a single band.
+        """
+        key = f"_cumulative_{which}"
+        cumulative = self._cache.get(key)
+        if cumulative is None:
+            density = self.compute_all([which]).get(which)
+            if density is None or np.iscomplexobj(density):
+                raise ValueError(
+                    f"'{which}' is not a real spectral density of this result."
+                )
+            cumulative = cumulative_power(self._data["f"], density)
+            self._cache[key] = cumulative
+        return band_powers(self._data["f"], None, bands, cumulative=cumulative)
 
     def get_measurement(
         self, freq: Union[float, np.ndarray], which: str
@@ -913,15 +1286,203 @@ class SpectrumResult:
         float or np.ndarray
             The interpolated value(s) of the spectral quantity.
         """
-        target_signal = getattr(self, which)
-        if np.iscomplexobj(target_signal):
-            real_part = np.interp(freq, self.f, np.real(target_signal))
-            imag_part = np.interp(freq, self.f, np.imag(target_signal))
-            return real_part + 1j * imag_part
-        else:
-            return np.interp(freq, self.f, target_signal)
+        value = self.get_measurements(freq, [which])[which]
+        return value[()] if np.ndim(freq) == 0 else value
+
+    def get_measurements(
+        self,
+        freqs: Union[float, np.ndarray],
+        names: Sequence[str],
+        *,
+        loglog: bool = False,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Evaluates several spectral quantities at many frequencies at once.
+
+        The bracketing bins and interpolation weights are found once (a
+        binary search over the frequency grid, which is cached on the
+        result) and shared by all the requested quantities. As with
+        `np.interp`, frequencies outside the grid take the edge values.
+
+        Parameters
+        ----------
+        freqs : float or np.ndarray
+            The frequencies at which to evaluate the quantities.
+        names : sequence of str
+            The quantities to evaluate (e.g., ['asd', 'coh']).
+        loglog : bool, optional
+            Interpolate linearly in log-frequency, and geometrically between
+            positive real values (a straight line on a log-log plot), which
+            follows power-law spectral shapes better than linear
+            interpolation on a log-spaced grid. Complex quantities or ones
+            with non-positive values are interpolated linearly in
+            log-frequency. Defaults to False.
+
+        Returns
+        -------
+        dict
+            Mapping of name to an array with the shape of `freqs`.
 
-    def to_dataframe(self) -> pd.DataFrame:
+        Raises
+        ------
+        ValueError
+            If a quantity does not exist or is not available for this kind
+            of result (e.g., 'coh' for an auto-spectrum).
+        """
+        lo, hi, w = self._interp_index(freqs, loglog)
+        out: Dict[str, np.ndarray] = {}
+        for name in names:
+            y = self.compute_all([name]).get(name)
+            if y is None:
+                raise ValueError(f"'{name}' is not available for this result.")
+            y0, y1 = y[lo], y[hi]
+            positive = not np.iscomplexobj(y) and np.all(y0 > 0) and np.all(y1 > 0)
+            if loglog and positive:
+                out[name] = np.exp(np.log(y0) + (np.log(y1) - np.log(y0)) * w)
+            else:
+                out[name] = y0 + (y1 - y0) * w
+        return out
+
+    def _interp_index(
+        self, freqs: Union[float, np.ndarray], loglog: bool
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Bracketing bins and weights of `freqs` on the frequency grid."""
+        key = "_loggrid" if loglog else "_grid"
+        grid = self._cache.get(key)
+        if grid is None:
+            grid = np.ascontiguousarray(self._data["f"], dtype=np.float64)
+            if loglog:
+                grid = np.log(grid)
+            self._cache[key] = grid
+
+        x = np.asarray(freqs, dtype=np.float64)
+        if loglog:
+            x = np.log(x)
+        nf = len(grid)
+        if nf == 1:
+            zeros = np.zeros(x.shape, dtype=np.intp)
+            return zeros, zeros, np.zeros(x.shape)
+
+        lo = np.clip(np.searchsorted(grid, x, side="right") - 1, 0, nf - 2)
+        hi = lo + 1
+        w = np.clip((x - grid[lo]) / (grid[hi] - grid[lo]), 0.0, 1.0)
+        return lo, hi, w
+
+    @property
+    def state(self) -> Dict[str, np.ndarray]:
+        """
+        Raw, mergeable accumulator state of each frequency bin.
+
+        Returns
+        -------
+        dict
+            `n` (number of averaged segments), `sum_XX`, `sum_YY`, `sum_XY`
+            (sums of the per-segment products) and `m2` (sum of squared
+            deviations of the complex XY products, Welford/Chan form).
+        """
+        n = np.asarray(self._data["navg"], dtype=np.float64)
+        return {
+            "n": n,
+            "sum_XX": n * self._data["XX"],
+            "sum_YY": n * self._data["YY"],
+            "sum_XY": n * self._data["XY"],
+            "m2": n * self._data["M2"],
+        }
+
+    def merge(self, *others: "SpectrumResult") -> "SpectrumResult":
+        """
+        Combines results computed on disjoint data into a single estimate.
+
+        Each bin's averages and variance are merged exactly, as if all the
+        segments had been averaged together (Chan et al. parallel update).
+        This lets chunked, parallel or incremental computations compose;
+        e.g., spectra of many shorter files with the same length and
+        configuration can be aggregated into one estimate.
+
+        Parameters
+        ----------
+        *others : SpectrumResult
+            Results on the same frequency plan (same `f` and `L`) and of
+            the same kind (auto or cross spectrum).
+
+        Returns
+        -------
+        SpectrumResult
+            A new result whose `navg` is the total number of averages. The
+            segment start indices `D` are dropped since they refer to
+            different records.
+
+        Raises
+        ------
+        ValueError
+            If the results are not compatible.
+        """
+        data = {k: v for k, v in self._data.items() if k != "D"}
+        data["navg"] = np.asarray(data["navg"])
+        for other in others:
+            if other.iscsd != self.iscsd or other.fs != self.fs:
+                raise ValueError("Cannot merge auto- and cross-spectra or different `fs`.")
+            if (
+                np.shape(other._data["f"]) != np.shape(data["f"])
+                or not np.allclose(other._data["f"], data["f"])
+                or not np.array_equal(other._data["L"], data["L"])
+            ):
+                raise ValueError("Cannot merge results computed on different frequency plans.")
+
+            n, XX, YY, XY, M2 = _merge_stats(
+                data["navg"], data["XX"], data["YY"], data["XY"], data["M2"],
+                other._data["navg"], other._data["XX"], other._data["YY"],
+                other._data["XY"], other._data["M2"],
+            )
+            data.update(XX=XX, YY=YY, XY=XY, M2=M2)
+            data["navg"] = n.astype(np.asarray(data["navg"]).dtype)
+            data["K"] = np.asarray(data["K"]) + np.asarray(other._data["K"])
+            if "compute_t" in data and "compute_t" in other._data:
+                data["compute_t"] = data["compute_t"] + other._data["compute_t"]
+
+        return SpectrumResult(data, self._config, self.iscsd, self.fs)
+
+    def save(self, path: Union[str, os.PathLike], *, compress: bool = False) -> None:
+        """
+        Stores the result in a compact binary file.
+
+        Only the raw accumulators and plan columns are written; derived
+        quantities are recomputed lazily after `load`. See `speckit.io`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Destination file. A '.h5' or '.hdf5' suffix selects HDF5
+            (requires `h5py`), otherwise a NumPy '.npz' archive is written.
+        compress : bool, optional
+            Compress the columns. Compressed files cannot be memory-mapped.
+            Defaults to False.
+        """
+        save_result(self, path, compress=compress)
+
+    @classmethod
+    def load(
+        cls, path: Union[str, os.PathLike], *, mmap: bool = False
+    ) -> "SpectrumResult":
+        """
+        Loads a result written by `save`.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            File to read.
+        mmap : bool, optional
+            Memory-map the stored columns instead of reading them. Defaults
+            to False.
+
+        Returns
+        -------
+        SpectrumResult
+            The loaded result.
+        """
+        return load_result(path, mmap=mmap)
+
+    def to_dataframe(self) -> "pd.DataFrame":
         """
         Exports all computed spectral quantities to a pandas DataFrame.
 
@@ -933,26 +1494,28 @@ class SpectrumResult:
         pd.DataFrame
             A DataFrame containing the spectral analysis results.
         """
-        df_dict = {"f": self.f}
-        for attr in dir(self):
-            if (
-                not attr.startswith("_")
-                and attr not in ["iscsd", "fs"]
-                and not callable(getattr(self, attr))
-            ):
-                try:
-                    value = getattr(self, attr)
-                    if isinstance(value, np.ndarray) and len(value) == len(self.f):
-                        df_dict[attr] = value
-                except AttributeError:
-                    continue  # Skip attributes that fail to compute
-        return pd.DataFrame(df_dict).set_index("f")
+        import pandas as pd
+
+        f = self.f
+        columns = {
+            key: value
+            for key, value in self._data.items()
+            if key != "f"
+            and isinstance(value, np.ndarray)
+            and value.ndim == 1
+            and len(value) == len(f)
+        }
+        columns.update(self.compute_all())
+        return pd.DataFrame(
+            {key: columns[key] for key in sorted(columns)},
+            index=pd.Index(f, name="f"),
+        )
 
     def plot(
         self,
         which: Optional[str] = None,
         *,
-        ax: Optional[Axes] = None,
+        ax: Optional["Axes"] = None,
         ylabel: Optional[str] = None,
         dB: bool = False,
         deg: bool = True,
@@ -960,7 +1523,7 @@ class SpectrumResult:
         errors: bool = False,
         sigma: int = 1,
         **kwargs,
-    ) -> Tuple[Figure, Union[Axes, Tuple[Axes, Axes]]]:
+    ) -> Tuple["Figure", Union["Axes", Tuple["Axes", "Axes"]]]:
         """
         A flexible plotting method for various spectral quantities.
 
@@ -996,6 +1559,8 @@ class SpectrumResult:
             A tuple containing the matplotlib Figure and either a single Axes
             object or a tuple of two Axes objects (for bode plots).
         """
+        import matplotlib.pyplot as plt
+
         plot_options = {
             "psd": ("loglog", self.f, self.psd, "Power Spectral Density"),
             "asd": ("loglog", self.f, self.asd, "Amplitude Spectral Density"),
@@ -1033,7 +1598,7 @@ class SpectrumResult:
                 lower = mag_data * (1 - sigma * mag_error)
                 upper = mag_data * (1 + sigma * mag_error)
                 if dB:
-                    lower, upper = ct.mag2db(np.maximum(1e-15, lower)), ct.mag2db(upper)
+                    lower, upper = _mag2db(np.maximum(1e-15, lower)), _mag2db(upper)
                 ax_mag.fill_between(
                     self.f,
                     lower,
@@ -1108,7 +1673,7 @@ def lpsd(
 
 
 def compute_spectrum(
-    data: np.ndarray, fs: float, **kwargs
+    data: np.ndarray, fs: float, *, n_threads: Optional[int] = None, **kwargs
 ) -> SpectrumResult:
     """
     Computes spectral estimates for one or two time-series in a single call.
@@ -1125,6 +1690,9 @@ def compute_spectrum(
         2D (2xN or Nx2) array for cross-spectral analysis.
     fs : float
         The sampling frequency of the data in Hz.
+    n_threads : int, optional
+        Number of threads used by the compiled kernels for this call.
+        Defaults to None (current setting, see `speckit.set_num_threads`).
     **kwargs :
         Additional keyword arguments to configure the analysis, passed
         directly to the `SpectrumAnalyzer`. Common arguments include:
@@ -1165,12 +1733,61 @@ def compute_spectrum(
     analyzer = SpectrumAnalyzer(data, fs, **kwargs)
 
     # 2. Immediately call the compute method
-    result = analyzer.compute()
+    result = analyzer.compute(n_threads=n_threads)
 
     # 3. Return the final result object
     return result
 
 
+def compute_csd_matrix(
+    data: Union[np.ndarray, Sequence[np.ndarray]],
+    fs: float,
+    *,
+    n_threads: Optional[int] = None,
+    **kwargs,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the one-sided cross-spectral density matrix of many channels.
+
+    All pairs of channels are estimated in a single pass over the data,
+    instead of one `compute_spectrum` call per pair. Every channel is
+    analyzed with the same plan, window and detrending, so that the
+    entries are consistent with the pairwise estimates.
+
+    Parameters
+    ----------
+    data : np.ndarray or sequence of np.ndarray
+        Input time-series as a 2D array of shape (n_channels, N), or a
+        sequence of equal-length 1D arrays.
+    fs : float
+        The sampling frequency of the data in Hz.
+    n_threads : int, optional
+        Number of threads used by the linear algebra backend for this call.
+        Defaults to None (current setting, see `speckit.set_num_threads`).
+    **kwargs :
+        Additional keyword arguments to configure the analysis, passed
+        to the `SpectrumAnalyzer` (e.g., `win`, `olap`, `Jdes`, `order`).
+
+    Returns
+    -------
+    f : np.ndarray
+        Array of Fourier frequencies in Hz, shape (nf,).
+    G : np.ndarray
+        Hermitian CSD matrices of shape (nf, n_channels, n_channels).
+        ``G[:, a, b]`` matches ``compute_spectrum([x_a, x_b], fs).Gxy``
+        and the diagonal holds the PSDs of the channels.
+    """
+    X = np.ascontiguousarray(np.asarray(data, dtype=np.float64))
+    if X.ndim != 2:
+        raise ValueError("Input data must be a 2D array or a sequence of 1D arrays.")
+
+    analyzer = SpectrumAnalyzer(X[0], fs, **kwargs)
+    plan = analyzer.plan()
+    with num_threads(n_threads):
+        M, S2 = _csd_matrix_bins(X, plan, *analyzer._window_spec())
+    return plan["f"], 2.0 * M / fs / S2[:, None, None]
+
+
 def compute_single_bin(
     data: np.ndarray,
     fs: float,
@@ -415,4 +415,79 @@ def _stats_poly_csd_np(x1, x2, starts, L, w, omega, Q):
         M2 = float(np.mean((XYr-mu_r)**2 + (XYi-mu_i)**2))
     else:
         M2 = 0.0
-    return MXX, MYY, mu_r, mu_i, M2
\ No newline at end of file
+    return MXX, MYY, mu_r, mu_i, M2
+
+# ---------- MERGEABLE STATE (Chan et al. parallel update) ----------
+# Per bin, the kernels' outputs (navg, MXX, MYY, μ_XY, M2) are the sufficient
+# statistics of the averaged segments. Two sets of statistics over disjoint
+# segments combine exactly:
+#   n   = n_a + n_b
+#   μ   = (n_a μ_a + n_b μ_b) / n                      (for XX, YY and XY)
+#   M2  = (n_a M2_a + n_b M2_b) / n + n_a n_b |μ_b - μ_a|^2 / n^2
+# where M2 is the population variance of the complex XY products.
+def _merge_stats(n_a, XX_a, YY_a, XY_a, M2_a, n_b, XX_b, YY_b, XY_b, M2_b):
+    n_a = np.asarray(n_a, dtype=np.float64)
+    n_b = np.asarray(n_b, dtype=np.float64)
+    n = n_a + n_b
+    wa = n_a / n
+    wb = n_b / n
+    XX = wa * XX_a + wb * XX_b
+    YY = wa * YY_a + wb * YY_b
+    XY = wa * XY_a + wb * XY_b
+    d = XY_b - XY_a
+    M2 = wa * M2_a + wb * M2_b + wa * wb * (d.real * d.real + d.imag * d.imag)
+    return n, XX, YY, XY, M2
+
+
+# ---------- FRACTIONAL DELAY (Lagrange taps computed on the fly) ----------
+# Same coefficients as `speckit.dsp.lagrange_taps`, evaluated for one shift at a
+# time so that time-varying shifts never materialize an (N, 2*halfp) tap matrix.
+
+@njit(cache=True, inline="always")
+def _lagrange_taps_into(d, halfp, taps):
+    if halfp == 1:
+        taps[0] = 1.0 - d; taps[1] = d
+        return
+    factor = d * (1.0 - d)
+    for j in range(1, halfp):
+        factor *= -(1.0 - j / halfp) / (1.0 + j / halfp)
+        taps[halfp - 1 - j] = factor / (j + d)
+        taps[halfp + j] = factor / (j + 1.0 - d)
+    taps[halfp - 1] = 1.0 - d; taps[halfp] = d
+    common = (1.0 + d) * (1.0 - d / halfp)
+    for j in range(2, halfp):
+        common *= 1.0 - (d / j) ** 2
+    for k in range(2 * halfp):
+        taps[k] *= common
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _timeshift_varying(data, shifts, halfp, block):
+    # out[i] = sum_k taps_i[k] * data[idx_i - (halfp-1) + k], zero outside the data,
+    # with idx_i = clip(i + floor(shifts[i]), -(halfp+1), N + halfp - 1)
+    N = data.size
+    ntaps = 2 * halfp
+    out = np.empty(N, np.float64)
+    nblocks = (N + block - 1) // block
+    for b in prange(nblocks):
+        taps = np.empty(ntaps, np.float64)
+        for i in range(b * block, min(N, (b + 1) * block)):
+            s_int = np.floor(shifts[i])
+            _lagrange_taps_into(shifts[i] - s_int, halfp, taps)
+            idx = i + int(s_int)
+            if idx < -(halfp + 1):
+                idx = -(halfp + 1)
+            elif idx > N + halfp - 1:
+                idx = N + halfp - 1
+            start = idx - (halfp - 1)
+            acc = 0.0
+            if start >= 0 and start + ntaps <= N:
+                for k in range(ntaps):
+                    acc += taps[k] * data[start + k]
+            else:
+                for k in range(ntaps):
+                    j = start + k
+                    if 0 <= j < N:
+                        acc += taps[k] * data[j]
+            out[i] = acc
+    return out
@@ -0,0 +1,272 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2025, Miguel Dovale
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# This software may be subject to U.S. export control laws. By accepting this
+# software, the user agrees to comply with all applicable U.S. export laws and
+# regulations. User has the responsibility to obtain export licenses, or other
+# export authority as may be required before exporting such information to
+# foreign countries or providing access to foreign persons.
+#
+"""Pluggable execution of spectral analyses on remote or out-of-process workers.
+
+`SpectrumAnalyzer.compute(executor=...)` accepts any `SpectrumExecutor`. The
+analyzer partitions the plan's frequency bins into self-contained, picklable
+task dictionaries and hands them to the executor's `run` method. Each task
+names the file-backed input data (a `np.memmap` or `.npy` file visible to
+every worker) instead of carrying it, so only the plan entries of its bins
+travel over the wire. A worker evaluates a task with `run_task`, and the
+per-bin results are scattered back into a single `SpectrumResult`.
+
+To target a cluster, subclass `SpectrumExecutor` and implement `run`, for
+example by submitting `run_task` through a scheduler client. A
+`LocalSubprocessExecutor` is provided that runs every task in a fresh Python
+subprocess, exercising the same serialization path without a cluster.
+"""
+import os
+import sys
+import pickle
+import shutil
+import tempfile
+import weakref
+import subprocess
+import logging
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class SpectrumExecutor:
+    """Protocol for executors that evaluate spectral analysis tasks.
+
+    Attributes
+    ----------
+    n_workers : int
+        Number of tasks that can run concurrently. The analyzer creates a
+        few tasks per worker to balance the load.
+    scratch_dir : str or None
+        Directory visible to all workers, used to spill input data that is
+        not already file-backed. If None, such data is rejected.
+    """
+
+    n_workers: int = 1
+    scratch_dir: Optional[str] = None
+
+    def run(self, tasks: Sequence[Dict[str, Any]]) -> List[Any]:
+        """Evaluates every task with `run_task` and returns the results in order."""
+        raise NotImplementedError
+
+
+class LocalSubprocessExecutor(SpectrumExecutor):
+    """Runs each task in a separate Python subprocess on this machine.
+
+    Tasks and results are exchanged as pickle files in a scratch directory,
+    mirroring how a cluster executor ships them to remote workers.
+
+    Parameters
+    ----------
+    n_workers : int, optional
+        Maximum number of concurrent subprocesses. Defaults to the number
+        of CPUs.
+    scratch_dir : str, optional
+        Directory for task files and spilled input data. Defaults to a new
+        temporary directory, owned by the executor and removed by `close`
+        (or when the executor is garbage collected).
+
+    Examples
+    --------
+    >>> with LocalSubprocessExecutor(n_workers=4) as executor:
+    ...     result = analyzer.compute(executor=executor)
+    """
+
+    def __init__(self, n_workers: Optional[int] = None, scratch_dir: Optional[str] = None):
+        self.n_workers = int(n_workers or os.cpu_count() or 1)
+        self._owns_scratch_dir = scratch_dir is None
+        if self._owns_scratch_dir:
+            scratch_dir = tempfile.mkdtemp(prefix="speckit_")
+            self._finalizer = weakref.finalize(
+                self, shutil.rmtree, scratch_dir, ignore_errors=True
+            )
+        self.scratch_dir = scratch_dir
+
+    def close(self) -> None:
+        """Removes the scratch directory if the executor created it."""
+        if self._owns_scratch_dir:
+            self._finalizer()
+
+    def __enter__(self) -> "LocalSubprocessExecutor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def run(self, tasks: Sequence[Dict[str, Any]]) -> List[Any]:
+        job_dir = tempfile.mkdtemp(dir=self.scratch_dir)
+        try:
+            paths = []
+            for k, task in enumerate(tasks):
+                task_path = os.path.join(job_dir, f"task_{k}.pkl")
+                with open(task_path, "wb") as fh:
+                    pickle.dump(task, fh, protocol=pickle.HIGHEST_PROTOCOL)
+                paths.append((task_path, os.path.join(job_dir, f"result_{k}.pkl")))
+
+            running: List[subprocess.Popen] = []
+            for task_path, result_path in paths:
+                if len(running) >= self.n_workers:
+                    _wait(running.pop(0))
+                running.append(
+                    subprocess.Popen(
+                        [sys.executable, "-m", "speckit.distributed", task_path, result_path]
+                    )
+                )
+            for proc in running:
+                _wait(proc)
+
+            results = []
+            for _, result_path in paths:
+                with open(result_path, "rb") as fh:
+                    results.append(pickle.load(fh))
+            return results
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True)
+
+
+def _wait(proc: subprocess.Popen) -> None:
+    if proc.wait() != 0:
+        raise RuntimeError(f"Worker {proc.args} exited with code {proc.returncode}")
+
+
+def _memmap_file_offset(data: np.memmap) -> Optional[int]:
+    """Byte offset in its file of the first element of a memmap (or a view).
+
+    Views of a memmap inherit the `offset` attribute of the array they were
+    taken from, so the offset is recovered from the distance between the
+    view's data pointer and that of the array created by `np.memmap`, which
+    starts at its `offset` in the file. Returns None if that array cannot be
+    found.
+    """
+    root = data
+    while isinstance(root.base, np.ndarray):
+        root = root.base
+    if not isinstance(root, np.memmap) or root.filename != data.filename:
+        return None
+    return int(root.offset) + (data.ctypes.data - root.ctypes.data)
+
+
+def data_source(data: np.ndarray, scratch_dir: Optional[str]) -> Dict[str, Any]:
+    """Describes file-backed input data so that workers can map it.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The analyzer's input. If it is a C- or F-contiguous `np.memmap`
+        (e.g., from `np.load(path, mmap_mode="r")`, or a contiguous slice of
+        one), its file is referenced directly. Otherwise it is saved as a
+        `.npy` file in `scratch_dir`.
+    scratch_dir : str or None
+        Directory shared with the workers.
+
+    Returns
+    -------
+    dict
+        A picklable description accepted by `open_source`. The key
+        `"spilled"` is True if a file was written and must be removed.
+    """
+    if isinstance(data, np.memmap) and data.filename is not None:
+        contiguous = data.flags.c_contiguous or data.flags.f_contiguous
+        offset = _memmap_file_offset(data) if contiguous else None
+        if offset is not None:
+            return {
+                "path": os.fspath(data.filename),
+                "offset": offset,
+                "dtype": data.dtype.str,
+                "shape": tuple(data.shape),
+                "order": "F" if (data.flags.f_contiguous and not data.flags.c_contiguous) else "C",
+                "spilled": False,
+            }
+    if scratch_dir is None:
+        raise ValueError(
+            "Input data is not file-backed or not contiguous in its file; pass a "
+            "contiguous np.memmap or give the executor a `scratch_dir`."
+        )
+    fd, path = tempfile.mkstemp(suffix=".npy", dir=scratch_dir)
+    with os.fdopen(fd, "wb") as fh:
+        np.save(fh, np.asarray(data))
+    mm = np.load(path, mmap_mode="r")
+    source = data_source(mm, None)
+    source["spilled"] = True
+    return source
+
+
+def open_source(source: Dict[str, Any]) -> np.memmap:
+    """Maps the data described by `data_source` read-only."""
+    return np.memmap(
+        source["path"],
+        dtype=np.dtype(source["dtype"]),
+        mode="r",
+        offset=source["offset"],
+        shape=source["shape"],
+        order=source["order"],
+    )
+
+
+def run_task(task: Dict[str, Any]) -> List[Any]:
+    """Evaluates one task on a worker and returns its per-bin result block."""
+    from speckit.analysis import _lpsd_bins
+    from speckit.parallel import num_threads
+
+    data = open_source(task["source"])
+    if task["iscsd"]:
+        # Axis of the mapped array that indexes the two channels
+        if task["channel_axis"] == 0:
+            x1, x2 = data[0], data[1]
+        else:
+            x1, x2 = data[:, 0], data[:, 1]
+        x1 = np.ascontiguousarray(x1, dtype=np.float64)
+        x2 = np.ascontiguousarray(x2, dtype=np.float64)
+    else:
+        x1 = np.ascontiguousarray(data, dtype=np.float64)
+        x2 = None
+    with num_threads(task["n_threads"]):
+        return _lpsd_bins(x1, x2, task["plan_slice"], *task["win_spec"])
+
+
+def _main(argv: List[str]) -> int:
+    task_path, result_path = argv
+    with open(task_path, "rb") as fh:
+        task = pickle.load(fh)
+    result = run_task(task)
+    with open(result_path, "wb") as fh:
+        pickle.dump(result, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main(sys.argv[1:]))
@@ -33,24 +33,31 @@
 # export authority as may be required before exporting such information to
 # foreign countries or providing access to foreign persons.
 #
+from __future__ import annotations
+
 import os
+import io
+import json
+import hashlib
+import functools
+import itertools
+import contextlib
+import threading
 import numpy as np
-import pandas as pd
 import zipfile
 import tarfile
 import gzip
-from py7zr import SevenZipFile
-from copy import deepcopy
-from scipy.integrate import cumulative_trapezoid
-from scipy.optimize import curve_fit, minimize
-from scipy.signal import welch
-from typing import List, Optional, Callable
-import warnings
+from typing import TYPE_CHECKING, Dict, List, Optional, Callable, Tuple
 
 import logging
 
+from speckit.core import _HAS_NUMBA, _timeshift_varying
+
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 def frequency2phase(f, fs):
     """
@@ -146,6 +153,8 @@ def integral_rms(fourier_freq, asd, pass_band=None):
         asd: amplitude spectral density from which RMS is computed
         pass_band: [0] = min, [1] = max
     """
+    from scipy.integrate import cumulative_trapezoid
+
     if pass_band is None:
         pass_band = [-np.inf, np.inf]
 
@@ -158,6 +167,79 @@ def integral_rms(fourier_freq, asd, pass_band=None):
     return np.sqrt(integral_rms2[-1])
 
 
+def cumulative_power(fourier_freq, psd):
+    """Trapezoidal running integral of a PSD (prefix sums of PSD x bin width).
+
+    Parameters
+    ----------
+    fourier_freq : array-like
+        Fourier frequencies (Hz), increasing.
+    psd : array-like
+        Power spectral density. May be a stack of spectra on the same
+        frequency grid, with frequency along the last axis.
+
+    Returns
+    -------
+    np.ndarray
+        Array with the shape of `psd`; element `k` is the integral from the
+        first frequency to `fourier_freq[k]` (the first element is zero).
+    """
+    fourier_freq = np.asarray(fourier_freq, dtype=np.float64)
+    psd = np.asarray(psd)
+    out = np.zeros(psd.shape, dtype=np.result_type(psd, np.float64))
+    if psd.shape[-1] > 1:
+        areas = 0.5 * (psd[..., 1:] + psd[..., :-1]) * np.diff(fourier_freq)
+        np.cumsum(areas, axis=-1, out=out[..., 1:])
+    return out
+
+
+def band_powers(fourier_freq, psd, bands, cumulative=None):
+    """Integrated power of a PSD in any number of frequency bands.
+
+    Each band is integrated over the frequencies it contains with the
+    trapezoidal rule, exactly like `integral_rms`, but the running integral
+    is computed once and every band is answered with two binary searches.
+
+    Parameters
+    ----------
+    fourier_freq : array-like
+        Fourier frequencies (Hz), increasing.
+    psd : array-like
+        Power spectral density, or a stack of spectra on the same frequency
+        grid with frequency along the last axis.
+    bands : array-like
+        A single band `(f_min, f_max)` or an array of shape `(n_bands, 2)`.
+        Use `-np.inf`/`np.inf` for open-ended bands.
+    cumulative : np.ndarray, optional
+        Precomputed `cumulative_power(fourier_freq, psd)`, to reuse across
+        calls. Defaults to None.
+
+    Returns
+    -------
+    np.ndarray
+        Band powers (mean-square values) of shape `psd.shape[:-1] + (n_bands,)`,
+        or `psd.shape[:-1]` for a single band. The band-limited RMS is the
+        square root. Bands containing fewer than two frequencies have zero power.
+    """
+    fourier_freq = np.asarray(fourier_freq, dtype=np.float64)
+    if cumulative is None:
+        cumulative = cumulative_power(fourier_freq, psd)
+    bands = np.asarray(bands, dtype=np.float64)
+    single = bands.ndim == 1
+    bands = np.atleast_2d(bands)
+    if bands.shape[-1] != 2:
+        raise ValueError("Bands must be given as (f_min, f_max) pairs.")
+
+    nf = len(fourier_freq)
+    lo = np.searchsorted(fourier_freq, bands[:, 0], side="left")
+    hi = np.searchsorted(fourier_freq, bands[:, 1], side="right") - 1
+    valid = hi > lo
+    lo = np.clip(lo, 0, nf - 1)
+    hi = np.clip(hi, 0, nf - 1)
+    powers = np.where(valid, cumulative[..., hi] - cumulative[..., lo], 0.0)
+    return powers[..., 0] if single else powers
+
+
 def peak_finder(frequency, measurement, cnr=10, edge=True, freq_band=None, rtol=1e-2):
     """
     Detects peaks in a measurement array based on CNR(dB) threshold.
@@ -189,6 +271,7 @@ def peak_finder(frequency, measurement, cnr=10, edge=True, freq_band=None, rtol=
     The function first applies an optional frequency band filter and then manually detects peaks by identifying points that are higher than their immediate neighbors.
     Peaks that do not meet the specified carrier-to-noise density ratio are discarded. The function returns the frequencies and measurements of the detected peaks.
     """
+    from scipy.optimize import curve_fit
 
     def noise_model(x, a, b, alpha):
         return a + b * x**alpha
@@ -262,6 +345,8 @@ def optimal_linear_combination(
     method="TNC",
     tol=1e-9,
     *args,
+    fast=True,
+    estimator="welch",
     **kwargs,
 ):
     """
@@ -270,6 +355,16 @@ def optimal_linear_combination(
 
     Target: `RMS[ output + Sum [coefficient_i * timeshift(input_i, shift_i) ] ]`
 
+    With `fast=True` (default) and no timeshifts, the signals are reduced
+    once, before the minimization, to a quadratic form in the coefficients:
+    the covariance matrix (time domain) or the integrated cross-spectral
+    matrix (frequency domain). The objective and its analytic gradient then
+    cost O(n_inputs^2) per evaluation and equal the direct objective.
+    With timeshifts, the direct objective is always used: the edge
+    truncation it applies after shifting has no exact frequency-domain
+    equivalent, and circular phase-ramp approximations bias the fit on
+    non-periodic data.
+
     Parameters
     ----------
         df (DataFrame): Data from signals.
@@ -280,11 +375,24 @@ def optimal_linear_combination(
         domain (str, optional): Whether to compute RMS in the time domain or in the frequency domain
         method (str, optional): The minimizer method.
         tol (float, optional): The minimizer tolerance parameter.
+        fast (bool, optional): Whether to use the precomputed objective with analytic gradients
+            when `timeshifts` is False. Default is True. Median-averaged Welch estimates always use
+            the direct objective.
+        estimator (str, optional): Spectral estimator for `domain="frequency"`, either
+            'welch' (`scipy.signal.welch`/`csd`) or 'lpsd' (speckit's own estimator).
+            Default is 'welch'.
+        *args, **kwargs: Passed to the spectral estimator. For 'lpsd', `fs` defaults to 1.
 
     Returns:
         OptimizeResult: The optimization result object.
         np.ndarray: The output with optimal combination of inputs subtracted
     """
+    from scipy.optimize import minimize
+
+    if domain not in ("time", "frequency"):
+        raise ValueError("The `domain` parameter must be set to 'time' or 'frequency'")
+    if estimator not in ("welch", "lpsd"):
+        raise ValueError("The `estimator` parameter must be set to 'welch' or 'lpsd'")
 
     def print_optimization_result(res):
         logger.info("Optimization Results:")
@@ -296,35 +404,61 @@ def optimal_linear_combination(
         for idx, val in enumerate(res.x, start=1):
             logger.info(f"Variable {idx}: {val}")
 
-    def fun(x):
-        y = np.array(df[output] - np.mean(df[output]))
+    # Mean-removed signals, extracted once for all objective evaluations
+    y0 = np.array(df[output] - np.mean(df[output]))
+    signals = [np.array(df[input] - np.mean(df[input])) for input in inputs]
+    if timeshifts:
+        shifters = [TimeShifter(Si) for Si in signals]
+        shifted = np.empty(y0.size, dtype=np.float64)
+
+    def combine(x):
+        y = y0.copy()
 
         if timeshifts:
-            for i, input in enumerate(df[inputs]):
-                Si = np.array(df[input] - np.mean(df[input]))
-                y += x[len(inputs) + i] * timeshift(Si, x[i])
+            for i, shifter in enumerate(shifters):
+                y += x[len(inputs) + i] * shifter(x[i], out=shifted)
             max_delay = np.max(x[: len(inputs)])
             y = truncation(y, n_trunc=int(2 * max_delay))
         else:
-            for i, input in enumerate(df[inputs]):
-                Si = np.array(df[input] - np.mean(df[input]))
+            for i, Si in enumerate(signals):
                 y += x[i] * Si
 
+        return y
+
+    if domain == "frequency" and estimator == "lpsd":
+        kwargs.setdefault("fs", 1.0)
+
+    def fun(x):
+        y = combine(x)
+
         if gradient:
             y = np.gradient(y)
 
         if domain == "time":
             rms_value = np.sqrt(np.mean(np.square(y - np.mean(y))))
-        elif domain == "frequency":
-            f, Sxx = welch(y, scaling="density", *args, **kwargs)
-            rms_value = np.sqrt(np.trapezoid(Sxx, f))
         else:
-            raise ValueError(
-                "The `domain` parameter must be set to 'time' or 'frequency'"
-            )
+            f, Sxx = _olc_psd(y, estimator, args, kwargs)
+            rms_value = np.sqrt(np.trapezoid(Sxx, f))
 
         return rms_value
 
+    if fast and not timeshifts and not (
+        domain == "frequency"
+        and estimator == "welch"
+        and kwargs.get("average", "mean") != "mean"
+    ):
+        # Rows: output first, then the inputs, in the order of the variables
+        Z = np.vstack([y0] + signals)
+        if gradient:
+            Z = np.gradient(Z, axis=1)
+        if domain == "time":
+            Z -= np.mean(Z, axis=1, keepdims=True)
+        objective = _olc_objective(Z, domain, estimator, args, kwargs)
+        jac = True
+    else:
+        objective = fun
+        jac = None
+
     if timeshifts:
         x_initial = np.zeros(len(inputs) * 2)
     else:
@@ -332,26 +466,183 @@ def optimal_linear_combination(
 
     logger.info(f"Solving {len(x_initial)}-dimensional problem...")
 
-    res = minimize(fun, x_initial, method=method, tol=tol)
+    res = minimize(objective, x_initial, method=method, jac=jac, tol=tol)
 
     print_optimization_result(res)
 
-    if timeshifts:
-        y = np.array(df[output] - np.mean(df[output]))
-        for i, input in enumerate(df[inputs]):
-            Si = np.array(df[input] - np.mean(df[input]))
-            y += res.x[len(inputs) + i] * timeshift(Si, res.x[i])
-        max_delay = np.max(res.x[: len(inputs)])
-        y = truncation(y, int(2 * max_delay))
-    else:
-        y = np.array(df[output] - np.mean(df[output]))
-        for i, input in enumerate(df[inputs]):
-            Si = np.array(df[input] - np.mean(df[input]))
-            y += res.x[i] * Si
+    y = combine(res.x)
 
     return res, y
 
 
+def _olc_psd(y, estimator, args, kwargs):
+    """One-sided PSD of `y` with the estimator used by `optimal_linear_combination`."""
+    if estimator == "lpsd":
+        from speckit.analysis import compute_spectrum
+
+        res = compute_spectrum(y, **kwargs)
+        return res.f, res.Gxx
+
+    from scipy.signal import welch
+
+    return welch(y, scaling="density", *args, **kwargs)
+
+
+def _olc_csd_matrix(Z, estimator, args, kwargs):
+    """
+    Cross-spectral matrix of the rows of `Z` for `optimal_linear_combination`.
+
+    Returns the frequencies, the sampling frequency, and ``P`` of shape
+    (nf, n, n) such that the PSD of ``sum_a w_a Z[a]`` is ``w^H P w``.
+    """
+    if estimator == "lpsd":
+        from speckit.analysis import compute_csd_matrix
+
+        f, G = compute_csd_matrix(Z, **kwargs)
+        # speckit's cross-spectra are conjugated with respect to scipy's
+        return f, kwargs["fs"], np.conj(G)
+
+    from scipy.signal import csd
+
+    fs = args[0] if args else kwargs.get("fs", 1.0)
+    n = Z.shape[0]
+    P = None
+    for a in range(n):
+        for b in range(a, n):
+            f, Pab = csd(Z[a], Z[b], *args, scaling="density", **kwargs)
+            if P is None:
+                P = np.empty((f.size, n, n), dtype=np.complex128)
+            P[:, a, b] = Pab
+            P[:, b, a] = np.conj(Pab)
+    return f, fs, P
+
+
+def _olc_objective(Z, domain, estimator, args, kwargs):
+    """
+    Builds the fast objective of `optimal_linear_combination` without timeshifts.
+
+    Returns a function of the coefficients ``c`` that returns the RMS of
+    ``Z[0] + sum_i c_i Z[i + 1]`` and its gradient.
+    """
+    if domain == "time":
+        C = Z @ Z.T / Z.shape[1]
+    else:
+        f, _, P = _olc_csd_matrix(Z, estimator, args, kwargs)
+        C = np.trapezoid(P.real, f, axis=0)
+
+    def objective(x):
+        w = np.concatenate(([1.0], x))
+        Cw = C @ w
+        ms = w @ Cw
+        # d sqrt(ms) = d ms / (2 sqrt(ms)), guarding the exact-zero residual
+        rms = np.sqrt(max(ms, 0.0))
+        grad = Cw[1:] / rms if rms > 0 else np.zeros_like(x)
+        return rms, grad
+
+    return objective
+
+
+class TimeShifter:
+    """Applies many constant time shifts to the same signal.
+
+    Equivalent to `timeshift(data, shift, order)` for a scalar `shift`, but
+    the edge-padded signal is built once and reused, the Lagrange taps are
+    cached per fractional shift (see `_constant_taps`), and the result can be
+    written into a preallocated buffer. Useful when a minimizer evaluates the
+    same inputs at hundreds of different delays.
+
+    Parameters
+    ----------
+    data : np.ndarray
+        The 1D input signal.
+    order : int, optional
+        The order of the Lagrange interpolator (odd). Defaults to 31.
+    max_shift : float, optional
+        Largest expected absolute shift, in samples, used to size the padding
+        up front. Larger shifts grow the padding on demand. Defaults to 0.
+    resolution : float, optional
+        If given, fractional shifts are rounded to multiples of this value
+        (in samples) so that nearby shifts share cached taps. Defaults to
+        None (exact shifts).
+
+    Examples
+    --------
+    >>> shifter = TimeShifter(x, order=31)
+    >>> buf = np.empty_like(x)
+    >>> y = shifter(2.37, out=buf)
+    """
+
+    def __init__(self, data, order=31, max_shift=0.0, resolution=None):
+        if order % 2 == 0:
+            raise ValueError(f"`order` must be an odd integer (got {order})")
+        self.data = np.ascontiguousarray(data, dtype=np.float64)
+        if self.data.ndim != 1 or self.data.size < 2:
+            raise ValueError("`data` must be a 1D array with at least two samples")
+        self.order = order
+        self.halfp = (order + 1) // 2
+        self.resolution = resolution
+        self._pad = 0
+        self._padded = None
+        self._ensure_padding(int(np.ceil(abs(max_shift))) + 1)
+
+    def _ensure_padding(self, shift_int):
+        """Edge-pads the data enough for shifts up to `shift_int` samples."""
+        size = self.data.size
+        need = min(abs(shift_int) + self.halfp + 1, size + 2 * self.halfp)
+        if need > self._pad:
+            self._pad = max(need, 2 * self._pad)
+            self._padded = np.pad(self.data, self._pad, mode="edge")
+
+    def __call__(self, shift, out=None):
+        """Returns the data shifted by `shift` samples.
+
+        Parameters
+        ----------
+        shift : float
+            The time shift in samples (see `timeshift` for the sign).
+        out : np.ndarray, optional
+            Buffer of the same size as the data for the result. A contiguous
+            float64 buffer is filled without any temporary array.
+
+        Returns
+        -------
+        np.ndarray
+            The time-shifted signal (`out`, if given).
+        """
+        size = self.data.size
+        if out is None:
+            out = np.empty(size, dtype=np.float64)
+        shift = float(shift)
+        if shift == 0:
+            out[:] = self.data
+            return out
+
+        shift_int = int(np.floor(shift))
+        shift_frac = shift - shift_int
+        if self.resolution:
+            shift_frac = round(shift_frac / self.resolution) * self.resolution
+            if shift_frac >= 1.0:
+                shift_int, shift_frac = shift_int + 1, 0.0
+
+        halfp = self.halfp
+        # Shifts entirely past the data edges (same as `timeshift`)
+        if shift_int + halfp + size - 1 < 0:
+            out[:] = self.data[0]
+            return out
+        if shift_int - (halfp - 1) > size - 1:
+            out[:] = self.data[-1]
+            return out
+
+        self._ensure_padding(shift_int)
+        start = self._pad + shift_int - (halfp - 1)
+        window = self._padded[start : start + size + 2 * halfp - 1]
+        # Correlation as a product with a strided view of the window, written
+        # straight into `out` without a temporary result
+        windows = np.lib.stride_tricks.sliding_window_view(window, 2 * halfp)
+        np.matmul(windows, _constant_taps(shift_frac, halfp), out=out)
+        return out
+
+
 def df_timeshift(
     df, fs, seconds, columns=None, truncate=None, inplace=False, suffix="_shifted"
 ):
@@ -431,6 +722,235 @@ def df_detrend(df, columns=None, order=1, inplace=False, suffix="_detrended"):
     return df_detrended
 
 
+_HEADER_SYMBOLS = (b"#", b"%", b"!", b"@", b";", b"&", b"*", b"/")
+_TABLE_CACHE_VERSION = 1
+
+
+@contextlib.contextmanager
+def _open_timeseries(file):
+    """Opens a (possibly archived or compressed) text file as a binary stream."""
+    if zipfile.is_zipfile(file):  # Check if it's a zip file
+        with zipfile.ZipFile(file, "r") as zip_ref:
+            first_file_name = zip_ref.namelist()[0]
+            with zip_ref.open(first_file_name, "r") as target_file:
+                yield target_file
+
+    elif tarfile.is_tarfile(file):  # Check if it's a tar file
+        with tarfile.open(file, "r") as tar_ref:
+            first_member = tar_ref.getmembers()[0]
+            with tar_ref.extractfile(first_member) as target_file:
+                yield target_file
+
+    elif file.endswith(".gz"):  # Check if it's a gzip file
+        with gzip.open(file, "rb") as target_file:
+            yield target_file
+
+    elif file.endswith(".7z"):  # Check if it's a 7z file
+        from py7zr import SevenZipFile
+
+        with SevenZipFile(file, "r") as seven_zip_ref:
+            first_file_name = seven_zip_ref.getnames()[0]
+            with seven_zip_ref.open(first_file_name) as target_file:
+                yield target_file
+
+    else:  # Treat it as a regular text file
+        with open(file, "rb") as target_file:
+            yield target_file
+
+
+def _skip_header_rows(stream):
+    """
+    Counts the leading comment rows of `stream` and skips past them.
+
+    A row is a comment if it starts with one of `_HEADER_SYMBOLS`. Returns
+    the count and a stream positioned at the first data row: `stream` itself
+    if it can seek, otherwise a wrapper that replays the row already read.
+    """
+    count = 0
+    start = stream.tell() if stream.seekable() else None
+    while True:
+        line = stream.readline()
+        if not line.startswith(_HEADER_SYMBOLS):
+            break
+        count += 1
+        if start is not None:
+            start = stream.tell()
+    if start is not None:
+        stream.seek(start)
+        return count, stream
+    # Hand the first data row back to the parser
+    return count, io.BufferedReader(_PrefixedStream(line, stream))
+
+
+class _PrefixedStream(io.RawIOBase):
+    """Raw stream that yields `prefix` before the remainder of `stream`."""
+
+    def __init__(self, prefix: bytes, stream):
+        self._prefix = memoryview(prefix)
+        self._stream = stream
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if len(self._prefix):
+            n = min(len(b), len(self._prefix))
+            b[:n] = self._prefix[:n]
+            self._prefix = self._prefix[n:]
+            return n
+        data = self._stream.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+def _skip_lines(stream, n: int, chunk_size: int = 1 << 20) -> bytes:
+    """Discards `n` lines of `stream`; returns the bytes read past the last one."""
+    while n > 0:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        newlines = np.flatnonzero(np.frombuffer(chunk, dtype=np.uint8) == ord("\n"))
+        if newlines.size >= n:
+            return chunk[newlines[n - 1] + 1 :]
+        n -= newlines.size
+    return b""
+
+
+def _table_cache_path(file, cache_dir, options) -> str:
+    """Cache file of a parsed time-series, keyed by path, size, mtime and options."""
+    st = os.stat(file)
+    key = json.dumps(
+        [os.path.abspath(file), st.st_size, st.st_mtime_ns, options, _TABLE_CACHE_VERSION]
+    )
+    digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(file)}.{digest}.npz")
+
+
+def _read_timeseries_file(
+    file: str,
+    delimiter: str,
+    names: Optional[List[str]],
+    cache_dir: Optional[str],
+    first_row: int = 0,
+    nrows: Optional[int] = None,
+) -> Tuple[Optional[int], pd.DataFrame]:
+    """
+    Parses one input file of `multi_file_timeseries_loader`.
+
+    The file is opened once: header rows are counted on the same buffered
+    stream that is then handed to the parser. With a `cache_dir`, numeric
+    tables are stored there after parsing and memory-mapped on later calls.
+
+    Only the data rows ``first_row`` to ``first_row + nrows`` are parsed.
+    Skipped rows are only scanned for line breaks, and decompression stops
+    once the last requested row is read. Range reads are served from the
+    cache when it exists. On a cache miss they return after parsing just
+    their rows, and the whole file is parsed into the cache by a background
+    thread (see `_fill_table_cache`), so that later reads of any range are
+    served from the cache.
+
+    Returns
+    -------
+    header_rows : int or None
+        Number of comment rows skipped, or None if the table came from the cache.
+    df : pd.DataFrame
+        The parsed table.
+    """
+    import pandas as pd
+    from speckit.io import load_table, save_table
+
+    stop = None if nrows is None else first_row + nrows
+    cache_path = None
+    if cache_dir is not None:
+        cache_path = _table_cache_path(file, cache_dir, [delimiter, names])
+        if os.path.exists(cache_path):
+            try:
+                return None, load_table(
+                    cache_path, mmap=True, rows=slice(first_row, stop)
+                )
+            except Exception as e:
+                logger.debug(f"Ignoring unreadable cache {cache_path}: {e}")
+
+    partial = first_row > 0 or nrows is not None
+    if partial and cache_path is not None:
+        _fill_table_cache(file, delimiter, names, cache_dir, cache_path)
+
+    if names is not None:
+        options = dict(delimiter=delimiter, names=names)
+    else:
+        options = dict(delimiter=delimiter, header=0)
+
+    def parse(engine):
+        with _open_timeseries(file) as stream:
+            header_rows, stream = _skip_header_rows(stream)
+            if first_row > 0:
+                # Keep the column names row, drop data rows up to `first_row`
+                head = stream.readline() if names is None else b""
+                rest = _skip_lines(stream, first_row)
+                stream = io.BufferedReader(_PrefixedStream(head + rest, stream))
+            df = pd.read_csv(stream, engine=engine, nrows=nrows, **options)
+        return header_rows, df
+
+    try:
+        header_rows, df = parse("c")
+    except (pd.errors.ParserError, UnicodeDecodeError) as e:
+        logger.warning(
+            f"Reading {file} with Python engine due to {type(e).__name__}: {e}"
+        )
+        header_rows, df = parse("python")
+
+    if cache_path is not None and not partial:
+        tmp = f"{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            save_table(df, tmp)
+            os.replace(tmp, cache_path)
+        except (OSError, TypeError) as e:
+            logger.debug(f"Not caching '{file}': {e}")
+            with contextlib.suppress(OSError):
+                os.remove(tmp)
+
+    return header_rows, df
+
+
+# Background threads filling the table cache, by cache file
+_cache_fills: Dict[str, threading.Thread] = {}
+_cache_fills_lock = threading.Lock()
+
+
+def _fill_table_cache(file, delimiter, names, cache_dir, cache_path) -> None:
+    """Parses a whole file into the table cache in a background thread.
+
+    At most one thread fills a given cache file. The threads are daemonic, so
+    they never delay interpreter exit; an interrupted fill leaves no cache
+    entry because the table is written to a temporary file first.
+    """
+
+    def fill():
+        try:
+            _read_timeseries_file(file, delimiter, names, cache_dir)
+        except Exception as e:
+            logger.debug(f"Not caching '{file}': {e}")
+        finally:
+            with _cache_fills_lock:
+                _cache_fills.pop(cache_path, None)
+
+    with _cache_fills_lock:
+        if cache_path in _cache_fills:
+            return
+        thread = threading.Thread(target=fill, name="speckit-table-cache", daemon=True)
+        _cache_fills[cache_path] = thread
+    thread.start()
+
+
+def _wait_for_cache_fills() -> None:
+    """Blocks until all background cache fills have finished."""
+    with _cache_fills_lock:
+        threads = list(_cache_fills.values())
+    for thread in threads:
+        thread.join()
+
+
 def multi_file_timeseries_loader(
     file_list: List[str],
     fs_list: List[float],
@@ -439,6 +959,9 @@ def multi_file_timeseries_loader(
     duration_hours: Optional[float] = None,
     timeshifts: Optional[List[float]] = None,
     delimiter_list: Optional[List[str]] = None,
+    n_workers: Optional[int] = None,
+    cache: bool = False,
+    cache_dir: Optional[str] = None,
 ) -> List[pd.DataFrame]:
     """
     Loads time-series data from multiple files, restricting the output to the maximum overlapping time window across the datasets.
@@ -467,6 +990,20 @@ def multi_file_timeseries_loader(
         A list of delimiters to be used for reading each file. If not provided, a space (' ') will be assumed as the
         delimiter for all files. The length of `delimiter_list` must match the length of `file_list` if provided.
 
+    n_workers : int, optional
+        Number of files parsed concurrently in a thread pool. Defaults to one per file, up to the number of CPUs.
+
+    cache : bool, optional
+        Whether to keep a binary copy of each parsed numeric file and memory-map it on later calls instead of
+        parsing the text again. Entries are keyed by file path, size, modification time and parse options, so
+        modified files are parsed again. A read of a time range that misses the cache parses only that range and
+        fills the cache from a background thread, so later reads are served from it. The cache holds a full
+        binary copy of every file loaded with it and is never pruned, so it is opt-in. Default is False.
+
+    cache_dir : str, optional
+        Directory of the binary cache. Defaults to ``$SPECKIT_CACHE_DIR/timeseries``, or
+        ``~/.cache/speckit/timeseries``.
+
     Returns
     -------
     List[pd.DataFrame]
@@ -487,61 +1024,10 @@ def multi_file_timeseries_loader(
       frequencies (`fs_list`).
     - The function supports files with different delimiters and skips any header rows that begin with comment symbols
       such as `#`, `%`, `!`, etc.
+    - Only the rows needed for `start_time`, `duration_hours` and `timeshifts` are parsed, plus a small margin
+      for the timeshift interpolation. With `duration_hours`, the overlap is computed on the rows read, which
+      always cover the requested duration when the files are long enough.
     """
-
-    def count_header_rows(file):
-        header_symbols = [
-            "#",
-            "%",
-            "!",
-            "@",
-            ";",
-            "&",
-            "*",
-            "/",
-        ]  # Add more symbols as needed
-        header_count = 0
-
-        def process_file(file_obj):
-            """Helper function to count headers in a file object."""
-            nonlocal header_count
-            for line in file_obj:
-                line = (
-                    line.decode("utf-8") if isinstance(line, bytes) else line
-                )  # Handle binary content
-                if any(line.startswith(symbol) for symbol in header_symbols):
-                    header_count += 1
-                else:
-                    break
-
-        if zipfile.is_zipfile(file):  # Check if it's a zip file
-            with zipfile.ZipFile(file, "r") as zip_ref:
-                first_file_name = zip_ref.namelist()[0]
-                with zip_ref.open(first_file_name, "r") as target_file:
-                    process_file(target_file)
-
-        elif tarfile.is_tarfile(file):  # Check if it's a tar file
-            with tarfile.open(file, "r") as tar_ref:
-                first_member = tar_ref.getmembers()[0]
-                with tar_ref.extractfile(first_member) as target_file:
-                    process_file(target_file)
-
-        elif file.endswith(".gz"):  # Check if it's a gzip file
-            with gzip.open(file, "rt") as target_file:  # 'rt' for reading text
-                process_file(target_file)
-
-        elif file.endswith(".7z"):  # Check if it's a 7z file
-            with SevenZipFile(file, "r") as seven_zip_ref:
-                first_file_name = seven_zip_ref.getnames()[0]
-                with seven_zip_ref.open(first_file_name) as target_file:
-                    process_file(target_file)
-
-        else:  # Treat it as a regular text file
-            with open(file, "r") as target_file:
-                process_file(target_file)
-
-        return header_count
-
     # Ensure matching lengths of input lists
     if len(file_list) != len(fs_list):
         raise ValueError(
@@ -565,62 +1051,84 @@ def multi_file_timeseries_loader(
 
     delimiter_list = delimiter_list or [" "] * len(file_list)
     timeshifts = timeshifts or [None] * len(file_list)
-    header_rows = []  # Stores the number of header rows for each file
     record_lengths = []  # Stores the duration for each file
     df_list = []  # Store the actual dataframes
     max_duration = None  # Will hold the maximum overlapping time duration
 
-    # File names and metadata discovery:
-    file_names = []
-    header_rows = []
-    for i, file in enumerate(file_list):
-        file_names.append(os.path.basename(file))
-        rows = count_header_rows(file)
-        header_rows.append(rows)
-        logger.info(f"File '{file_names[i]}' contains {header_rows[i]} header rows.")
+    if cache and cache_dir is None:
+        cache_dir = os.path.join(
+            os.environ.get(
+                "SPECKIT_CACHE_DIR",
+                os.path.join(os.path.expanduser("~"), ".cache", "speckit"),
+            ),
+            "timeseries",
+        )
+    if n_workers is None:
+        n_workers = min(len(file_list), os.cpu_count() or 1)
 
-    # Data ingestion:
-    logger.info("Loading data and calculating maximum time series overlap...")
-    for i, file in enumerate(file_list):
-        try:
-            if names_list is not None and names_list[i] is not None:
-                df = pd.read_csv(
-                    file,
-                    delimiter=delimiter_list[i],
-                    skiprows=header_rows[i],
-                    names=names_list[i],
-                    engine="c",
-                )
-            else:
-                df = pd.read_csv(
-                    file,
-                    delimiter=delimiter_list[i],
-                    skiprows=header_rows[i],
-                    header=0,
-                    engine="c",
-                )
-        except (pd.errors.ParserError, UnicodeDecodeError) as e:
-            logger.warning(
-                f"Reading {file} with Python engine due to {type(e).__name__}: {e}"
+    samples_shifted = [
+        timeshifts[i] * fs_list[i] if timeshifts[i] else 0.0
+        for i in range(len(file_list))
+    ]
+
+    # Large negative timeshifts move the start (see the readjustment below),
+    # which only depends on the requested start time and the shifts:
+    last_start_time = start_time
+    for i in range(len(file_list)):
+        if (samples_shifted[i] < 0.0) and (
+            abs(samples_shifted[i]) > int(last_start_time * fs_list[i])
+        ):
+            last_start_time = int(2 * abs(samples_shifted[i]))
+
+    # Rows of each file needed for the requested span, with a margin for the
+    # timeshift and its interpolation kernel. Without a duration, all rows
+    # from the start on are read.
+    first_rows, row_counts = [], []
+    for i in range(len(file_list)):
+        margin = int(np.ceil(abs(samples_shifted[i]))) + 32
+        first_rows.append(max(0, int(start_time * fs_list[i]) - margin))
+        if duration_hours is not None and duration_hours > 0.0:
+            last_row = (
+                int(last_start_time * fs_list[i])
+                + int(duration_hours * 3600.0 * fs_list[i])
+                + margin
             )
-            if names_list is not None and names_list[i] is not None:
-                df = pd.read_csv(
-                    file,
-                    delimiter=delimiter_list[i],
-                    skiprows=header_rows[i],
-                    names=names_list[i],
-                    engine="python",
-                )
-            else:
-                df = pd.read_csv(
-                    file,
-                    delimiter=delimiter_list[i],
-                    skiprows=header_rows[i],
-                    header=0,
-                    engine="python",
-                )
-        logger.info(f"Loaded data from file '{file_names[i]}' with length {len(df)}")
-        record_lengths.append(len(df) / fs_list[i])  # Data stream duration in seconds
+            row_counts.append(last_row - first_rows[i] + 1)
+        else:
+            row_counts.append(None)
+
+    # Data ingestion (header discovery and parsing share a single read):
+    logger.info("Loading data and calculating maximum time series overlap...")
+    file_names = [os.path.basename(file) for file in file_list]
+    jobs = [
+        (
+            file,
+            delimiter_list[i],
+            names_list[i] if names_list is not None else None,
+            cache_dir if cache else None,
+            first_rows[i],
+            row_counts[i],
+        )
+        for i, file in enumerate(file_list)
+    ]
+    if n_workers > 1 and len(jobs) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            loaded = list(pool.map(lambda job: _read_timeseries_file(*job), jobs))
+    else:
+        loaded = [_read_timeseries_file(*job) for job in jobs]
+
+    for i, (rows, df) in enumerate(loaded):
+        if rows is None:
+            logger.info(f"Loaded data from cache for file '{file_names[i]}'")
+        else:
+            logger.info(f"File '{file_names[i]}' contains {rows} header rows.")
+        logger.info(
+            f"Loaded rows {first_rows[i]} to {first_rows[i] + len(df)} from file '{file_names[i]}'"
+        )
+        # Data stream duration in seconds (up to the last row read)
+        record_lengths.append((first_rows[i] + len(df)) / fs_list[i])
         df_list.append(df)
 
     # Drop NaN columns and log warning:
@@ -643,9 +1151,8 @@ def multi_file_timeseries_loader(
     )
 
     # Apply optional timeshifts:
-    samples_shifted = []
     for i, df in enumerate(df_list):
-        if (timeshifts[i] is not None) and (timeshifts[i] != 0.0):
+        if samples_shifted[i] != 0.0:
             logger.info(
                 f"Applying {timeshifts[i]} seconds timeshift to the '{file_names[i]}' data stream"
             )
@@ -655,24 +1162,22 @@ def multi_file_timeseries_loader(
                 fs=fs_list[i],
                 columns=df.select_dtypes(include=["number"]).columns,
             )
-            samples_shifted.append(timeshifts[i] * fs_list[i])
-        else:
-            samples_shifted.append(0.0)
 
     # Readjust of start_time and max_duration in the case of large time shifts:
     if any(samples_shifted):
         for i, df in enumerate(df_list):
+            n_rows = first_rows[i] + len(df)
             if (samples_shifted[i] < 0.0) and (
                 abs(samples_shifted[i]) > int(start_time * fs_list[i])
             ):
                 start_time = int(2 * abs(samples_shifted[i]))
             if (samples_shifted[i] > 0.0) and (
                 abs(samples_shifted[i])
-                > len(df)
+                > n_rows
                 - (int(start_time * fs_list[i]) + int(max_duration * fs_list[i]))
             ):
                 max_duration = (
-                    len(df)
+                    n_rows
                     - int(start_time * fs_list[i])
                     - int(2 * abs(samples_shifted[i]))
                 ) / fs_list[i]
@@ -699,8 +1204,8 @@ def multi_file_timeseries_loader(
         )  # Calculate the end row based on max overlap
 
         new_df = df.iloc[
-            start_row : end_row + 1
-        ].copy()  # Slice the dataframe to get the relevant rows
+            start_row - first_rows[i] : end_row - first_rows[i] + 1
+        ].copy()  # Slice the rows read to get the relevant rows
         new_df.reset_index(drop=True, inplace=True)
         time_column_name = "time"
         if time_column_name in new_df:
@@ -717,6 +1222,57 @@ def multi_file_timeseries_loader(
     return final_df_list
 
 
+# Samples of the common grid per block of the Lagrange gather
+_RESAMPLE_BLOCK = 1 << 14
+
+
+def _antialias(values, fs_src, fs):
+    """Low-pass filters the columns of `values` before decimating to `fs`."""
+    from scipy.signal import firwin, oaconvolve
+
+    ratio = fs_src / fs
+    numtaps = 2 * int(np.ceil(8 * ratio)) + 1
+    # Cut off at 90% of the target Nyquist frequency
+    h = firwin(numtaps, 0.45 * fs, fs=fs_src, window=("kaiser", 8.0))
+    return oaconvolve(values, h[:, None], mode="same", axes=0)
+
+
+def _interp_columns(t, values, common_time, order=1):
+    """
+    Interpolates all columns of `values`, sampled at `t`, onto `common_time`.
+
+    The interpolation indices and weights are computed once for the time axis
+    and applied to all columns in a single gather. With ``order=1`` this is
+    `np.interp` applied to each column; higher (odd) orders use centered
+    Lagrange interpolation with `lagrange_taps`, with samples beyond the
+    ends of `t` replaced by the edge values.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(common_time), values.shape[1]).
+    """
+    n = t.size
+    if n == 1:
+        return np.repeat(values, common_time.size, axis=0)
+    idx = np.clip(np.searchsorted(t, common_time, side="right") - 1, 0, n - 2)
+    frac = np.clip((common_time - t[idx]) / (t[idx + 1] - t[idx]), 0.0, 1.0)
+
+    if order == 1:
+        lo = values[idx]
+        return lo + (values[idx + 1] - lo) * frac[:, None]
+
+    halfp = (order + 1) // 2
+    offsets = np.arange(1 - halfp, halfp + 1)
+    out = np.empty((common_time.size, values.shape[1]), dtype=np.float64)
+    for b0 in range(0, common_time.size, _RESAMPLE_BLOCK):
+        b1 = min(b0 + _RESAMPLE_BLOCK, common_time.size)
+        taps = lagrange_taps(frac[b0:b1], halfp)
+        neighbors = np.clip(idx[b0:b1, None] + offsets, 0, n - 1)
+        out[b0:b1] = np.einsum("kj,kjc->kc", taps, values[neighbors])
+    return out
+
+
 def resample_to_common_grid(
     df_list: List[pd.DataFrame],
     fs: float,
@@ -724,6 +1280,8 @@ def resample_to_common_grid(
     tolerance: Optional[float] = 0.1,
     preprocessors: Optional[List[Callable]] = None,
     suffixes: Optional[bool] = False,
+    order: int = 1,
+    antialias: bool = False,
 ) -> pd.DataFrame:
     """
     Resample one or multiple DataFrames to a common time grid by interpolating
@@ -754,6 +1312,15 @@ def resample_to_common_grid(
         to avoid name conflicts. If False, original column names are retained (name
         conflicts may arise if columns have identical names).
 
+    order : int, optional
+        Interpolation order (odd). 1 (default) interpolates linearly, higher orders use
+        centered Lagrange interpolation, which assumes nearly uniform sampling.
+
+    antialias : bool, optional
+        If True, data streams sampled faster than `fs` are low-pass filtered (Kaiser-window
+        FIR, cutoff at 90% of the new Nyquist frequency) before interpolation, so that
+        downsampling does not alias. Time columns are not filtered. Default is False.
+
     Returns
     -------
     pd.DataFrame
@@ -764,19 +1331,35 @@ def resample_to_common_grid(
     Raises
     ------
     ValueError
-        If `fs` is non-positive, or any DataFrame lacks the specified or default time column.
+        If `fs` is non-positive, `order` is not a positive odd integer, or any DataFrame
+        lacks the specified or default time column.
     """
-    warnings.filterwarnings("ignore", category=pd.errors.PerformanceWarning)
-    _df_list = deepcopy(df_list)
+    import pandas as pd
+
+    _df_list = list(df_list)
 
     if fs <= 0:
         raise ValueError("Sampling frequency `fs` must be positive.")
     if len(_df_list) == 0:
         raise ValueError("At least one DataFrame must be provided.")
+    if order < 1 or order % 2 == 0:
+        raise ValueError(f"`order` must be a positive odd integer (got {order})")
 
     t_col_list = t_col_list or ["time"] * len(_df_list)
     preprocessors = preprocessors or [None] * len(_df_list)
 
+    def resample(df, t_col, common_time, columns):
+        """Interpolates `columns` of `df` onto `common_time` in one pass."""
+        t = df[t_col].to_numpy(dtype=np.float64)
+        values = df[columns].to_numpy(dtype=np.float64, copy=antialias)
+        if antialias and len(t) > 1:
+            fs_src = 1.0 / np.median(np.diff(t))
+            data = [j for j, col in enumerate(columns) if col != t_col]
+            if fs_src > fs and data:
+                logger.info(f"Anti-aliasing {fs_src:.6g} Hz data before resampling")
+                values[:, data] = _antialias(values[:, data], fs_src, fs)
+        return _interp_columns(t, values, common_time, order)
+
     # If only one DataFrame is provided, handle separately
     if len(_df_list) == 1:
         df = _df_list[0]
@@ -798,20 +1381,17 @@ def resample_to_common_grid(
         # Apply preprocessing if specified
         if preprocessors[0] is not None:
             logger.info("Applying preprocessor to DataFrame")
-            df = preprocessors[0](df)
+            df = preprocessors[0](df.copy())
 
         # Interpolation
-        df_interp = pd.DataFrame({"common_time": common_time})
-        for col in df.columns:
-            if col == t_col:
-                continue  # Skip the time column
-            df_interp[col] = np.interp(common_time, df[t_col], df[col])
-
-        return df_interp
+        columns = [col for col in df.columns if col != t_col]
+        out = np.empty((len(common_time), len(columns) + 1), dtype=np.float64)
+        out[:, 0] = common_time
+        out[:, 1:] = resample(df, t_col, common_time, columns)
+        return pd.DataFrame(out, columns=["common_time"] + columns)
 
     # Handling multiple DataFrames (original logic)
     start_time, end_time = 0.0, float("inf")
-    df_interp_list = []
 
     # Determine the overlapping time range
     for i, (df, t) in enumerate(zip(_df_list, t_col_list)):
@@ -833,14 +1413,14 @@ def resample_to_common_grid(
 
     # Time grid consistency checks:
     for i, (df, t) in enumerate(zip(_df_list, t_col_list)):
-        monotonic = np.all(np.diff(df[t]) > 0)
+        intervals = np.diff(df[t])
+        monotonic = np.all(intervals > 0)
         if not monotonic:
             logger.warning(
                 f"Time array is not monotonically increasing in DataFrame #{i + 1}."
             )
 
         # Report intervals exceeding tolerance:
-        intervals = np.diff(df[t])
         mean_interval = np.mean(intervals)
         problematic_indices = np.where(np.abs(intervals - mean_interval) > tolerance)[0]
         problematic_intervals = [(idx, intervals[idx]) for idx in problematic_indices]
@@ -857,32 +1437,301 @@ def resample_to_common_grid(
         f"New common time grid created: {len(common_time)} samples from {start_time:.2f}s to {end_time:.2f}s"
     )
 
-    # Application of preprocessors:
+    # Application of preprocessors (on copies, the inputs are left untouched):
     for i, (df, proc) in enumerate(zip(_df_list, preprocessors)):
         if proc is not None:
             logger.info(f"Applying pre-processor {proc} to DataFrame #{i + 1}")
-            _df_list[i] = proc(df)
+            _df_list[i] = proc(df.copy())
             logger.info(f"Columns: {list(_df_list[i].columns)}")
 
-    # Downsampling and interpolation to the common grid:
-    for i, (df, t) in enumerate(zip(_df_list, t_col_list)):
-        logger.info(f"Resampling DataFrame #{i + 1} based on column '{t}'...")
-        df_interp = pd.DataFrame({"common_time": common_time})
+    # Output columns; on name conflicts the first DataFrame wins
+    names = ["common_time"]
+    selected = []
+    for i, df in enumerate(_df_list):
+        columns = []
         for col in df.columns:
             col_name = col + f"_{i + 1}" if suffixes else col
-            df_interp[col_name] = np.interp(common_time, df[t], df[col])
-        df_interp_list.append(df_interp)
+            if col_name not in names:
+                names.append(col_name)
+                columns.append(col)
+        selected.append(columns)
+
+    # Downsampling and interpolation to the common grid, into one array:
+    out = np.empty((len(common_time), len(names)), dtype=np.float64)
+    out[:, 0] = common_time
+    pos = 1
+    for i, (df, t) in enumerate(zip(_df_list, t_col_list)):
+        logger.info(f"Resampling DataFrame #{i + 1} based on column '{t}'...")
+        columns = selected[i]
+        if columns:
+            out[:, pos : pos + len(columns)] = resample(df, t, common_time, columns)
+        pos += len(columns)
 
-    # Merging all data streams to single DataFrame:
-    logger.info("Merging...")
-    resampled_df = pd.concat(df_interp_list, axis=1).loc[
-        :, ~pd.concat(df_interp_list, axis=1).columns.duplicated()
-    ]
+    resampled_df = pd.DataFrame(out, columns=names)
     logger.info("Done.")
 
     return resampled_df
 
 
+class PolyphaseResampler:
+    """Streaming rational-ratio resampler with state carried across chunks.
+
+    Resamples by ``up / down`` with a linear-phase FIR low-pass filter,
+    evaluated in polyphase form (`scipy.signal.upfirdn`) so that only the
+    output samples are computed. Chunks of any size can be fed to `process`;
+    the concatenated outputs, followed by `flush`, equal
+    ``scipy.signal.resample_poly(x, up, down)`` on the whole signal (zero
+    padding beyond its ends).
+
+    Parameters
+    ----------
+    up, down : int
+        Upsampling and downsampling factors.
+    window : str, tuple or np.ndarray, optional
+        Window used to design the filter, as in `scipy.signal.resample_poly`,
+        or the FIR coefficients themselves. Defaults to ('kaiser', 5.0).
+
+    Examples
+    --------
+    >>> rs = PolyphaseResampler.from_rates(10_000.0, 10.0)
+    >>> y = np.concatenate([rs.process(chunk) for chunk in chunks] + [rs.flush()])
+    """
+
+    def __init__(self, up, down, window=("kaiser", 5.0)):
+        from math import gcd
+
+        up, down = int(up), int(down)
+        if up < 1 or down < 1:
+            raise ValueError("`up` and `down` must be >= 1")
+        g = gcd(up, down)
+        self.up, self.down = up // g, down // g
+
+        if isinstance(window, (list, np.ndarray)):
+            h = np.array(window, dtype=np.float64)
+            if h.ndim != 1:
+                raise ValueError("`window` must be 1-D")
+        elif self.up == self.down == 1:
+            h = np.ones(1)  # Same rate: pass-through
+        else:
+            from scipy.signal import firwin
+
+            max_rate = max(self.up, self.down)
+            h = firwin(20 * max_rate + 1, 1.0 / max_rate, window=window)
+        self._h = h * self.up
+        self.half_len = (h.size - 1) // 2
+        # Input samples spanned by the filter
+        self._n_taps = -(-h.size // self.up)
+        # Output m is the upsampled, filtered signal at m * down + half_len.
+        # The buffer starts at input indices b0 with (n - up * b0) % down == 0,
+        # so that `upfirdn` on the buffer lands on the output phases.
+        self._residue = (self.half_len * pow(self.up, -1, self.down)) % self.down
+        self.reset()
+
+    @classmethod
+    def from_rates(cls, fs_in, fs_out, max_denominator=100_000, **kwargs):
+        """Creates a resampler from input and output sampling frequencies (Hz).
+
+        Raises
+        ------
+        ValueError
+            If ``fs_out / fs_in`` is not a ratio of integers up to `max_denominator`.
+        """
+        from fractions import Fraction
+
+        if fs_in <= 0 or fs_out <= 0:
+            raise ValueError("Sampling frequencies must be positive.")
+        ratio = Fraction(fs_out / fs_in).limit_denominator(max_denominator)
+        if abs(float(ratio) - fs_out / fs_in) > 1e-9 * fs_out / fs_in:
+            raise ValueError(
+                f"Cannot resample from {fs_in} Hz to {fs_out} Hz with a rational ratio "
+                f"of denominator <= {max_denominator}."
+            )
+        return cls(ratio.numerator, ratio.denominator, **kwargs)
+
+    def _aligned_start(self, n):
+        """Latest valid buffer start for an output at upsampled index `n`."""
+        need = n // self.up - (self._n_taps - 1)
+        return need - (need - self._residue) % self.down
+
+    def reset(self):
+        """Clears the state to start a new stream."""
+        self._buf = None
+        self._b0 = self._aligned_start(self.half_len)  # Global index of _buf[0]
+        self._n_in = 0
+        self._n_out = 0
+
+    def _run(self, chunk):
+        from scipy.signal import upfirdn
+
+        if self._buf is None:
+            # The signal is zero before its start
+            self._buf = np.zeros((-self._b0,) + chunk.shape[1:], dtype=chunk.dtype)
+        buf = np.concatenate((self._buf, chunk))
+        total = self._b0 + len(buf)  # Global index one past the last input
+
+        # Output m needs inputs up to (m * down + half_len) // up
+        m_end = max((total * self.up - 1 - self.half_len) // self.down + 1, self._n_out)
+        n_new = m_end - self._n_out
+        if n_new == 0:
+            self._buf = buf
+            return np.empty((0,) + chunk.shape[1:], dtype=buf.dtype)
+
+        first = (self._n_out * self.down + self.half_len - self.up * self._b0) // self.down
+        out = upfirdn(self._h, buf, self.up, self.down, axis=0)[first : first + n_new]
+
+        # Keep the inputs needed by the next output
+        self._n_out = m_end
+        b0 = self._aligned_start(m_end * self.down + self.half_len)
+        self._buf = buf[b0 - self._b0 :]
+        self._b0 = b0
+        return out
+
+    def process(self, chunk):
+        """Feeds the next chunk of the stream and returns the outputs it completes.
+
+        Parameters
+        ----------
+        chunk : np.ndarray
+            Samples of shape (n,) or (n, n_channels). All chunks of a stream
+            must have the same trailing shape.
+
+        Returns
+        -------
+        np.ndarray
+            The new output samples, with the same trailing shape.
+        """
+        chunk = np.asarray(chunk)
+        chunk = chunk.astype(np.result_type(chunk.dtype, np.float64), copy=False)
+        self._n_in += len(chunk)
+        return self._run(chunk)
+
+    def flush(self):
+        """Returns the remaining outputs, treating the signal as zero past its end."""
+        if self._buf is None:
+            return np.empty(0)
+        n_total = -(-self._n_in * self.up // self.down)
+        tail = np.zeros(
+            (self._n_taps + self.half_len // self.up + 1,) + self._buf.shape[1:],
+            dtype=self._buf.dtype,
+        )
+        n_out = self._n_out
+        out = self._run(tail)[: max(n_total - n_out, 0)]
+        self._n_out = n_total
+        return out
+
+
+def _chunk_slices(n, chunk_size):
+    """Slices splitting ``range(n)`` into chunks of `chunk_size`."""
+    return (slice(i, i + chunk_size) for i in range(0, n, chunk_size))
+
+
+def _resampled_blocks(rs, chunks):
+    """Yields the outputs of a `PolyphaseResampler` over `chunks`, then its flush."""
+    for chunk in chunks:
+        yield rs.process(chunk)
+    yield rs.flush()
+
+
+def resample_streams(streams, fs_list, fs, chunk_size=1 << 16, out=None, **kwargs):
+    """
+    Converts data streams sampled at different rates to a common rate, chunk by chunk.
+
+    Every stream goes through its own `PolyphaseResampler`, so that only one
+    chunk of input per stream is held in memory at a time and downsampling
+    is anti-aliased. The result is a channels-by-samples array that can be
+    passed to `compute_csd_matrix` or `compute_spectrum` directly, without
+    building a merged DataFrame.
+
+    Parameters
+    ----------
+    streams : list
+        One entry per stream, each either an array of shape (n,) or
+        (n, n_channels) (e.g., a `np.memmap`), or an iterable of such chunks.
+        All streams must start at the same time.
+    fs_list : list of float
+        Sampling frequency of each stream (Hz).
+    fs : float
+        Common output sampling frequency (Hz).
+    chunk_size : int, optional
+        Input samples per chunk when a stream is given as an array.
+        Defaults to 65536.
+    out : np.ndarray, optional
+        Preallocated output of shape (n_channels_total, n) with `n` at least
+        the common length (e.g., a `np.memmap` for out-of-core results).
+        Resampled chunks are written into it as they are produced. Without
+        it, the output is allocated from the lengths of the array streams.
+    **kwargs :
+        Passed to `PolyphaseResampler` (e.g., `window`, `max_denominator`).
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (n_channels_total, n_common), one row per channel in
+        stream order, truncated to the shortest resampled stream.
+
+    Raises
+    ------
+    ValueError
+        If `fs_list` does not match `streams` or `out` is too small.
+    """
+    if len(streams) != len(fs_list):
+        raise ValueError("The length of `fs_list` must match the length of `streams`.")
+
+    resamplers, sources, widths, dtypes = [], [], [], []
+    lengths = []  # Output lengths of the streams given as arrays
+    for stream, fs_in in zip(streams, fs_list):
+        rs = PolyphaseResampler.from_rates(fs_in, fs, **kwargs)
+        if isinstance(stream, np.ndarray):
+            chunks = map(stream.__getitem__, _chunk_slices(len(stream), chunk_size))
+            sample = stream
+            lengths.append(-(-len(stream) * rs.up // rs.down))
+        else:
+            # Peek at the first chunk for the number of channels and dtype
+            chunks = iter(stream)
+            first = next(chunks, None)
+            sample = np.empty(0) if first is None else np.asarray(first)
+            chunks = itertools.chain([] if first is None else [sample], chunks)
+        resamplers.append(rs)
+        sources.append(chunks)
+        widths.append(1 if sample.ndim == 1 else sample.shape[1])
+        dtypes.append(np.result_type(sample.dtype, np.float64))
+
+    n_channels = sum(widths)
+    if out is None:
+        # Without array streams the length is unknown and `out` grows as needed
+        limit = min(lengths) if lengths else None
+        size = limit if limit is not None else chunk_size
+        out = np.empty((n_channels, size), dtype=np.result_type(*dtypes))
+        given = False
+    elif out.shape[0] != n_channels:
+        raise ValueError(f"`out` must have {n_channels} rows.")
+    else:
+        limit = out.shape[1]
+        given = True
+
+    n = None
+    row = 0
+    for rs, chunks, width in zip(resamplers, sources, widths):
+        rows = slice(row, row + width)
+        pos = 0
+        for block in _resampled_blocks(rs, chunks):
+            stop = len(block) if limit is None else min(len(block), max(limit - pos, 0))
+            if pos + stop > out.shape[1]:
+                grown = np.empty((n_channels, max(2 * out.shape[1], pos + stop)), out.dtype)
+                grown[:, :pos] = out[:, :pos]
+                out = grown
+            out[rows, pos : pos + stop] = block[:stop].T
+            pos += len(block)
+        n = pos if n is None else min(n, pos)
+        limit = n if limit is None else min(limit, n)
+        row += width
+
+    n = 0 if n is None else n
+    if given and out.shape[1] < n:
+        raise ValueError(f"`out` must have shape ({n_channels}, >= {n}).")
+    return out[:, :n]
+
+
 def multi_file_timeseries_resampler(
     file_list: List[str],
     fs_list: List[float],
@@ -1001,6 +1850,12 @@ def multi_file_timeseries_resampler(
 # export authority as may be required before exporting such information to
 # foreign countries or providing access to foreign persons.
 #
+# Constant shifts with more taps than this use FFT (overlap-add) convolution
+_TIMESHIFT_FFT_MIN_TAPS = 256
+# Samples per block of the time-varying path (bounds its working memory)
+_TIMESHIFT_BLOCK = 1 << 16
+
+
 def lagrange_taps(shift_fracs, halfp):
     """Computes the coefficients for a Lagrange fractional delay filter.
 
@@ -1069,6 +1924,14 @@ def lagrange_taps(shift_fracs, halfp):
     return taps.T
 
 
+@functools.lru_cache(maxsize=1024)
+def _constant_taps(shift_frac, halfp):
+    """Lagrange taps of a single fractional shift (cached, read-only)."""
+    taps = lagrange_taps(np.array([shift_frac]), halfp)[0]
+    taps.setflags(write=False)
+    return taps
+
+
 def timeshift(data, shifts, order=31):
     """Time-shift data using high-order Lagrange interpolation.
 
@@ -1103,8 +1966,11 @@ def timeshift(data, shifts, order=31):
 
     Notes
     -----
-    The implementation is fully vectorized using NumPy for high performance,
-    avoiding slow Python loops even for time-varying shifts.
+    Constant shifts are applied as a single correlation with the Lagrange
+    taps, using FFT-based (overlap-add) convolution for orders above 255.
+    For time-varying shifts, the taps of each sample are computed on the fly
+    by a parallel compiled kernel, so memory stays O(N) for any order; without
+    numba (or for non-real data), a vectorized NumPy path is run block by block.
     """
     if order % 2 == 0:
         raise ValueError(f"`order` must be an odd integer (got {order})")
@@ -1125,16 +1991,12 @@ def timeshift(data, shifts, order=31):
     halfp = (order + 1) // 2
     # num_taps = 2 * halfp
 
-    shift_ints = np.floor(shifts).astype(int)
-    shift_fracs = shifts - shift_ints
-
-    logger.debug("Computing Lagrange coefficients")
-    taps = lagrange_taps(shift_fracs, halfp)
-
     # --- Constant Shift Path (Optimized for a single shift value) ---
     if shifts.size == 1:
-        logger.debug("Constant shifts, using correlation method")
-        shift_int = shift_ints.item()
+        shift = float(shifts.item())
+        shift_int = int(np.floor(shift))
+        logger.debug("Computing Lagrange coefficients")
+        taps = _constant_taps(shift - shift_int, halfp)[None, :]
 
         i_min = shift_int - (halfp - 1)
         i_max = shift_int + halfp + data.size
@@ -1150,6 +2012,11 @@ def timeshift(data, shifts, order=31):
         data_trimmed = data[max(0, i_min) : min(data.size, i_max)]
         data_padded = np.pad(data_trimmed, (pad_left, pad_right), mode="edge")
 
+        if 2 * halfp > _TIMESHIFT_FFT_MIN_TAPS:
+            from scipy.signal import oaconvolve
+
+            logger.debug("Computing correlation product (overlap-add FFT)")
+            return oaconvolve(data_padded, taps[0][::-1], mode="valid")
         logger.debug("Computing correlation product")
         return np.correlate(data_padded, taps[0], mode="valid")
 
@@ -1159,12 +2026,29 @@ def timeshift(data, shifts, order=31):
             f"`data` and `shift` must be of the same size (got {data.size}, {shifts.size})"
         )
 
-    logger.debug("Time-varying shifts, using sliding window view")
-    indices = np.clip(
-        np.arange(data.size) + shift_ints, -(halfp + 1), data.size + (halfp - 1)
-    )
+    if _HAS_NUMBA and data.dtype.kind in "biuf":
+        logger.debug("Time-varying shifts, using compiled kernel")
+        return _timeshift_varying(
+            np.ascontiguousarray(data, dtype=np.float64),
+            np.ascontiguousarray(shifts, dtype=np.float64),
+            halfp,
+            _TIMESHIFT_BLOCK,
+        )
+
+    logger.debug("Time-varying shifts, using sliding window view in blocks")
     padded = np.pad(data, 2 * halfp)
-    slices = np.lib.stride_tricks.sliding_window_view(padded, 2 * halfp)
-    slices = slices[indices + 2 * halfp - (halfp - 1)]
-    logger.debug("Computing matrix-vector product")
-    return np.einsum("ij,ij->i", taps, slices)
+    windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * halfp)
+    out = np.empty(data.size, dtype=np.result_type(data, np.float64))
+    for start in range(0, data.size, _TIMESHIFT_BLOCK):
+        stop = min(data.size, start + _TIMESHIFT_BLOCK)
+        block_shifts = shifts[start:stop]
+        shift_ints = np.floor(block_shifts).astype(int)
+        taps = lagrange_taps(block_shifts - shift_ints, halfp)
+        indices = np.clip(
+            np.arange(start, stop) + shift_ints,
+            -(halfp + 1),
+            data.size + (halfp - 1),
+        )
+        slices = windows[indices + 2 * halfp - (halfp - 1)]
+        out[start:stop] = np.einsum("ij,ij->i", taps, slices)
+    return out
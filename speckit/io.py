@@ -0,0 +1,406 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2025, Miguel Dovale
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# This software may be subject to U.S. export control laws. By accepting this
+# software, the user agrees to comply with all applicable U.S. export laws and
+# regulations. User has the responsibility to obtain export licenses, or other
+# export authority as may be required before exporting such information to
+# foreign countries or providing access to foreign persons.
+#
+"""Compact binary storage of spectral analysis results and plans.
+
+Only the primary, per-bin accumulators and plan columns are stored (e.g.,
+`f, r, L, navg, XX, YY, XY, S12, S2, M2`); every derived quantity is
+recomputed lazily after loading. The ragged segment start indices `D` are
+packed into a single integer array plus offsets instead of an object array.
+
+Two container formats are supported:
+
+- ``.npz`` (default, no extra dependency): an uncompressed NumPy archive. With
+  ``mmap=True`` its members are memory-mapped straight out of the archive.
+- ``.h5``/``.hdf5`` (requires `h5py`): one dataset per column, stored
+  contiguously so that it can also be memory-mapped.
+
+The same containers also hold numeric time-series tables, which the
+multi-file loader uses to cache parsed text files.
+"""
+import json
+import struct
+import zipfile
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+_FORMAT_VERSION = 1
+_META_KEY = "__meta__"
+_HDF5_SUFFIXES = (".h5", ".hdf5")
+
+
+# ---------- RAGGED SEGMENT INDICES ----------
+
+
+def pack_ragged(rows) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Packs a sequence of 1D integer arrays into a flat array and offsets.
+
+    Parameters
+    ----------
+    rows : sequence of array-like
+        The rows, e.g., the segment start indices `D` of a plan.
+
+    Returns
+    -------
+    values : np.ndarray
+        Concatenation of all rows, using int32 when the values allow it.
+    offsets : np.ndarray
+        Row boundaries; row `j` is ``values[offsets[j]:offsets[j + 1]]``.
+    """
+    rows = [np.asarray(row).ravel() for row in rows]
+    offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+    np.cumsum([len(row) for row in rows], out=offsets[1:])
+    values = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    values = values.astype(np.int64, copy=False)
+    int32 = np.iinfo(np.int32)
+    if values.size == 0 or (values.min() >= int32.min and values.max() <= int32.max):
+        values = values.astype(np.int32)
+    return values, offsets
+
+
+def unpack_ragged(values: np.ndarray, offsets: np.ndarray) -> np.ndarray:
+    """
+    Inverse of `pack_ragged`.
+
+    Returns
+    -------
+    np.ndarray
+        Object array whose elements are views into `values`.
+    """
+    rows = np.empty(len(offsets) - 1, dtype=object)
+    for j in range(len(rows)):
+        rows[j] = values[offsets[j] : offsets[j + 1]]
+    return rows
+
+
+# ---------- GENERIC CONTAINERS ----------
+
+
+def _json_safe(value: Any) -> Any:
+    """Converts configuration values to JSON; callables are stored by name."""
+    if isinstance(value, dict):
+        return {str(k): _json_safe(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(v) for v in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    if callable(value):
+        module = getattr(value, "__module__", None)
+        name = getattr(value, "__qualname__", None) or repr(value)
+        return f"{module}.{name}" if module else name
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return repr(value)
+
+
+def _split_columns(
+    data: Dict[str, Any],
+) -> Tuple[Dict[str, np.ndarray], Dict[str, Any]]:
+    """Separates array columns (with `D` packed) from scalar entries."""
+    arrays: Dict[str, np.ndarray] = {}
+    scalars: Dict[str, Any] = {}
+    for key, value in data.items():
+        if key == "D":
+            arrays["D_values"], arrays["D_offsets"] = pack_ragged(value)
+        elif isinstance(value, (np.ndarray, list, tuple)):
+            arr = np.asarray(value)
+            if arr.dtype == object:
+                raise TypeError(f"Cannot store object array '{key}'.")
+            arrays[key] = arr
+        else:
+            scalars[key] = _json_safe(value)
+    return arrays, scalars
+
+
+def _join_columns(
+    arrays: Dict[str, np.ndarray], scalars: Dict[str, Any]
+) -> Dict[str, Any]:
+    data: Dict[str, Any] = {}
+    for key, arr in arrays.items():
+        if key not in ("D_values", "D_offsets"):
+            data[key] = arr
+    if "D_values" in arrays:
+        data["D"] = unpack_ragged(arrays["D_values"], arrays["D_offsets"])
+    data.update(scalars)
+    return data
+
+
+def _is_hdf5(path) -> bool:
+    return str(path).lower().endswith(_HDF5_SUFFIXES)
+
+
+def _import_h5py():
+    """Imports `h5py` on first use so that it does not slow down `import speckit`."""
+    try:
+        import h5py
+    except ImportError as e:
+        raise ImportError(
+            "HDF5 storage requires `h5py`. Use a '.npz' path instead."
+        ) from e
+    return h5py
+
+
+def _npz_memmap(path, info: zipfile.ZipInfo) -> Optional[np.ndarray]:
+    """Maps an uncompressed `.npy` member of a zip archive, or returns None."""
+    if info.compress_type != zipfile.ZIP_STORED:
+        return None
+    with open(path, "rb") as fh:
+        fh.seek(info.header_offset)
+        local_header = fh.read(30)
+        name_len, extra_len = struct.unpack("<HH", local_header[26:30])
+        fh.seek(info.header_offset + 30 + name_len + extra_len)
+        version = np.lib.format.read_magic(fh)
+        if version == (1, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_1_0(fh)
+        elif version == (2, 0):
+            shape, fortran, dtype = np.lib.format.read_array_header_2_0(fh)
+        else:
+            return None
+        offset = fh.tell()
+    if dtype.hasobject or len(shape) == 0 or 0 in shape:
+        return None
+    return np.memmap(
+        path, dtype=dtype, mode="r", offset=offset, shape=shape,
+        order="F" if fortran else "C",
+    )
+
+
+def _write(
+    path, kind: str, data: Dict[str, Any], meta: Dict[str, Any], compress: bool
+):
+    arrays, scalars = _split_columns(data)
+    header = json.dumps(
+        {"kind": kind, "version": _FORMAT_VERSION, "scalars": scalars, **meta}
+    )
+    if _is_hdf5(path):
+        h5py = _import_h5py()
+        with h5py.File(path, "w") as h5:
+            h5.attrs[_META_KEY] = header
+            for key, arr in arrays.items():
+                if compress:
+                    h5.create_dataset(key, data=arr, compression="gzip")
+                else:
+                    h5.create_dataset(key, data=arr)
+    else:
+        save = np.savez_compressed if compress else np.savez
+        # Through a file handle, np.savez writes exactly `path` (given a path,
+        # it appends '.npz' to any other suffix)
+        with open(path, "wb") as fh:
+            save(fh, **{_META_KEY: np.array(header)}, **arrays)
+
+
+def _read(path, kind: str, mmap: bool) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    arrays: Dict[str, np.ndarray] = {}
+    if _is_hdf5(path):
+        h5py = _import_h5py()
+        with h5py.File(path, "r") as h5:
+            header = h5.attrs[_META_KEY]
+            for key, dset in h5.items():
+                offset = dset.id.get_offset() if mmap else None
+                if offset is not None and dset.size > 0:
+                    arrays[key] = np.memmap(
+                        path,
+                        dtype=dset.dtype,
+                        mode="r",
+                        offset=offset,
+                        shape=dset.shape,
+                    )
+                else:
+                    arrays[key] = dset[()]
+    else:
+        with zipfile.ZipFile(path) as zf:
+            members = {info.filename: info for info in zf.infolist()}
+        with np.load(path, allow_pickle=False) as npz:
+            header = str(npz[_META_KEY])
+            for key in npz.files:
+                if key == _META_KEY:
+                    continue
+                arr = _npz_memmap(path, members[key + ".npy"]) if mmap else None
+                arrays[key] = npz[key] if arr is None else arr
+
+    meta = json.loads(header)
+    if meta.get("kind") != kind:
+        raise ValueError(
+            f"'{path}' does not contain a {kind} (found {meta.get('kind')})."
+        )
+    if meta.get("version", 0) > _FORMAT_VERSION:
+        raise ValueError(f"'{path}' was written by a newer version of speckit.")
+    return _join_columns(arrays, meta.pop("scalars")), meta
+
+
+# ---------- PUBLIC API ----------
+
+
+def save_result(result, path, *, compress: bool = False) -> None:
+    """
+    Stores a `SpectrumResult` in a compact binary file.
+
+    Parameters
+    ----------
+    result : SpectrumResult
+        The result to store.
+    path : str or os.PathLike
+        Destination file. A '.h5' or '.hdf5' suffix selects HDF5 (requires
+        `h5py`); anything else is written as a NumPy '.npz' archive.
+    compress : bool, optional
+        Compress the columns. Compressed files cannot be memory-mapped.
+        Defaults to False.
+    """
+    meta = {
+        "iscsd": bool(result.iscsd),
+        "fs": float(result.fs),
+        "config": _json_safe(result._config),
+    }
+    _write(path, "result", result._data, meta, compress)
+
+
+def load_result(path, *, mmap: bool = False):
+    """
+    Loads a `SpectrumResult` written by `save_result`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        File to read.
+    mmap : bool, optional
+        Memory-map the columns instead of reading them into memory, which
+        makes opening large archives nearly free. Defaults to False.
+
+    Returns
+    -------
+    SpectrumResult
+        The result; derived quantities are recomputed lazily on access.
+        Callables in the stored configuration (e.g., the window function)
+        are restored as their qualified names.
+    """
+    from speckit.analysis import SpectrumResult
+
+    data, meta = _read(path, "result", mmap)
+    return SpectrumResult(data, meta["config"], meta["iscsd"], meta["fs"])
+
+
+def save_plan(plan: Dict[str, Any], path, *, compress: bool = False) -> None:
+    """
+    Stores a computation plan (as returned by `SpectrumAnalyzer.plan`).
+
+    Parameters
+    ----------
+    plan : dict
+        The plan dictionary.
+    path : str or os.PathLike
+        Destination file, see `save_result`.
+    compress : bool, optional
+        Compress the columns. Defaults to False.
+    """
+    _write(path, "plan", plan, {}, compress)
+
+
+def load_plan(path, *, mmap: bool = False) -> Dict[str, Any]:
+    """
+    Loads a computation plan written by `save_plan`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        File to read.
+    mmap : bool, optional
+        Memory-map the columns. Defaults to False.
+
+    Returns
+    -------
+    dict
+        The plan, with `D` as a sequence of start-index arrays.
+    """
+    plan, _ = _read(path, "plan", mmap)
+    return plan
+
+
+def save_table(df, path) -> None:
+    """
+    Stores the columns of a numeric DataFrame in a memory-mappable file.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Table with numeric (or boolean) columns and unique string labels.
+    path : str or os.PathLike
+        Destination file, see `save_result`. Columns are never compressed.
+
+    Raises
+    ------
+    TypeError
+        If a column is not numeric or a label is not a string.
+    """
+    labels = list(df.columns)
+    if not all(isinstance(label, str) for label in labels):
+        raise TypeError("Only tables with string column labels can be stored.")
+    columns = {}
+    for i in range(len(labels)):
+        arr = df.iloc[:, i].to_numpy()
+        if arr.dtype.kind not in "biuf":
+            raise TypeError(f"Cannot store non-numeric column '{labels[i]}'.")
+        columns[f"c{i}"] = arr
+    _write(path, "table", columns, {"columns": labels}, compress=False)
+
+
+def load_table(path, *, mmap: bool = False, rows: Optional[slice] = None):
+    """
+    Loads a DataFrame written by `save_table`.
+
+    Parameters
+    ----------
+    path : str or os.PathLike
+        File to read.
+    mmap : bool, optional
+        Memory-map the columns instead of reading them through the archive.
+        Defaults to False.
+    rows : slice, optional
+        Range of rows to return. With `mmap=True` only these rows are read
+        from disk. Defaults to None (all rows).
+
+    Returns
+    -------
+    pd.DataFrame
+        The table, with its original column labels and dtypes.
+    """
+    import pandas as pd
+
+    data, meta = _read(path, "table", mmap)
+    rows = slice(None) if rows is None else rows
+    return pd.DataFrame(
+        {label: data[f"c{i}"][rows] for i, label in enumerate(meta["columns"])}
+    )
@@ -43,13 +43,23 @@ IIR filters to shape white noise, as described by Plaszczynski.
 This implementation is highly optimized for performance and stability:
 1.  **Numba-JIT Acceleration**: The core filter cascade loop in `alpha_noise`
     is Just-In-Time (JIT) compiled by Numba, providing C-like execution speed.
-2.  **Buffered Sampling**: A `get_sample()` method with an internal buffer
-    amortizes the cost of generation, allowing for efficient single-sample
-    retrieval in state-space models like Kalman filters.
+    All sections are applied per sample in a single pass over memory.
+2.  **Buffered Sampling**: A `get_sample()` method reading through a cursor
+    into a reusable buffer of `buffer_size` samples amortizes the cost of
+    generation, allowing for efficient single-sample retrieval in
+    state-space models like Kalman filters. `iter_blocks()` and the `out`
+    argument of `get_series()` stream blocks into preallocated memory.
 3.  **Vectorized Initialization**: NumPy vectorization is used to rapidly
-    calculate filter coefficients during class initialization.
+    calculate filter coefficients during class initialization, and the
+    filter states are drawn directly from their stationary distribution
+    instead of being settled by a long burn-in run.
 4.  **Modular Class Structure**: A base class shares common logic, improving
     maintainability and reducing code duplication.
+5.  **Multi-Channel Banks**: `multichannel_alpha_noise` generates many
+    independent channels at once, filtering them in parallel.
+6.  **Arbitrary Spectra**: `psd_noise` fits a cascade of the same
+    first-order filters to a target PSD (e.g. a measured `SpectrumResult`)
+    and streams noise with that spectrum at the same speed.
 
 Requires the `numba` library (`pip install numba`).
 
@@ -62,72 +72,225 @@ https://doi.org/10.1142/S0219477507003635
 """
 
 from __future__ import annotations
-from typing import Optional, Tuple
+import hashlib
+import itertools
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Optional, Tuple, Union
 
 import numpy as np
-from numpy.typing import ArrayLike, NDArray
+from numpy.typing import ArrayLike, DTypeLike, NDArray
 from scipy.signal import butter, lfilter
 
 import numba
 from scipy import signal
 
+if TYPE_CHECKING:
+    from .analysis import SpectrumResult
+
 _INDEX_LIMIT = np.iinfo(np.intp).max
 _DEFAULT_BUFFER_SIZE = 4096
-
-
-@numba.jit(nopython=True, cache=True)
-def _numba_lfilter_cascade(
+# Samples per channel generated and filtered at a time (bounds the scratch memory)
+_NOISE_BLOCK_SIZE = 1 << 16
+# Points per decade of the log-spaced grid on which target spectra are fitted
+_PSD_FIT_POINTS_PER_DECADE = 20
+# Number of fitted target spectra kept by `psd_noise`
+_PSD_FIT_CACHE_SIZE = 32
+_psd_fit_cache: "OrderedDict[str, Tuple[np.ndarray, np.ndarray, float, float]]" = (
+    OrderedDict()
+)
+_psd_fit_lock = threading.Lock()
+
+
+@numba.njit(parallel=True, cache=True)
+def _numba_lfilter_cascade_channels(
     samples: np.ndarray,
+    in_scale: float,
     a_coeffs: np.ndarray,
     b_coeffs: np.ndarray,
     zi_states: np.ndarray,
-) -> Tuple[np.ndarray, np.ndarray]:
-    """Applies a cascade of IIR filters using Numba for high performance.
+    out_scale: float,
+    out: np.ndarray,
+) -> None:
+    """Applies a cascade of first-order IIR filters to one or many channels.
 
-    This is a fast, numerically stable replacement for a Python loop over
-    SciPy's `lfilter`. It processes the entire sample array through one filter
-    at a time to maintain the same operational order as the original algorithm.
+    All filter sections are applied to each sample before moving to the next
+    one, so the filter states stay in registers and each sample is read and
+    written once, instead of once per section. Channels are distributed
+    across threads.
 
     Parameters
     ----------
     samples : np.ndarray
-        The input signal (typically white noise).
-    a_coeffs : np.ndarray
-        A 2D array of numerator coefficients for the filter cascade,
-        where `a_coeffs[i]` are the coefficients for the i-th filter.
-    b_coeffs : np.ndarray
-        A 2D array of denominator coefficients for the filter cascade.
+        Input white noise of shape (n_channels, npts), multiplied by
+        `in_scale` on the fly.
+    in_scale : float
+        Scale factor of the input samples.
+    a_coeffs, b_coeffs : np.ndarray
+        Filter coefficients of shape (n_sections, 2), shared by all channels.
     zi_states : np.ndarray
-        A 2D array of initial filter states (delay elements).
+        Filter states of shape (n_channels, n_sections), updated in place.
+    out_scale : float
+        Scale factor of the output samples.
+    out : np.ndarray
+        Output array of shape (n_channels, npts), written in place.
+    """
+    n_channels, npts = samples.shape
+    n_sections = a_coeffs.shape[0]
+    for c in numba.prange(n_channels):
+        z = zi_states[c].copy()
+        for j in range(npts):
+            x = in_scale * samples[c, j]
+            for i in range(n_sections):
+                # Direct Form II Transposed structure, matching lfilter_zi
+                y = a_coeffs[i, 0] * x + z[i]
+                z[i] = a_coeffs[i, 1] * x - b_coeffs[i, 1] * y
+                x = y
+            out[c, j] = x * out_scale
+        zi_states[c] = z
+
+
+def _stationary_state_factor(
+    a_coeffs: np.ndarray,
+    b_coeffs: np.ndarray,
+    variance: float,
+) -> np.ndarray:
+    """Square root of the steady-state covariance of a filter cascade.
+
+    The cascade used by `_numba_lfilter_cascade_channels`, driven by white
+    noise of the given variance, is the linear system
+    ``z[n+1] = A z[n] + B w[n]`` with a lower-triangular `A`. Its stationary
+    state covariance `P` solves the discrete Lyapunov equation
+    ``P = A P A^T + variance * B B^T``. With the returned factor `L`
+    (``L @ L.T == P``), ``L @ rng.standard_normal(n_sections)`` is a draw of
+    the filter states in steady state.
+
+    Parameters
+    ----------
+    a_coeffs, b_coeffs : np.ndarray
+        Filter coefficients of shape (n_sections, 2), in the format of
+        `_numba_lfilter_cascade_channels`.
+    variance : float
+        Variance of the white noise input.
 
     Returns
     -------
-    tuple[np.ndarray, np.ndarray]
-        A tuple containing:
-        - filtered_samples: The output signal after applying the full cascade.
-        - zi_states: The final filter states after processing all samples.
+    np.ndarray
+        Factor of shape (n_sections, n_sections).
     """
-    filtered_samples = samples.copy()
-
-    for i in range(a_coeffs.shape[0]):  # Iterate through each filter
+    from scipy.linalg import solve_discrete_lyapunov
+
+    n = a_coeffs.shape[0]
+    A = np.zeros((n, n))
+    B = np.zeros(n)
+    # The input of section i is x_i = G @ z + g * w
+    G = np.zeros(n)
+    g = 1.0
+    for i in range(n):
         a0, a1 = a_coeffs[i]
-        b0, b1 = b_coeffs[i]  # b0 is always 1.0
+        beta = b_coeffs[i, 1]
+        # z_i' = a1 * x_i - beta * (a0 * x_i + z_i)
+        c = a1 - beta * a0
+        A[i] = c * G
+        A[i, i] -= beta
+        B[i] = c * g
+        G = a0 * G
+        G[i] += 1.0
+        g = a0 * g
+
+    P = solve_discrete_lyapunov(A, variance * np.outer(B, B))
+    # Symmetric square root, robust to round-off in nearly singular P
+    eigvals, eigvecs = np.linalg.eigh(0.5 * (P + P.T))
+    return eigvecs * np.sqrt(np.clip(eigvals, 0.0, None))
+
+
+class _buffered_noise:
+    """Base class for buffered and block-wise access to a noise stream.
+
+    Subclasses implement ``get_series(npts, out=None)``. `get_sample` reads
+    from a buffer of `buffer_size` samples that is allocated once, refilled
+    in place when exhausted and read through a cursor.
+    """
+
+    def __init__(self) -> None:
+        self._buffer_size = _DEFAULT_BUFFER_SIZE
+        self._buffer: np.ndarray = np.empty(0)
+        self._cursor = 0
+
+    @property
+    def buffer_size(self) -> int:
+        """The number of samples generated at a time by `get_sample`."""
+        return self._buffer_size
+
+    @buffer_size.setter
+    def buffer_size(self, value: int) -> None:
+        if value < 1:
+            raise ValueError("buffer_size must be >= 1.")
+        # Samples already buffered are still served; the new size applies
+        # from the next refill on
+        self._buffer_size = int(value)
+
+    def _refill(self) -> None:
+        """Fills the sample buffer with the next `buffer_size` samples."""
+        if self._buffer.shape[-1] != self._buffer_size:
+            self._buffer = np.empty(self._buffer.shape[:-1] + (self._buffer_size,))
+        self.get_series(self._buffer_size, out=self._buffer)
+        self._cursor = 0
+
+    def get_sample(self) -> float:
+        """Retrieves a single sample from the noise stream.
+
+        Note
+        ----
+        This method is highly optimized through an internal buffer, making
+        sequential calls much faster than repeated calls to `get_series(1)`.
+
+        Returns
+        -------
+        float
+            A single noise sample.
+        """
+        if self._cursor == self._buffer.shape[-1]:
+            self._refill()
+
+        sample = self._buffer[self._cursor]
+        self._cursor += 1
+        return sample
 
-        z = zi_states[i, 0]  # Initial state for this filter
+    def iter_blocks(
+        self, block_size: int, n_blocks: Optional[int] = None
+    ) -> Iterator[np.ndarray]:
+        """Iterates over consecutive blocks of the noise stream.
 
-        for j in range(filtered_samples.shape[0]):  # Apply filter to samples
-            x = filtered_samples[j]
-            # Direct Form II Transposed structure, matching lfilter_zi
-            y = a0 * x + z
-            z = a1 * x - b1 * y
-            filtered_samples[j] = y
+        The blocks continue the stream of `get_series`. A single array is
+        allocated and overwritten with every block, so a block must be copied
+        if it is needed after the next iteration.
 
-        zi_states[i, 0] = z  # Store final state
+        Parameters
+        ----------
+        block_size : int
+            The number of samples per block.
+        n_blocks : int, optional
+            The number of blocks to yield. If None, the iteration does not
+            end. Defaults to None.
+
+        Yields
+        ------
+        np.ndarray
+            The next block, shaped like the output of ``get_series(block_size)``.
+        """
+        if block_size < 1:
+            raise ValueError("block_size must be >= 1.")
+        if block_size > _INDEX_LIMIT:
+            raise ValueError(f"Argument 'block_size' must be <= {_INDEX_LIMIT}.")
 
-    return filtered_samples, zi_states
+        block = None
+        for _ in itertools.count() if n_blocks is None else range(n_blocks):
+            block = self.get_series(block_size, out=block)
+            yield block
 
 
-class white_noise:
+class white_noise(_buffered_noise):
     """White noise generator (constant power spectrum).
 
     Generates a stream of random numbers drawn from a zero-mean Gaussian
@@ -167,9 +330,9 @@ class white_noise:
         # This seems to be a definition mismatch in the original docstring.
         # A common convention: For a real signal, variance = integral(one_sided_psd, 0, fs/2)
         # One-sided PSD = 2 * Two-sided PSD. So Var = 2*psd_two_sided*(fs/2) = psd_two_sided*fs
+        super().__init__()
         self._rms = np.sqrt(psd * f_sample)
         self._rng = np.random.default_rng(seed)
-        self._buffer: np.ndarray = np.array([])
 
     @property
     def fs(self) -> float:
@@ -181,74 +344,120 @@ class white_noise:
         """The Root Mean Square (RMS) value of the noise signal."""
         return self._rms
 
-    def get_sample(self) -> float:
-        """Retrieves a single sample from the noise stream.
-
-        Note
-        ----
-        This method is highly optimized through an internal buffer, making
-        sequential calls much faster than repeated calls to `get_series(1)`.
-
-        Returns
-        -------
-        float
-            A single noise sample.
-        """
-        if self._buffer.size == 0:
-            self._buffer = self.get_series(_DEFAULT_BUFFER_SIZE)
-
-        sample = self._buffer[0]
-        self._buffer = self._buffer[1:]
-        return sample
-
-    def get_series(self, npts: int) -> np.ndarray:
+    def get_series(self, npts: int, out: Optional[np.ndarray] = None) -> np.ndarray:
         """Generates an array of `npts` noise samples.
 
         Parameters
         ----------
         npts : int
             The number of samples to generate.
+        out : np.ndarray, optional
+            A float64 array of shape (npts,) to write the samples into,
+            avoiding a new allocation. Defaults to None.
 
         Returns
         -------
         np.ndarray
-            An array of `npts` noise samples.
+            An array of `npts` noise samples (`out` if given).
         """
         if npts > _INDEX_LIMIT:
             raise ValueError(f"Argument 'npts' must be <= {_INDEX_LIMIT}.")
-        return self._rng.normal(loc=0.0, scale=self.rms, size=npts)
+        if out is None:
+            out = np.empty(npts)
+        elif out.shape != (npts,) or out.dtype != np.float64:
+            raise ValueError(f"`out` must be a float64 array of shape ({npts},).")
 
+        # Same values as self._rng.normal(0.0, self.rms, npts)
+        self._rng.standard_normal(out=out)
+        out *= self.rms
+        return out
 
-class _base_colored_noise:
-    """Base class for colored noise generators to share common logic."""
 
-    def __init__(self) -> None:
-        self._buffer: np.ndarray = np.array([])
+class _base_colored_noise(_buffered_noise):
+    """Base class for colored noise generators to share common logic.
+
+    Subclasses set up a cascade of first-order filters in the format of
+    `_numba_lfilter_cascade_channels` (`_a_coeffs`, `_b_coeffs`), one random
+    stream and one row of `_zi_states` per channel (`_rngs`), and the output
+    scaling (`_scaling`), all driven by `_whitenoise.rms`.
+    """
+
+    def _calc_filter_coeffs(
+        self, f_min: np.ndarray, f_max: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized calculation of first-order filter coefficients."""
+        pi_f_min = f_min * np.pi
+        pi_f_max = f_max * np.pi
+
+        den = self.fs + pi_f_min
+        a0 = (self.fs + pi_f_max) / den
+        a1 = -1.0 * (self.fs - pi_f_max) / den
+        b1 = (self.fs - pi_f_min) / den
+        return (a0, a1, b1)
 
     def _settle_filter_state(self) -> None:
-        """Runs noise through the filter to bring it to a settled state.
+        """Draws the filter states from their stationary distribution.
 
-        This is a crucial step to avoid initialization artifacts. The number of
-        samples required for settling is proportional to `fs / fmin`.
+        Equivalent to running the cascade on white noise until the initial
+        transient has decayed, at a cost of O(n_sections^3) instead of
+        O(fs / fmin). Each channel draws from its own random stream.
         """
-        npts_req = int(np.ceil(2.0 * self.fs / self.fmin))
-        MAX_CHUNK_SIZE = 150_000_000  # To avoid memory errors for huge requests
+        factor = _stationary_state_factor(
+            self._a_coeffs, self._b_coeffs, self._whitenoise.rms**2
+        )
+        n_states = factor.shape[0]
+        for c, rng in enumerate(self._rngs):
+            self._zi_states[c] = factor @ rng.standard_normal(n_states)
 
-        if npts_req <= MAX_CHUNK_SIZE:
-            _ = self.get_series(npts_req)
-        else:
-            num_runs = int(np.ceil(npts_req / MAX_CHUNK_SIZE))
-            for _ in range(num_runs):
-                _ = self.get_series(MAX_CHUNK_SIZE)
+    def _generate(self, npts: int, out: Optional[np.ndarray]) -> None:
+        """Advances the stream by `npts` samples, written into `out` if given.
 
-    def get_sample(self) -> float:
-        """Retrieves a single sample from the noise stream."""
-        if self._buffer.size == 0:
-            self._buffer = self.get_series(_DEFAULT_BUFFER_SIZE)
+        White noise is drawn in blocks of `_NOISE_BLOCK_SIZE` samples into a
+        reusable buffer that stays in cache, and filtered in a single pass.
+        """
+        n_channels = len(self._rngs)
+        block = max(min(npts, _NOISE_BLOCK_SIZE), 1)
+        white = np.empty((n_channels, block))
+        scratch = None if out is not None else np.empty_like(white)
+        for b0 in range(0, npts, block):
+            n = min(block, npts - b0)
+            for c, rng in enumerate(self._rngs):
+                rng.standard_normal(out=white[c, :n])
+            _numba_lfilter_cascade_channels(
+                white[:, :n],
+                self._whitenoise.rms,
+                self._a_coeffs,
+                self._b_coeffs,
+                self._zi_states,
+                self._scaling,
+                out[:, b0 : b0 + n] if out is not None else scratch[:, :n],
+            )
+
+    def get_series(self, npts: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Generates an array of `npts` colored noise samples.
 
-        sample = self._buffer[0]
-        self._buffer = self._buffer[1:]
-        return sample
+        Parameters
+        ----------
+        npts : int
+            The number of samples to generate.
+        out : np.ndarray, optional
+            A float64 array of shape (npts,) to write the samples into,
+            avoiding a new allocation. Defaults to None.
+
+        Returns
+        -------
+        np.ndarray
+            The samples (`out` if given).
+        """
+        if npts > _INDEX_LIMIT:
+            raise ValueError(f"Argument 'npts' must be <= {_INDEX_LIMIT}.")
+        if out is None:
+            out = np.empty(npts)
+        elif out.shape != (npts,) or out.dtype != np.float64:
+            raise ValueError(f"`out` must be a float64 array of shape ({npts},).")
+
+        self._generate(npts, out[None, :])
+        return out
 
 
 class red_noise(_base_colored_noise):
@@ -265,8 +474,8 @@ class red_noise(_base_colored_noise):
     f_min : float
         Frequency cutoff in Hz. Below `f_min`, the noise spectrum is flat.
     init_filter : bool, optional
-        If True, settles the filter during initialization. This can be time-
-        consuming for low `f_min`. Defaults to True.
+        If True, draws the filter state from its stationary distribution so
+        the output has no start-up transient. Defaults to True.
     seed : int, optional
         Seed for the random number generator. Defaults to None.
 
@@ -291,15 +500,21 @@ class red_noise(_base_colored_noise):
         self._whitenoise = white_noise(self.fs, psd=1.0, seed=seed)
 
         self._scaling = 1.0 / (self.fs * self.fmin)
-        self._a = np.array([2.0 * np.pi * self.fmin])
-        self._b = np.array([1.0, -np.exp(-2.0 * np.pi * self.fmin / self.fs)])
-
-        zi_unscaled = signal.lfilter_zi(self._a, self._b)
-        initial_random_val = self._whitenoise._rng.normal(scale=self._whitenoise.rms)
-        self._zi = zi_unscaled * initial_random_val
+        b = np.array([2.0 * np.pi * self.fmin])
+        a = np.array([1.0, -np.exp(-2.0 * np.pi * self.fmin / self.fs)])
+        # The transposed direct form of lfilter(b, a) is the first-order
+        # section [b0, 0], [1, a1]
+        self._a_coeffs = np.array([[b[0], 0.0]])
+        self._b_coeffs = np.array([[1.0, a[1]]])
+        self._rngs = [self._whitenoise._rng]
+        self._zi_states = np.zeros((1, 1), dtype=np.float64)
 
         if init_filter:
             self._settle_filter_state()
+        else:
+            zi_unscaled = signal.lfilter_zi(b, a)
+            initial_random_val = self._whitenoise._rng.normal(scale=self._whitenoise.rms)
+            self._zi_states[0] = zi_unscaled * initial_random_val
 
     @property
     def fs(self) -> float:
@@ -311,15 +526,6 @@ class red_noise(_base_colored_noise):
         """The lower cutoff frequency in Hz."""
         return self._fmin
 
-    def get_series(self, npts: int) -> np.ndarray:
-        """Generates an array of `npts` red noise samples."""
-        if npts > _INDEX_LIMIT:
-            raise ValueError(f"Argument 'npts' must be <= {_INDEX_LIMIT}.")
-
-        w_noise = self._whitenoise.get_series(npts)
-        samples, self._zi = signal.lfilter(self._a, self._b, w_noise, zi=self._zi)
-        return samples * self._scaling
-
 
 class alpha_noise(_base_colored_noise):
     """Colored noise generator (1/f^alpha power spectrum).
@@ -340,7 +546,8 @@ class alpha_noise(_base_colored_noise):
     alpha : float
         Exponent of the 1/f^alpha power spectrum. Must be in [0.01, 2.0].
     init_filter : bool, optional
-        If True, settles the filter during initialization. Defaults to True.
+        If True, draws the filter states from their stationary distribution so
+        the output has no start-up transient. Defaults to True.
     seed : int, optional
         Seed for the random number generator. Defaults to None.
 
@@ -392,7 +599,8 @@ class alpha_noise(_base_colored_noise):
 
         self._a_coeffs = np.vstack([a0, a1]).T.copy()
         self._b_coeffs = np.vstack([np.ones_like(b1), -b1]).T.copy()
-        self._zi_states = np.zeros((self._num_spectra, 1), dtype=np.float64)
+        self._rngs = [self._whitenoise._rng]
+        self._zi_states = np.zeros((1, self._num_spectra), dtype=np.float64)
 
         self._scaling = 1.0 / np.power(self.fmax, self.alpha / 2.0)
 
@@ -419,30 +627,6 @@ class alpha_noise(_base_colored_noise):
         """The exponent of the 1/f^alpha power spectrum."""
         return self._alpha
 
-    def get_series(self, npts: int) -> np.ndarray:
-        """Generates an array of `npts` colored noise samples."""
-        if npts > _INDEX_LIMIT:
-            raise ValueError(f"Argument 'npts' must be <= {_INDEX_LIMIT}.")
-
-        w_noise = self._whitenoise.get_series(npts)
-        samples, self._zi_states = _numba_lfilter_cascade(
-            w_noise, self._a_coeffs, self._b_coeffs, self._zi_states
-        )
-        return samples * self._scaling
-
-    def _calc_filter_coeffs(
-        self, f_min: np.ndarray, f_max: np.ndarray
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Vectorized calculation of first-order filter coefficients."""
-        pi_f_min = f_min * np.pi
-        pi_f_max = f_max * np.pi
-
-        den = self.fs + pi_f_min
-        a0 = (self.fs + pi_f_max) / den
-        a1 = -1.0 * (self.fs - pi_f_max) / den
-        b1 = (self.fs - pi_f_min) / den
-        return (a0, a1, b1)
-
 
 class pink_noise(alpha_noise):
     """Pink noise generator (1/f power spectrum).
@@ -459,7 +643,8 @@ class pink_noise(alpha_noise):
     f_max : float
         Upper frequency cutoff in Hz.
     init_filter : bool, optional
-        If True, settles the filter during initialization. Defaults to True.
+        If True, draws the filter states from their stationary distribution so
+        the output has no start-up transient. Defaults to True.
     seed : int, optional
         Seed for the random number generator. Defaults to None.
     """
@@ -482,14 +667,429 @@ class pink_noise(alpha_noise):
         )
 
 
+class multichannel_alpha_noise(alpha_noise):
+    """Bank of independent colored noise channels (1/f^alpha power spectrum).
+
+    Generates `n_channels` independent realizations of `alpha_noise` at once,
+    as a (n_channels, npts) block. Each channel has its own random stream,
+    spawned from `seed` with `np.random.SeedSequence.spawn`, and its own filter
+    state, carried across calls. The filter cascade runs in parallel across
+    channels with all sections fused per sample.
+
+    Channel `c` is identical to ``alpha_noise(..., seed=children[c])`` with
+    ``children = np.random.SeedSequence(seed).spawn(n_channels)``.
+
+    Parameters
+    ----------
+    n_channels : int
+        Number of independent channels.
+    f_sample : float
+        Sampling frequency in Hz.
+    f_min : float
+        Lower frequency cutoff in Hz for the 1/f^alpha slope.
+    f_max : float
+        Upper frequency cutoff in Hz for the 1/f^alpha slope.
+    alpha : float
+        Exponent of the 1/f^alpha power spectrum. Must be in [0.01, 2.0].
+    init_filter : bool, optional
+        If True, draws the filter states from their stationary distribution so
+        the output has no start-up transient. Defaults to True.
+    seed : int, optional
+        Root seed of the channels' random streams. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        n_channels: int,
+        f_sample: float,
+        f_min: float,
+        f_max: float,
+        alpha: float,
+        init_filter: bool = True,
+        seed: Optional[int] = None,
+    ) -> None:
+        if n_channels < 1:
+            raise ValueError("n_channels must be >= 1.")
+        super().__init__(f_sample, f_min, f_max, alpha, init_filter=False, seed=seed)
+        self._n_channels = int(n_channels)
+        self._rngs = [
+            np.random.default_rng(child)
+            for child in np.random.SeedSequence(seed).spawn(self._n_channels)
+        ]
+        self._zi_states = np.zeros(
+            (self._n_channels, self._num_spectra), dtype=np.float64
+        )
+        self._buffer = np.empty((self._n_channels, 0))
+
+        if init_filter:
+            self._settle_filter_state()
+
+    @property
+    def n_channels(self) -> int:
+        """The number of independent channels."""
+        return self._n_channels
+
+    def get_series(self, npts: int, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Generates `npts` samples of every channel.
+
+        Parameters
+        ----------
+        npts : int
+            The number of samples to generate per channel.
+        out : np.ndarray, optional
+            A float64 array of shape (n_channels, npts) to write the samples
+            into. Defaults to None.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_channels, npts) (`out` if given).
+        """
+        if npts > _INDEX_LIMIT:
+            raise ValueError(f"Argument 'npts' must be <= {_INDEX_LIMIT}.")
+        shape = (self._n_channels, npts)
+        if out is None:
+            out = np.empty(shape)
+        elif out.shape != shape or out.dtype != np.float64:
+            raise ValueError(f"`out` must be a float64 array of shape {shape}.")
+
+        self._generate(npts, out)
+        return out
+
+    def get_sample(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Retrieves the next sample of every channel.
+
+        Parameters
+        ----------
+        out : np.ndarray, optional
+            An array of shape (n_channels,) to write the samples into.
+            Defaults to None.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_channels,) (`out` if given).
+        """
+        if self._cursor == self._buffer.shape[1]:
+            self._refill()
+
+        sample = self._buffer[:, self._cursor]
+        self._cursor += 1
+        if out is None:
+            return sample.copy()
+        out[...] = sample
+        return out
+
+
+def _target_psd_on_grid(
+    psd: Any,
+    f_sample: float,
+    f_min: Optional[float],
+    f_max: Optional[float],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Evaluates a target one-sided PSD on the log-spaced fitting grid.
+
+    Sampled spectra are interpolated linearly in log-log coordinates. The
+    upper end of the grid is capped at 0.99 times the Nyquist frequency.
+    """
+    from .analysis import SpectrumResult
+
+    samples = None
+    if isinstance(psd, SpectrumResult):
+        if psd.iscsd or psd.psd is None:
+            raise ValueError("The SpectrumResult must hold an auto-spectrum (PSD).")
+        samples = (np.asarray(psd.f, dtype=float), np.asarray(psd.psd, dtype=float))
+    elif not callable(psd):
+        try:
+            f, p = psd
+        except (TypeError, ValueError):
+            raise TypeError(
+                "`psd` must be a SpectrumResult, a callable or a pair (f, psd)."
+            ) from None
+        samples = (np.asarray(f, dtype=float), np.asarray(p, dtype=float))
+        if samples[0].ndim != 1 or samples[0].shape != samples[1].shape:
+            raise ValueError("`f` and `psd` must be 1D arrays of the same length.")
+
+    if samples is not None:
+        f, p = samples
+        valid = (f > 0) & (p > 0) & np.isfinite(f) & np.isfinite(p)
+        f, p = f[valid], p[valid]
+        if f.size < 2:
+            raise ValueError("The target PSD needs at least two positive samples at f > 0.")
+        order = np.argsort(f)
+        f, p = f[order], p[order]
+        f_min = f[0] if f_min is None else f_min
+        f_max = f[-1] if f_max is None else f_max
+    elif f_min is None:
+        raise ValueError("`f_min` is required when `psd` is a callable.")
+
+    nyq = f_sample / 2.0
+    f_max = 0.99 * nyq if f_max is None else min(f_max, 0.99 * nyq)
+    if not 0.0 < f_min < f_max:
+        raise ValueError(f"Require 0 < f_min < f_max <= f_sample / 2 (= {nyq}).")
+
+    decades = np.log10(f_max / f_min)
+    grid = np.geomspace(
+        f_min, f_max, max(int(np.ceil(_PSD_FIT_POINTS_PER_DECADE * decades)), 2) + 1
+    )
+    if samples is None:
+        target = np.asarray(psd(grid), dtype=float)
+        if target.shape != grid.shape or not np.all(np.isfinite(target) & (target > 0)):
+            raise ValueError(
+                "The callable must return positive, finite PSD values for an "
+                "array of frequencies."
+            )
+    else:
+        target = np.exp(np.interp(np.log(grid), np.log(f), np.log(p)))
+    return grid, target
+
+
+def _fit_psd_cascade(
+    grid: np.ndarray,
+    target: np.ndarray,
+    f_sample: float,
+    sections_per_decade: float,
+) -> Tuple[np.ndarray, np.ndarray, float, float]:
+    """Fits a first-order filter cascade to a target one-sided PSD.
+
+    The poles are fixed on a log-spaced grid spanning the fitted band, and
+    the zeros and the output gain are fitted by least squares on the log
+    PSD. The response of the bilinear-transformed cascade at frequency `f`
+    equals the analog one at ``2 * f_sample * tan(pi * f / f_sample)``, so
+    the fit is exact for the digital filters. White noise of variance
+    `f_sample` (one-sided PSD 2) drives the cascade. Results are cached per
+    target, keyed by a digest of the sampled target and the settings.
+
+    Returns
+    -------
+    f_zeros, f_poles : np.ndarray
+        Zero and pole frequencies of the sections in Hz.
+    gain : float
+        Output scaling.
+    fit_error : float
+        RMS deviation between the model and the target, in dB.
+    """
+    digest = hashlib.sha1()
+    for arr in (grid, target, np.array([f_sample, sections_per_decade])):
+        digest.update(np.ascontiguousarray(arr, dtype=np.float64).tobytes())
+    key = digest.hexdigest()
+    with _psd_fit_lock:
+        if key in _psd_fit_cache:
+            _psd_fit_cache.move_to_end(key)
+            return _psd_fit_cache[key]
+
+    from scipy.optimize import least_squares
+
+    decades = np.log10(grid[-1] / grid[0])
+    n_sections = max(int(np.ceil(sections_per_decade * decades)), 1) + 1
+    f_poles = np.geomspace(grid[0], grid[-1], n_sections)
+
+    warped2 = (2.0 * f_sample * np.tan(np.pi * grid / f_sample)) ** 2
+    pole_term = np.log(warped2[:, None] + (2.0 * np.pi * f_poles) ** 2).sum(axis=1)
+    log_target = np.log(target / 2.0)
+
+    def residual(x: np.ndarray) -> np.ndarray:
+        wz2 = np.exp(2.0 * x[:-1])
+        model = np.log(warped2[:, None] + wz2).sum(axis=1) - pole_term + 2.0 * x[-1]
+        return model - log_target
+
+    def jacobian(x: np.ndarray) -> np.ndarray:
+        wz2 = np.exp(2.0 * x[:-1])
+        jac = np.empty((grid.size, x.size))
+        jac[:, :-1] = 2.0 * wz2 / (warped2[:, None] + wz2)
+        jac[:, -1] = 2.0
+        return jac
+
+    # Start from a flat response (zeros on the poles)
+    log_wp = np.log(2.0 * np.pi * f_poles)
+    x0 = np.append(log_wp, 0.5 * np.mean(log_target))
+    lower = np.append(np.full(n_sections, np.log(2.0 * np.pi * grid[0] / 100.0)), -np.inf)
+    upper = np.append(np.full(n_sections, np.log(2.0 * np.pi * grid[-1] * 100.0)), np.inf)
+    sol = least_squares(residual, x0, jac=jacobian, bounds=(lower, upper))
+
+    f_zeros = np.exp(sol.x[:-1]) / (2.0 * np.pi)
+    fit_error = float(10.0 / np.log(10.0) * np.sqrt(np.mean(sol.fun**2)))
+    result = (f_zeros, f_poles, float(np.exp(sol.x[-1])), fit_error)
+    with _psd_fit_lock:
+        _psd_fit_cache[key] = result
+        while len(_psd_fit_cache) > _PSD_FIT_CACHE_SIZE:
+            _psd_fit_cache.popitem(last=False)
+    return result
+
+
+class psd_noise(_base_colored_noise):
+    """Noise generator with an arbitrary one-sided PSD.
+
+    A cascade of first-order filters is fitted once to the target spectrum,
+    and white noise is streamed through it with the Numba kernel of
+    `alpha_noise`. The filter state carries over between calls, so
+    consecutive series form one continuous stream. The cascade generalizes
+    the 1/f^alpha construction: the poles are log-spaced over the band and
+    the zeros are placed freely, giving a piecewise power law with a local
+    slope that follows the target. The spectrum is whitened outside
+    [`fmin`, `fmax`]. Smooth, broadband spectra are reproduced to within
+    about a dB (see `fit_error`); narrow lines are smoothed over.
+
+    Parameters
+    ----------
+    f_sample : float
+        Sampling frequency in Hz.
+    psd : SpectrumResult, callable or tuple of (np.ndarray, np.ndarray)
+        Target one-sided PSD in (signal units)^2 / Hz: an auto-spectrum
+        `SpectrumResult`, a function returning the PSD for an array of
+        frequencies, or samples `(f, psd)`, interpolated in log-log
+        coordinates. Fits are cached per target.
+    f_min : float, optional
+        Lower end of the fitted band in Hz. Defaults to the lowest positive
+        sampled frequency (required for a callable).
+    f_max : float, optional
+        Upper end of the fitted band in Hz, capped at 0.99 times the Nyquist
+        frequency. Defaults to the highest sampled frequency (the cap for a
+        callable).
+    sections_per_decade : float, optional
+        Number of filter sections per decade of the band. Defaults to 4.5.
+    init_filter : bool, optional
+        If True, draws the filter states from their stationary distribution so
+        the output has no start-up transient. Defaults to True.
+    seed : int, optional
+        Seed for the random number generator. Defaults to None.
+
+    Attributes
+    ----------
+    fs : float
+        The sampling frequency in Hz.
+    fmin, fmax : float
+        The fitted band in Hz.
+    fit_error : float
+        RMS deviation between the fitted and the target PSD in dB.
+    """
+
+    def __init__(
+        self,
+        f_sample: float,
+        psd: Union[
+            SpectrumResult,
+            Callable[[np.ndarray], np.ndarray],
+            Tuple[ArrayLike, ArrayLike],
+        ],
+        f_min: Optional[float] = None,
+        f_max: Optional[float] = None,
+        sections_per_decade: float = 4.5,
+        init_filter: bool = True,
+        seed: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        if sections_per_decade <= 0:
+            raise ValueError("sections_per_decade must be positive.")
+        self._fs = f_sample
+        grid, target = _target_psd_on_grid(psd, f_sample, f_min, f_max)
+        self._fmin, self._fmax = grid[0], grid[-1]
+        f_zeros, f_poles, gain, self._fit_error = _fit_psd_cascade(
+            grid, target, f_sample, sections_per_decade
+        )
+        self._f_zeros, self._f_poles = f_zeros, f_poles
+        self._whitenoise = white_noise(self.fs, psd=1.0, seed=seed)
+
+        a0, a1, b1 = self._calc_filter_coeffs(f_poles, f_zeros)
+        self._a_coeffs = np.vstack([a0, a1]).T.copy()
+        self._b_coeffs = np.vstack([np.ones_like(b1), -b1]).T.copy()
+        self._rngs = [self._whitenoise._rng]
+        self._zi_states = np.zeros((1, f_poles.size), dtype=np.float64)
+        self._scaling = gain
+
+        if init_filter:
+            self._settle_filter_state()
+
+    @property
+    def fs(self) -> float:
+        """The sampling frequency in Hz."""
+        return self._fs
+
+    @property
+    def fmin(self) -> float:
+        """Lower end of the fitted band in Hz."""
+        return self._fmin
+
+    @property
+    def fmax(self) -> float:
+        """Upper end of the fitted band in Hz."""
+        return self._fmax
+
+    @property
+    def fit_error(self) -> float:
+        """RMS deviation between the fitted and the target PSD in dB."""
+        return self._fit_error
+
+    def model_psd(self, f: ArrayLike) -> np.ndarray:
+        """One-sided PSD of the generated noise.
+
+        Parameters
+        ----------
+        f : array_like
+            Frequencies in Hz, in [0, f_sample / 2).
+
+        Returns
+        -------
+        np.ndarray
+            The PSD of the fitted filter cascade at `f`.
+        """
+        f = np.asarray(f, dtype=float)
+        warped2 = (2.0 * self.fs * np.tan(np.pi * f / self.fs))[..., None] ** 2
+        wz2 = (2.0 * np.pi * self._f_zeros) ** 2
+        wp2 = (2.0 * np.pi * self._f_poles) ** 2
+        H2 = np.prod((warped2 + wz2) / (warped2 + wp2), axis=-1)
+        return 2.0 * self._scaling**2 * H2
+
+
+def _real_float_dtype(dtype: DTypeLike) -> np.dtype:
+    """Validates an output dtype of the FFT noise synthesizers."""
+    dtype = np.dtype(dtype)
+    if dtype not in (np.float32, np.float64):
+        raise ValueError("`dtype` must be float32 or float64.")
+    return dtype
+
+
+def _rfftnoise(
+    half: np.ndarray,
+    n: int,
+    rng: np.random.Generator,
+    dtype: np.dtype,
+    workers: Optional[int],
+) -> np.ndarray:
+    """Inverse real FFT of a positive-frequency spectrum with random phases.
+
+    `half` holds bins ``0..n//2`` of a length-`n` spectrum. Random phases are
+    drawn for bins ``1..(n - 1)//2`` in blocks, so that no temporary is larger
+    than `_NOISE_BLOCK_SIZE`, in the same order as a single ``rng.random``
+    call.
+    """
+    from scipy import fft as sp_fft
+
+    F = np.array(half, dtype=np.result_type(dtype, np.complex64), copy=True)
+    Np = (n - 1) // 2
+    for b0 in range(1, Np + 1, _NOISE_BLOCK_SIZE):
+        b1 = min(b0 + _NOISE_BLOCK_SIZE, Np + 1)
+        phases = rng.random(b1 - b0) * 2.0 * np.pi
+        F[b0:b1] *= np.cos(phases) + 1j * np.sin(phases)
+
+    # DC and Nyquist (if present) must be real-valued
+    F[0] = F[0].real
+    if n % 2 == 0:
+        F[n // 2] = F[n // 2].real
+
+    return sp_fft.irfft(F, n=n, workers=workers)
+
+
 def fftnoise(
     f: np.ndarray,
     rng: np.random.Generator | None = None,
+    dtype: DTypeLike = np.float64,
+    workers: Optional[int] = None,
 ) -> np.ndarray:
     """
     Generate a real-valued time series with a prescribed magnitude spectrum by
-    assigning random phases to the positive-frequency bins and enforcing
-    Hermitian symmetry before inverse FFT.
+    assigning random phases to the positive-frequency bins and taking an
+    inverse real FFT.
 
     Parameters
     ----------
@@ -502,21 +1102,27 @@ def fftnoise(
     rng : numpy.random.Generator or None, optional
         Random number generator to use for phase draws. If ``None``,
         ``numpy.random.default_rng()`` is used.
+    dtype : {numpy.float64, numpy.float32}, optional
+        Output dtype. With ``float32`` the FFT runs in single precision,
+        halving the memory. Default is ``float64``.
+    workers : int or None, optional
+        Number of threads for the FFT (see :func:`scipy.fft.irfft`).
+        Default is ``None`` (single-threaded).
 
     Returns
     -------
     x : ndarray
-        Real-valued time series of length ``N`` obtained via
-        :func:`numpy.fft.ifft`, with shape ``(N,)`` and dtype ``float64`` (or
-        the real dtype corresponding to the input).
+        Real-valued time series of length ``N`` with shape ``(N,)`` and the
+        requested dtype.
 
     Notes
     -----
     Let ``N = len(f)`` and ``Np = (N - 1) // 2``. Random phases are applied
     to bins ``1..Np`` (inclusive). For even ``N``, the Nyquist bin is at
-    index ``N/2`` and is left unchanged (must be real). Hermitian symmetry
-    is enforced by setting ``f[-1:-1-Np:-1] = conj(f[1:Np+1])`` so that the
-    inverse FFT is purely real.
+    index ``N/2`` and is left unchanged (must be real). The negative
+    frequencies of ``f`` are ignored: only bins ``0..N//2`` are randomized
+    and passed to :func:`scipy.fft.irfft`, which is equivalent to enforcing
+    Hermitian symmetry and taking the real part of a full inverse FFT.
 
     Examples
     --------
@@ -532,29 +1138,10 @@ def fftnoise(
     N = f.size
     if N < 2:
         raise ValueError("`f` must have length >= 2.")
+    dtype = _real_float_dtype(dtype)
     rng = np.random.default_rng() if rng is None else rng
 
-    # Work on a complex copy to avoid mutating the caller's array
-    F = np.array(f, dtype=complex, copy=True)
-
-    # Number of strictly positive-frequency bins below Nyquist
-    Np = (N - 1) // 2
-    if Np > 0:
-        phases = rng.random(Np) * 2.0 * np.pi
-        rot = np.cos(phases) + 1j * np.sin(phases)
-        # Apply random phases to positive frequencies (exclude DC and Nyquist)
-        F[1 : Np + 1] *= rot
-        # Enforce Hermitian symmetry for a real IFFT
-        F[-1 : -1 - Np : -1] = np.conj(F[1 : Np + 1])
-
-    # Ensure DC and Nyquist (if present) are real-valued
-    F[0] = np.real(F[0])
-    if N % 2 == 0:  # even length -> Nyquist bin exists
-        F[N // 2] = np.real(F[N // 2])
-
-    # Return the real part of the inverse FFT
-    x = np.fft.ifft(F).real
-    return x
+    return _rfftnoise(f[: N // 2 + 1], N, rng, dtype, workers)
 
 
 def band_limited_noise(
@@ -563,6 +1150,10 @@ def band_limited_noise(
     samples: int = 1024,
     samplerate: float = 1.0,
     rng: np.random.Generator | None = None,
+    dtype: DTypeLike = np.float64,
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Synthesize band-limited white noise using randomized phases in the
@@ -583,18 +1174,40 @@ def band_limited_noise(
     rng : numpy.random.Generator or None, optional
         Random number generator to use for phase draws. If ``None``,
         ``numpy.random.default_rng()`` is used.
+    dtype : {numpy.float64, numpy.float32}, optional
+        Output dtype. Default is ``float64``.
+    workers : int or None, optional
+        Number of threads for the FFTs (see :func:`scipy.fft.irfft`).
+        Default is ``None`` (single-threaded).
+    chunk_size : int or None, optional
+        If given, the noise is synthesized in chunks of `chunk_size` samples
+        by overlap-add filtering of white noise (see Notes), with working
+        memory proportional to `chunk_size` instead of `samples`. Default is
+        ``None`` (a single inverse FFT of length `samples`).
+    out : ndarray or None, optional
+        Array of shape ``(samples,)`` and dtype `dtype` to write the noise
+        into, e.g. a :class:`numpy.memmap` for lengths that do not fit in
+        memory. Default is ``None``.
 
     Returns
     -------
     x : ndarray
-        Real-valued band-limited noise of shape ``(samples,)``.
+        Real-valued band-limited noise of shape ``(samples,)`` (`out` if
+        given).
 
     Notes
     -----
-    The method constructs a flat (unit-magnitude) spectrum on the frequency
-    bins whose absolute frequency falls within ``[min_freq, max_freq]``, assigns
-    random phases to the positive-frequency bins (excluding DC and Nyquist),
-    mirrors them to enforce Hermitian symmetry, and takes an inverse FFT.
+    The method constructs a flat (unit-magnitude) spectrum on the
+    non-negative frequency bins within ``[min_freq, max_freq]``, assigns
+    random phases to the positive-frequency bins (excluding DC and Nyquist)
+    and takes an inverse real FFT.
+
+    In chunked mode, the same band is realized as a Hann-windowed FIR filter
+    of about `chunk_size` taps applied to Gaussian white noise by overlap-add.
+    The white noise is scaled so that the variance equals that of the
+    single-FFT method. The band edges are then resolved to about
+    ``samplerate / chunk_size``. The filter start-up transient is discarded,
+    so the output is stationary from the first sample.
 
     Examples
     --------
@@ -613,16 +1226,86 @@ def band_limited_noise(
     nyq = samplerate / 2.0
     if max_freq > nyq + 1e-12:
         raise ValueError(f"`max_freq` must be <= Nyquist ({nyq}).")
+    if chunk_size is not None and chunk_size < 2:
+        raise ValueError("`chunk_size` must be an integer >= 2.")
+    dtype = _real_float_dtype(dtype)
+    if out is not None and (out.shape != (samples,) or out.dtype != dtype):
+        raise ValueError(f"`out` must be a {dtype} array of shape ({samples},).")
+    rng = np.random.default_rng() if rng is None else rng
 
-    # Construct a magnitude spectrum mask over the two-sided FFT grid
-    freqs = np.abs(np.fft.fftfreq(samples, d=1.0 / samplerate))
-    F = np.zeros(samples, dtype=complex)
+    # Unit-magnitude spectrum mask over the non-negative FFT bins
+    freqs = np.fft.rfftfreq(samples, d=1.0 / samplerate)
     band = (freqs >= min_freq) & (freqs <= max_freq)
-    F[band] = 1.0  # unit magnitude within the passband
 
-    # Randomize phases and synthesize the waveform
-    x = fftnoise(F, rng=rng)
-    return x
+    if chunk_size is None:
+        x = _rfftnoise(band, samples, rng, dtype, workers)
+        if out is None:
+            return x
+        out[...] = x
+        return out
+
+    if out is None:
+        out = np.empty(samples, dtype=dtype)
+
+    # Variance of the single-FFT synthesis: two-sided bin count / N^2
+    n_bins = 2 * np.count_nonzero(band) - band[0]
+    if samples % 2 == 0:
+        n_bins -= band[-1]
+    _overlap_add_noise(
+        min_freq, max_freq, samplerate, n_bins / samples**2, chunk_size, rng,
+        workers, out,
+    )
+    return out
+
+
+def _overlap_add_noise(
+    min_freq: float,
+    max_freq: float,
+    samplerate: float,
+    variance: float,
+    chunk_size: int,
+    rng: np.random.Generator,
+    workers: Optional[int],
+    out: np.ndarray,
+) -> None:
+    """Fills `out` with white noise band-passed by overlap-add FIR filtering."""
+    from scipy import fft as sp_fft
+    from scipy.signal import get_window
+
+    # Odd-length linear-phase FIR by frequency sampling of the band
+    numtaps = chunk_size - 1 + chunk_size % 2
+    mask = np.fft.rfftfreq(numtaps, d=1.0 / samplerate)
+    mask = ((mask >= min_freq) & (mask <= max_freq)).astype(float)
+    if not mask.any():
+        raise ValueError(
+            "The band is narrower than the frequency resolution "
+            f"samplerate / chunk_size (= {samplerate / chunk_size}); "
+            "increase `chunk_size`."
+        )
+    h = np.roll(np.fft.irfft(mask, n=numtaps), numtaps // 2)
+    h *= get_window("hann", numtaps, fftbins=False)
+    scale = np.sqrt(variance / np.sum(h**2))
+
+    nfft = sp_fft.next_fast_len(chunk_size + numtaps - 1, real=True)
+    H = sp_fft.rfft(h.astype(out.dtype), nfft, workers=workers)
+    white = np.empty(chunk_size, dtype=out.dtype)
+    carry = np.zeros(numtaps - 1, dtype=out.dtype)
+    # The first numtaps - 1 outputs only see part of the filter
+    skip = numtaps - 1
+    pos = 0
+    while pos < out.size:
+        rng.standard_normal(out=white, dtype=white.dtype)
+        white *= scale
+        y = sp_fft.irfft(sp_fft.rfft(white, nfft, workers=workers) * H, nfft,
+                         workers=workers)
+        y[: numtaps - 1] += carry
+        carry[:] = y[chunk_size : chunk_size + numtaps - 1]
+
+        block = y[min(skip, chunk_size) : chunk_size]
+        skip -= chunk_size - block.size
+        n = min(block.size, out.size - pos)
+        out[pos : pos + n] = block[:n]
+        pos += n
 
 
 def butter_lowpass(
@@ -0,0 +1,247 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2025, Miguel Dovale
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# This software may be subject to U.S. export control laws. By accepting this
+# software, the user agrees to comply with all applicable U.S. export laws and
+# regulations. User has the responsibility to obtain export licenses, or other
+# export authority as may be required before exporting such information to
+# foreign countries or providing access to foreign persons.
+#
+"""Runtime control of the threads used by speckit's compiled kernels.
+
+The Numba kernels in `speckit.core` run on Numba's thread pool. Its size can
+be changed at any time with `set_num_threads`, temporarily with the
+`num_threads` context manager, or per call through
+`SpectrumAnalyzer.compute(n_threads=...)`. When many analyses run in an
+outer process pool, use `threads_per_worker` and `init_worker` to split a
+total thread budget across the workers instead of oversubscribing cores.
+
+BLAS/OpenMP thread pools are limited as well, inside `num_threads` and in
+pool workers set up by `init_worker`, when the optional `threadpoolctl`
+package is installed (``pip install speckit[threads]``). Without it only the
+Numba kernels follow the thread budget and BLAS keeps its own default.
+`set_num_threads` changes Numba's setting only, so that the value it returns
+restores everything it changed.
+
+For process pools, `share_array` and `call_with_shared_array` place input data in
+`multiprocessing.shared_memory` so workers can read it without copies.
+"""
+import os
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+try:
+    import numba
+
+    _HAS_NUMBA = True
+except Exception:
+    _HAS_NUMBA = False
+
+try:
+    from threadpoolctl import threadpool_limits
+
+    _HAS_THREADPOOLCTL = True
+except Exception:
+    _HAS_THREADPOOLCTL = False
+
+
+def max_threads() -> int:
+    """Returns the largest thread count the kernels can use.
+
+    This is fixed when Numba starts its thread pool (`NUMBA_NUM_THREADS`,
+    which defaults to the number of CPUs).
+    """
+    if _HAS_NUMBA:
+        return int(numba.config.NUMBA_NUM_THREADS)
+    return 1
+
+
+def get_num_threads() -> int:
+    """Returns the number of threads currently used by the kernels."""
+    if _HAS_NUMBA:
+        return int(numba.get_num_threads())
+    return 1
+
+
+def set_num_threads(n: int) -> int:
+    """Sets the number of threads used by speckit's kernels.
+
+    BLAS/OpenMP thread pools are not changed; use the `num_threads` context
+    manager to limit them for a block of code.
+
+    Parameters
+    ----------
+    n : int
+        The desired number of threads. Values above `max_threads()` are
+        clipped to it.
+
+    Returns
+    -------
+    int
+        The previous number of threads, so it can be restored later.
+
+    Raises
+    ------
+    ValueError
+        If `n` is smaller than 1.
+    """
+    n = int(n)
+    if n < 1:
+        raise ValueError(f"Number of threads must be >= 1 (got {n}).")
+    previous = get_num_threads()
+    n = min(n, max_threads())
+    if _HAS_NUMBA:
+        numba.set_num_threads(n)
+    return previous
+
+
+@contextmanager
+def num_threads(n: Optional[int], *, blas: bool = True) -> Iterator[int]:
+    """Context manager that temporarily sets the number of kernel threads.
+
+    Parameters
+    ----------
+    n : int or None
+        The number of threads to use inside the block. If None, the current
+        setting is left unchanged.
+    blas : bool, optional
+        Also limit BLAS/OpenMP thread pools inside the block, restoring
+        their previous limits on exit. Requires `threadpoolctl`; without it
+        this has no effect. Defaults to True.
+
+    Yields
+    ------
+    int
+        The number of threads in effect inside the block.
+
+    Examples
+    --------
+    >>> with speckit.num_threads(4):
+    ...     result = speckit.compute_spectrum(x, fs)
+    """
+    if n is None:
+        yield get_num_threads()
+        return
+
+    n = int(n)
+    if n < 1:
+        raise ValueError(f"Number of threads must be >= 1 (got {n}).")
+    n = min(n, max_threads())
+    previous = get_num_threads()
+    blas_ctx = threadpool_limits(limits=n) if (blas and _HAS_THREADPOOLCTL) else None
+    try:
+        if _HAS_NUMBA:
+            numba.set_num_threads(n)
+        yield n
+    finally:
+        if _HAS_NUMBA:
+            numba.set_num_threads(previous)
+        if blas_ctx is not None:
+            blas_ctx.restore_original_limits()
+
+
+def threads_per_worker(n_workers: int, budget: Optional[int] = None) -> int:
+    """Splits a total thread budget evenly across the workers of a pool.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of concurrent workers (processes or threads) in the outer pool.
+    budget : int, optional
+        Total number of threads allowed across all workers. Defaults to the
+        number of CPUs.
+
+    Returns
+    -------
+    int
+        Threads each worker may use, at least 1.
+    """
+    if n_workers < 1:
+        raise ValueError(f"Number of workers must be >= 1 (got {n_workers}).")
+    if budget is None:
+        budget = os.cpu_count() or 1
+    return max(1, int(budget) // int(n_workers))
+
+
+def init_worker(n: int) -> None:
+    """Pool initializer that fixes the number of kernel threads in a worker.
+
+    BLAS/OpenMP thread pools of the worker process are limited to `n` as
+    well, for the lifetime of the worker, if `threadpoolctl` is installed.
+
+    Examples
+    --------
+    >>> from concurrent.futures import ProcessPoolExecutor
+    >>> k = speckit.threads_per_worker(8)
+    >>> pool = ProcessPoolExecutor(8, initializer=speckit.init_worker, initargs=(k,))
+    """
+    set_num_threads(n)
+    if _HAS_THREADPOOLCTL:
+        threadpool_limits(limits=int(n))
+
+
+# ---------- SHARED-MEMORY INPUT FOR PROCESS POOLS ----------
+def share_array(arr: np.ndarray) -> Tuple[shared_memory.SharedMemory, Dict[str, Any]]:
+    """Copies `arr` into a new shared-memory block.
+
+    Returns the owning `SharedMemory` object, which the caller must `close()`
+    and `unlink()` when done, and a small picklable spec that workers pass to
+    `call_with_shared_array` to map the same memory without copying.
+    """
+    arr = np.ascontiguousarray(arr)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, arr.nbytes))
+    view = np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)
+    view[...] = arr
+    del view
+    spec = {"name": shm.name, "shape": arr.shape, "dtype": arr.dtype.str}
+    return shm, spec
+
+
+def call_with_shared_array(spec: Dict[str, Any], func: Callable, *args, **kwargs) -> Any:
+    """Calls `func(arr, *args, **kwargs)` on a block created by `share_array`.
+
+    `arr` maps the shared memory read-only, without copying. It is only valid
+    during the call, so `func` must not return views of it.
+    """
+    shm = shared_memory.SharedMemory(name=spec["name"])
+    arr = np.ndarray(spec["shape"], dtype=np.dtype(spec["dtype"]), buffer=shm.buf)
+    arr.flags.writeable = False
+    try:
+        return func(arr, *args, **kwargs)
+    finally:
+        del arr
+        try:
+            shm.close()
+        except BufferError:
+            # A traceback still references views of `arr`; the mapping is
+            # released when the exception is collected.
+            pass
@@ -33,9 +33,10 @@
 # export authority as may be required before exporting such information to
 # foreign countries or providing access to foreign persons.
 #
+import functools
 import numpy as np
-import sympy as sp
 from speckit import compute_spectrum as ltf
+from speckit import compute_csd_matrix
 import logging
 
 logger = logging.getLogger(__name__)
@@ -87,6 +88,9 @@ def MISO_analytic_optimal_spectral_analysis(inputs, output, fs, **kwargs):
     optimal transfer functions between the inputs and the output, and estimates the
     amplitude spectral density (ASD) of the output with the influence of the inputs subtracted.
 
+    The symbolic solution only depends on the number of inputs; it is computed
+    once and cached in memory and on disk (see `_miso_analytic_solution`).
+
     Reference
     ---------
     Bendat, Piersol - "Engineering Applications of Correlation and Spectral Analysis"
@@ -133,6 +137,59 @@ def MISO_analytic_optimal_spectral_analysis(inputs, output, fs, **kwargs):
         )
 
     logger.info(f"Solving {q}-dimensional symbolic problem...")
+    arg_names, solution = _miso_analytic_solution(q)
+
+    logger.info("Computing all spectral estimates...")
+    frequencies, G = compute_csd_matrix([*inputs, output], fs, **kwargs)
+    result = {}
+    for i in range(q):
+        for j in range(q):
+            result[f"T{i + 1}{j + 1}"] = G[:, i, j]
+        result[f"S{i + 1}0"] = G[:, i, q]
+
+    logger.info("Computing solution...")
+    args = [result[name] for name in arg_names]
+    Hvec = np.empty((len(frequencies), q), dtype=complex)
+    for i in range(q):
+        try:
+            Hvec[:, i] = solution[f"H{i + 1}"](*args)
+        except Exception as e:
+            logger.error(f"Error during numerical computation for H{i + 1}: {e}")
+            raise
+
+    Tmat = G[:, :q, :q]
+    Svec = G[:, :q, q]
+    Sum1 = np.einsum("ki,ki->k", Hvec, Svec.conj())
+    Sum2 = Sum1.conj()
+    Sum3 = np.einsum("kj,kji,ki->k", Hvec.conj(), Tmat, Hvec)
+
+    # Compute optimal analysis (Equation 8.16, page 191):
+    optimal_asd = np.abs(np.sqrt(G[:, q, q] - Sum1 - Sum2 + Sum3))
+
+    logger.info("Done.")
+
+    return frequencies, optimal_asd
+
+
+@functools.lru_cache(maxsize=None)
+def _miso_analytic_solution(q):
+    """
+    Symbolic optimal transfer functions for `q` inputs, compiled to NumPy.
+
+    Solving the system symbolically is by far the most expensive step of the
+    analytic method, and it only depends on `q`. The solution is therefore
+    cached in memory for the lifetime of the process. It is deliberately not
+    stored on disk: loading a pickled (or `sympify`-parsed) expression from
+    a shared cache directory would execute whatever code that file holds.
+
+    Returns
+    -------
+    list of str
+        Names of the spectral estimates the functions take, in order.
+    dict
+        Maps "H1", "H2", ... to vectorized functions of those estimates.
+    """
+    import sympy as sp
 
     # Automatically generate symbolic elements for the vector of CSDs between inputs and outout, Sj0:
     Svec = sp.Matrix([sp.Symbol(f"S{i}0") for i in range(1, q + 1)])
@@ -149,64 +206,16 @@ def MISO_analytic_optimal_spectral_analysis(inputs, output, fs, **kwargs):
     eqns = [Svec[i] - sum(Tmat[i, j] * Hvec[j] for j in range(q)) for i in range(q)]
 
     # Solve the system symbolically:
-    solution = sp.solve(eqns, Hvec)
+    solution = {str(H): expr for H, expr in sp.solve(eqns, Hvec).items()}
 
     logger.info(f"Solution: {solution}")
-    logger.info("Computing all spectral estimates...")
-    result = {}
-    for i in range(q):
-        for j in range(i + 1, q):
-            obj = ltf([inputs[i], inputs[j]], fs, **kwargs)
-            result.setdefault(f"T{i + 1}{j + 1}", obj.Gxy)
-            result.setdefault(f"T{j + 1}{i + 1}", np.conj(obj.Gxy))
-            result.setdefault(f"T{i + 1}{i + 1}", obj.Gxx)
-            result.setdefault(f"T{j + 1}{j + 1}", obj.Gyy)
 
-    for i in range(q):
-        obj = ltf([inputs[i], output], fs, **kwargs)
-        result[f"S{i + 1}0"] = obj.Gxy
-        result[f"S0{i + 1}"] = np.conj(obj.Gxy)
-
-    result["S00"] = obj.Gyy
-    result["f"] = obj.f
-
-    logger.info("Computing solution...")
-    for Hi_symbol, Hi_expr in solution.items():
-        try:
-            # Convert the symbolic expression to a numerical lambda function
-            # Pass keys from `result` as symbols for substitution
-            Hi_numeric_func = sp.lambdify(list(result.keys()), Hi_expr, modules="numpy")
-
-            # Evaluate the numerical function using the numpy arrays in `result`
-            Hi_numeric_value = Hi_numeric_func(*result.values())
-
-            # Store the evaluated numerical value in the result dictionary
-            result[str(Hi_symbol)] = np.asarray(Hi_numeric_value, dtype=complex)
-
-        except Exception as e:
-            logger.error(f"Error during numerical computation for {Hi_symbol}: {e}")
-            raise
-
-    Sum1 = np.array([0] * len(result["f"]), dtype=complex)
-    Sum2 = np.array([0] * len(result["f"]), dtype=complex)
-    Sum3 = np.array([0] * len(result["f"]), dtype=complex)
-    for i in range(q):
-        Sum1 += result[f"H{i + 1}"] * result[f"S0{i + 1}"]
-        Sum2 += np.conj(result[f"H{i + 1}"]) * result[f"S{i + 1}0"]
-        for j in range(q):
-            Sum3 += (
-                np.conj(result[f"H{j + 1}"])
-                * result[f"H{i + 1}"]
-                * result[f"T{j + 1}{i + 1}"]
-            )
-
-    # Compute optimal analysis (Equation 8.16, page 191):
-    result["optimal_asd"] = np.abs(np.sqrt(result["S00"] - Sum1 - Sum2 + Sum3))
-
-    logger.info("Done.")
-
-    # return result
-    return result["f"], result["optimal_asd"]
+    args = list(Tmat) + list(Svec)
+    funcs = {
+        name: sp.lambdify(args, expr, modules="numpy")
+        for name, expr in solution.items()
+    }
+    return [str(arg) for arg in args], funcs
 
 
 def MISO_numeric_optimal_spectral_analysis(inputs, output, fs, **kwargs):
@@ -259,59 +268,21 @@ def MISO_numeric_optimal_spectral_analysis(inputs, output, fs, **kwargs):
 
     logger.info(f"Solving {q}-dimensional problem...")
 
-    # Dictionary to cache results of ltf calls:
-    result = {}
+    logger.info("Computing the cross-spectral matrix of all channels...")
+    frequencies, G = compute_csd_matrix([*inputs, output], fs, **kwargs)
 
-    def get_ltf_result(key, *args, **kwargs):
-        """Helper function to retrieve or compute ltf result."""
-        if key not in result:
-            obj = ltf(*args, **kwargs)
-            result[key] = obj
-        return result[key]
-
-    logger.info("Computing the auto-spectrum of the output...")
-    obj = get_ltf_result("S00", output, fs, **kwargs)
-    S00 = obj.Gxx
-    frequencies = obj.f
-    nf = obj.nf
-
-    # Prepare data for solving the linear system:
-    Tmat = np.zeros((q, q, nf), dtype=complex)  # Coherence matrix of inputs
-    Svec = np.zeros(
-        (q, nf), dtype=complex
-    )  # Cross-spectral densities of inputs and output
-
-    logger.info("Computing all other spectral estimates...")
-    for i in range(q):
-        for j in range(i + 1, q):
-            obj = get_ltf_result(
-                f"T{i + 1}{j + 1}", [inputs[i], inputs[j]], fs, **kwargs
-            )
-            if not np.any(Tmat[i, j, :]):
-                Tmat[i, j, :] = obj.Gxy
-            if not np.any(Tmat[j, i, :]):
-                Tmat[j, i, :] = np.conj(obj.Gxy)
-            if not np.any(Tmat[i, i, :]):
-                Tmat[i, i, :] = obj.Gxx
-            if not np.any(Tmat[j, j, :]):
-                Tmat[j, j, :] = obj.Gyy
-
-        obj = get_ltf_result(f"S{i + 1}0", [inputs[i], output], fs, **kwargs)
-        Svec[i, :] = obj.Gxy
+    Tmat = G[:, :q, :q]  # Cross-spectral matrix of the inputs, (nf, q, q)
+    Svec = G[:, :q, q]  # Cross-spectral densities of inputs and output, (nf, q)
+    S00 = G[:, q, q]  # Auto-spectrum of the output
 
     logger.info("Computing solution...")
-    # Solve for the optimal transfer functions numerically:
-    Hvec = np.zeros((q, nf), dtype=complex)
-    for k in range(nf):
-        Hvec[:, k] = np.linalg.solve(Tmat[:, :, k], Svec[:, k])
+    # Solve all the per-frequency systems Tmat @ H = Svec at once:
+    Hvec = np.linalg.solve(Tmat, Svec[..., None])[..., 0]
 
     # Compute the optimal spectral density
-    Sum1 = np.sum(Hvec * Svec.conj(), axis=0)
-    Sum2 = np.sum(Hvec.conj() * Svec, axis=0)
-    Sum3 = np.zeros(nf, dtype=complex)
-    for i in range(q):
-        for j in range(q):
-            Sum3 += Hvec[j, :].conj() * Hvec[i, :] * Tmat[j, i, :]
+    Sum1 = np.einsum("ki,ki->k", Hvec, Svec.conj())
+    Sum2 = Sum1.conj()
+    Sum3 = np.einsum("kj,kji,ki->k", Hvec.conj(), Tmat, Hvec)
 
     # Compute optimal analysis (Equation 8.16, page 191):
     optimal_asd = np.abs(np.sqrt(S00 - Sum1 - Sum2 + Sum3))
@@ -319,3 +290,116 @@ def MISO_numeric_optimal_spectral_analysis(inputs, output, fs, **kwargs):
     logger.info("Done.")
 
     return frequencies, optimal_asd
+
+
+def MISO_coherence_analysis(inputs, output, fs, **kwargs):
+    """
+    Multiple-input coherence analysis of a Multiple-Input Single-Output (MISO) system.
+
+    All quantities are derived from a single cross-spectral matrix of the inputs
+    and the output (see `speckit.compute_csd_matrix`), and are evaluated for every
+    input and frequency at once with batched linear algebra.
+
+    Reference
+    ---------
+    Bendat, Piersol - "Engineering Applications of Correlation and Spectral Analysis"
+    Section 8.1: Multiple Input/Output Systems
+    ISBN: 978-0-471-57055-4
+    https://archive.org/details/engineeringappli0000bend
+
+    Parameters
+    ----------
+    inputs : array-like
+        List of multiple input time series signals.
+
+    output : array-like
+        The output time series signal.
+
+    fs : float
+        Sampling frequency of the input and output time series.
+
+    **kwargs : dict, optional
+        Additional keyword arguments passed to `compute_csd_matrix`.
+
+    Returns
+    -------
+    dict
+        With the number of frequencies `nf` and of inputs `q`:
+
+        - "f": Fourier frequencies, shape (nf,).
+        - "Gyy": PSD of the output, shape (nf,).
+        - "H": optimal transfer functions from each input to the output, with
+          the other inputs accounted for, shape (nf, q). Same convention as
+          `SpectrumResult.Hxy`.
+        - "coh": ordinary coherence of each input with the output, shape (nf, q).
+        - "multiple_coh": multiple coherence of the output with all inputs,
+          shape (nf,).
+        - "partial_coh": partial coherence of each input with the output,
+          conditioned on the other inputs, shape (nf, q).
+        - "GyyRx": conditioned output spectrum, i.e. the output PSD with the
+          linear contribution of all inputs removed, shape (nf,).
+        - "Gxx_conditioned": PSD of each input conditioned on the other
+          inputs, shape (nf, q).
+    """
+    q = len(inputs)
+
+    N = len(inputs[0])
+    for input in inputs:
+        if len(input) != N:
+            raise ValueError("All input time series must be of equal length")
+    if len(output) != N:
+        raise ValueError(
+            "The output time series must have the same length as the inputs"
+        )
+
+    logger.info(f"Computing the cross-spectral matrix of {q + 1} channels...")
+    frequencies, G = compute_csd_matrix([*inputs, output], fs, **kwargs)
+
+    logger.info("Computing coherence functions...")
+    result = _miso_coherences(G)
+    result["f"] = frequencies
+
+    logger.info("Done.")
+
+    return result
+
+
+def _miso_coherences(G):
+    """
+    Coherence functions and conditioned spectra from a stack of CSD matrices.
+
+    `G` has shape (nf, q + 1, q + 1) with the output as the last channel, in the
+    convention of `compute_csd_matrix` (``G[:, a, b]`` is the `Gxy` of channels
+    `a` and `b`). Conditioning on a set of channels is read off the inverse of the
+    spectral matrix: for `P = inv(G)`, the spectrum of channel `a` conditioned on
+    all the others is ``1 / P[a, a]``, and the partial coherence of channels `a`
+    and `b` given the rest is ``|P[a, b]|**2 / (P[a, a] * P[b, b])``.
+    """
+    q = G.shape[-1] - 1
+    Gdiag = np.real(np.diagonal(G, axis1=1, axis2=2))  # (nf, q + 1)
+    Gxx, Gyy = Gdiag[:, :q], Gdiag[:, q]
+    Tmat, Svec = G[:, :q, :q], G[:, :q, q]
+
+    # Optimal transfer functions, Tmat @ conj(H) = Svec (see MISO_numeric...)
+    H = np.linalg.solve(Tmat, Svec[..., None])[..., 0].conj()
+
+    coh = np.abs(Svec) ** 2 / (Gxx * Gyy[:, None])
+
+    P = np.linalg.inv(G)
+    Pdiag = np.real(np.diagonal(P, axis1=1, axis2=2))
+    GyyRx = 1.0 / Pdiag[:, q]
+    multiple_coh = 1.0 - GyyRx / Gyy
+    partial_coh = np.abs(P[:, :q, q]) ** 2 / (Pdiag[:, :q] * Pdiag[:, q, None])
+    Gxx_conditioned = 1.0 / np.real(
+        np.diagonal(np.linalg.inv(Tmat), axis1=1, axis2=2)
+    )
+
+    return {
+        "Gyy": Gyy,
+        "H": H,
+        "coh": coh,
+        "multiple_coh": multiple_coh,
+        "partial_coh": partial_coh,
+        "GyyRx": GyyRx,
+        "Gxx_conditioned": Gxx_conditioned,
+    }
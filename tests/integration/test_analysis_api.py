@@ -35,7 +35,13 @@
 #
 import pytest
 import numpy as np
-from speckit import compute_spectrum, SpectrumAnalyzer, SpectrumResult
+from speckit import (
+    compute_spectrum,
+    compute_csd_matrix,
+    SpectrumAnalyzer,
+    SpectrumResult,
+)
+from speckit import dsp
 from speckit.flattop import HFT95
 from matplotlib.figure import Figure
 from matplotlib.axes import Axes
@@ -121,4 +127,172 @@ def test_spectrum_result_plotting(siso_data):
     result_auto = compute_spectrum(params["input"], fs=params["fs"])
     fig_asd, ax_asd = result_auto.plot(which="asd", errors=True)
     assert isinstance(fig_asd, Figure)
-    assert isinstance(ax_asd, Axes)
\ No newline at end of file
+    assert isinstance(ax_asd, Axes)
+
+def test_merge_stats_matches_pooled_statistics():
+    """Chan's merge of two segment sets equals the statistics of their union."""
+    from speckit.core import _merge_stats
+
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=50) + 1j * rng.normal(size=50)
+    Y = rng.normal(size=50) + 1j * rng.normal(size=50)
+    XY = np.conj(X) * Y
+
+    def stats(sl):
+        return (
+            XY[sl].size,
+            np.mean(np.abs(X[sl]) ** 2),
+            np.mean(np.abs(Y[sl]) ** 2),
+            np.mean(XY[sl]),
+            np.var(XY[sl]),
+        )
+
+    n, XX, YY, mxy, M2 = _merge_stats(*stats(slice(0, 13)), *stats(slice(13, 50)))
+    n_ref, XX_ref, YY_ref, mxy_ref, M2_ref = stats(slice(0, 50))
+    assert n == n_ref
+    assert XX == pytest.approx(XX_ref, rel=1e-12)
+    assert YY == pytest.approx(YY_ref, rel=1e-12)
+    assert mxy == pytest.approx(mxy_ref, rel=1e-12)
+    assert M2 == pytest.approx(M2_ref, rel=1e-12)
+
+
+def test_spectrum_result_merge(siso_data):
+    """Merging chunk results pools their averages and is associative."""
+    params = siso_data
+    data = np.vstack([params["input"], params["output"]])
+    chunks = np.split(data[:, : 3 * 30000], 3, axis=1)
+    results = [compute_spectrum(c, fs=params["fs"], Jdes=100) for c in chunks]
+    a, b, c = results
+
+    merged = a.merge(b, c)
+    assert merged.iscsd
+    np.testing.assert_array_equal(merged.navg, a.navg + b.navg + c.navg)
+    np.testing.assert_allclose(merged.Gxx, (a.Gxx + b.Gxx + c.Gxx) / 3, rtol=1e-12)
+    np.testing.assert_allclose(merged.Gxy, (a.Gxy + b.Gxy + c.Gxy) / 3, rtol=1e-12)
+
+    other_order = a.merge(b).merge(c)
+    np.testing.assert_allclose(other_order.M2, merged.M2, rtol=1e-12)
+
+    state = merged.state
+    np.testing.assert_allclose(
+        state["sum_XX"], a.state["sum_XX"] + b.state["sum_XX"] + c.state["sum_XX"]
+    )
+    # More averages -> smaller normalized random error
+    assert np.all(merged.Gxx_error < a.Gxx_error)
+
+
+def test_spectrum_result_merge_rejects_incompatible(siso_data):
+    params = siso_data
+    a = compute_spectrum(params["input"][:20000], fs=params["fs"], Jdes=100)
+    b = compute_spectrum(params["input"][:30000], fs=params["fs"], Jdes=100)
+    with pytest.raises(ValueError):
+        a.merge(b)
+
+
+def test_spectrum_result_compute_all(siso_data, short_white_noise_data):
+    """
+    Tests bulk evaluation of derived quantities and the DataFrame export.
+    """
+    params = siso_data
+    data_stack = np.vstack([params["input"], params["output"]])
+    csd = compute_spectrum(data_stack, fs=params["fs"], Jdes=100, Kdes=20)
+
+    values = csd.compute_all()
+    assert "coh" in values and "cf_deg_unwrapped" in values
+    assert "psd" not in values
+    for name, value in values.items():
+        assert value is getattr(csd, name)
+
+    subset = csd.compute_all(["coh", "navg"])
+    assert list(subset) == ["coh", "navg"]
+    with pytest.raises(ValueError):
+        csd.compute_all(["not_a_quantity"])
+    with pytest.raises(AttributeError):
+        csd.not_a_quantity
+
+    df = csd.to_dataframe()
+    assert df.index.name == "f"
+    assert set(values) <= set(df.columns)
+    np.testing.assert_array_equal(df["Hxy_dev"].to_numpy(), csd.Hxy_dev)
+
+    params = short_white_noise_data
+    auto = compute_spectrum(params["data"], fs=params["fs"], Jdes=100, Kdes=20)
+    values = auto.compute_all()
+    assert "asd" in values and "coh" not in values
+    assert auto.G is auto.psd
+    np.testing.assert_array_equal(auto.Gyy_error, auto.Gxx_error)
+
+
+def test_spectrum_result_get_measurements(siso_data):
+    """
+    Tests batched interpolation against `np.interp`.
+    """
+    params = siso_data
+    data_stack = np.vstack([params["input"], params["output"]])
+    result = compute_spectrum(data_stack, fs=params["fs"], Jdes=100, Kdes=20)
+    f = result.f
+    freqs = np.concatenate(
+        [[f[0] / 2, f[0], f[-1], 2 * f[-1]], np.geomspace(f[0], f[-1], 50)]
+    )
+
+    values = result.get_measurements(freqs, ["Gxx", "Hxy"])
+    expected = np.interp(freqs, f, result.Gxx)
+    np.testing.assert_allclose(values["Gxx"], expected, rtol=1e-12)
+    expected = np.interp(freqs, f, result.Hxy.real) + 1j * np.interp(
+        freqs, f, result.Hxy.imag
+    )
+    np.testing.assert_allclose(values["Hxy"], expected, rtol=1e-12, atol=1e-15)
+    assert np.isscalar(result.get_measurement(f[3], "coh"))
+
+    # Log-log interpolation passes through the grid points geometrically
+    loglog = result.get_measurements(freqs, ["Gxx"], loglog=True)["Gxx"]
+    np.testing.assert_allclose(loglog[1:3], result.Gxx[[0, -1]], rtol=1e-12)
+    mid = np.sqrt(f[10] * f[11])
+    expected = np.sqrt(result.Gxx[10] * result.Gxx[11])
+    value = result.get_measurements(mid, ["Gxx"], loglog=True)["Gxx"]
+    np.testing.assert_allclose(value, expected)
+
+    with pytest.raises(ValueError):
+        result.get_measurements(freqs, ["psd"])
+
+
+def test_spectrum_result_band_powers(short_white_noise_data, siso_data):
+    """
+    Tests band powers and RMS against direct integration.
+    """
+    params = short_white_noise_data
+    result = compute_spectrum(params["data"], fs=params["fs"], Jdes=200, Kdes=20)
+    f = result.f
+    bands = np.column_stack([f[[0, 10, 50]], f[[-1, 40, 120]]])
+    expected = [dsp.integral_rms(f, result.asd, band) ** 2 for band in bands]
+    np.testing.assert_allclose(result.band_powers(bands), expected, rtol=1e-12)
+    assert result.get_rms() == pytest.approx(dsp.integral_rms(f, result.asd))
+
+    params = siso_data
+    data_stack = np.vstack([params["input"], params["output"]])
+    csd = compute_spectrum(data_stack, fs=params["fs"], Jdes=100, Kdes=20)
+    assert csd.band_powers(bands[0], which="Gyy") > 0
+    with pytest.raises(ValueError):
+        csd.band_powers(bands, which="Hxy")
+
+
+@pytest.mark.parametrize("order", [-1, 0, 1])
+def test_compute_csd_matrix_matches_pairwise(siso_data, order):
+    """
+    Tests that the single-pass CSD matrix agrees with pairwise estimates.
+    """
+    params = siso_data
+    x, y = params["input"], params["output"]
+    z = np.random.default_rng(0).normal(size=len(x)) + 0.5 * x
+    f, G = compute_csd_matrix([x, y, z], fs=params["fs"], Jdes=100, order=order)
+    assert G.shape == (len(f), 3, 3)
+    np.testing.assert_allclose(G, np.conj(np.swapaxes(G, 1, 2)))
+
+    for a, b, (u, v) in [(0, 1, (x, y)), (2, 0, (z, x))]:
+        pair = compute_spectrum(
+            np.vstack([u, v]), fs=params["fs"], Jdes=100, order=order
+        )
+        np.testing.assert_allclose(f, pair.f)
+        scale = np.sqrt(pair.Gxx * pair.Gyy)
+        np.testing.assert_allclose(G[:, a, b] / scale, pair.Gxy / scale, atol=1e-6)
+        np.testing.assert_allclose(G[:, a, a].real, pair.Gxx, rtol=1e-6)
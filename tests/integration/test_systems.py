@@ -0,0 +1,152 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2025, Miguel Dovale
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# This software may be subject to U.S. export control laws. By accepting this
+# software, the user agrees to comply with all applicable U.S. export laws and
+# regulations. User has the responsibility to obtain export licenses, or other
+# export authority as may be required before exporting such information to
+# foreign countries or providing access to foreign persons.
+#
+# tests/integration/test_systems.py
+
+import pytest
+import numpy as np
+
+from speckit import compute_spectrum, systems
+
+
+@pytest.fixture(scope="module")
+def miso_fixture():
+    """
+    Output made of three correlated inputs plus white noise of known PSD.
+    """
+    fs = 10.0
+    N = int(1e5)
+    rng = np.random.default_rng(seed=7)
+    common = rng.normal(size=N)
+    inputs = [common + rng.normal(size=N) for _ in range(3)]
+    noise_std = 0.2
+    output = (
+        0.5 * inputs[0]
+        - 1.5 * np.roll(inputs[1], 1)
+        + 2.0 * inputs[2]
+        + noise_std * rng.normal(size=N)
+    )
+    return {
+        "fs": fs,
+        "inputs": inputs,
+        "output": output,
+        "asd_residual_true": np.sqrt(2.0 * noise_std**2 / fs),
+    }
+
+
+def test_miso_numeric_recovers_residual(miso_fixture):
+    params = miso_fixture
+    f, asd = systems.MISO_numeric_optimal_spectral_analysis(
+        params["inputs"],
+        params["output"],
+        params["fs"],
+        Jdes=200,
+        band=(0.05, 4.0),
+    )
+    assert len(f) == len(asd)
+    assert np.median(asd) == pytest.approx(params["asd_residual_true"], rel=0.05)
+
+
+def test_miso_numeric_single_input(miso_fixture):
+    params = miso_fixture
+    f, asd = systems.MISO_numeric_optimal_spectral_analysis(
+        params["inputs"][:1],
+        params["output"],
+        params["fs"],
+        Jdes=100,
+        band=(0.05, 4.0),
+    )
+    # With one input the residual is the conditioned spectrum (1 - coh) * Gyy
+    csd = compute_spectrum(
+        np.vstack([params["inputs"][0], params["output"]]),
+        params["fs"],
+        Jdes=100,
+        band=(0.05, 4.0),
+    )
+    np.testing.assert_allclose(f, csd.f)
+    np.testing.assert_allclose(asd**2, csd.GyyRx, rtol=1e-6)
+
+
+def test_miso_analytic_matches_numeric(miso_fixture):
+    pytest.importorskip("sympy")
+    systems._miso_analytic_solution.cache_clear()
+
+    params = miso_fixture
+    args = (params["inputs"][:2], params["output"], params["fs"])
+    kwargs = dict(Jdes=100, band=(0.05, 4.0))
+    f, asd = systems.MISO_analytic_optimal_spectral_analysis(*args, **kwargs)
+    _, asd_numeric = systems.MISO_numeric_optimal_spectral_analysis(*args, **kwargs)
+    np.testing.assert_allclose(asd, asd_numeric, rtol=1e-9)
+
+    # The symbolic solution is reused within the process
+    _, asd_cached = systems.MISO_analytic_optimal_spectral_analysis(*args, **kwargs)
+    np.testing.assert_array_equal(asd_cached, asd)
+    assert systems._miso_analytic_solution.cache_info().hits >= 1
+    systems._miso_analytic_solution.cache_clear()
+
+
+def test_miso_coherence_analysis(miso_fixture):
+    params = miso_fixture
+    kwargs = dict(Jdes=100, band=(0.05, 4.0))
+    result = systems.MISO_coherence_analysis(
+        params["inputs"], params["output"], params["fs"], **kwargs
+    )
+    nf, q = len(result["f"]), len(params["inputs"])
+    assert result["H"].shape == result["partial_coh"].shape == (nf, q)
+
+    # Known couplings are recovered despite the correlated inputs
+    np.testing.assert_allclose(
+        np.median(np.abs(result["H"]), axis=0), [0.5, 1.5, 2.0], rtol=0.05
+    )
+    _, asd = systems.MISO_numeric_optimal_spectral_analysis(
+        params["inputs"], params["output"], params["fs"], **kwargs
+    )
+    np.testing.assert_allclose(result["GyyRx"], asd**2, rtol=1e-9)
+    np.testing.assert_allclose(
+        result["multiple_coh"], 1 - result["GyyRx"] / result["Gyy"]
+    )
+    assert np.all(result["partial_coh"] <= 1 + 1e-12)
+
+    # With a single input everything reduces to the two-channel quantities
+    single = systems.MISO_coherence_analysis(
+        params["inputs"][:1], params["output"], params["fs"], **kwargs
+    )
+    csd = compute_spectrum(
+        np.vstack([params["inputs"][0], params["output"]]), params["fs"], **kwargs
+    )
+    np.testing.assert_allclose(single["H"][:, 0], csd.Hxy, rtol=1e-6)
+    np.testing.assert_allclose(single["multiple_coh"], csd.coh, rtol=1e-6)
+    np.testing.assert_allclose(single["partial_coh"][:, 0], csd.coh, rtol=1e-6)
+    np.testing.assert_allclose(single["GyyRx"], csd.GyyRx, rtol=1e-6)
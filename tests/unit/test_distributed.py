@@ -0,0 +1,163 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2025, Miguel Dovale
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# This software may be subject to U.S. export control laws. By accepting this
+# software, the user agrees to comply with all applicable U.S. export laws and
+# regulations. User has the responsibility to obtain export licenses, or other
+# export authority as may be required before exporting such information to
+# foreign countries or providing access to foreign persons.
+#
+import os
+
+import numpy as np
+import pytest
+
+import speckit
+from speckit.distributed import (
+    SpectrumExecutor,
+    LocalSubprocessExecutor,
+    data_source,
+    open_source,
+    run_task,
+)
+
+
+class InProcessExecutor(SpectrumExecutor):
+    """Minimal protocol implementation that keeps track of the tasks it sees."""
+
+    def __init__(self, scratch_dir):
+        self.n_workers = 3
+        self.scratch_dir = str(scratch_dir)
+        self.tasks = []
+
+    def run(self, tasks):
+        self.tasks = list(tasks)
+        return [run_task(task) for task in tasks]
+
+
+def test_custom_executor_spills_and_cleans_up(short_white_noise_data, tmp_path):
+    params = short_white_noise_data
+    analyzer = speckit.SpectrumAnalyzer(params["data"], params["fs"], Jdes=100)
+    serial = analyzer.compute()
+
+    executor = InProcessExecutor(tmp_path)
+    result = analyzer.compute(executor=executor)
+
+    np.testing.assert_allclose(result.Gxx, serial.Gxx, rtol=1e-10)
+    # Tasks reference the data instead of carrying it, and together cover every bin
+    assert all("source" in t and "plan_slice" in t for t in executor.tasks)
+    covered = np.concatenate([t["plan_slice"]["i"] for t in executor.tasks])
+    np.testing.assert_array_equal(np.sort(covered), np.arange(serial.nf))
+    # The spilled copy of the input is removed afterwards
+    assert os.listdir(tmp_path) == []
+
+
+def test_data_source_references_memmap(tmp_path):
+    path = tmp_path / "x.npy"
+    x = np.random.default_rng(0).normal(size=(2, 100))
+    np.save(path, x)
+    mm = np.load(path, mmap_mode="r")
+    source = data_source(mm, None)
+    assert source["spilled"] is False
+    np.testing.assert_array_equal(open_source(source), x)
+
+
+def test_local_subprocess_executor_matches_serial(siso_data, tmp_path):
+    """The reference executor reads file-backed data in separate processes."""
+    params = siso_data
+    path = tmp_path / "siso.npy"
+    np.save(path, np.vstack([params["input"], params["output"]]))
+    data = np.load(path, mmap_mode="r")
+
+    analyzer = speckit.SpectrumAnalyzer(data, params["fs"], Jdes=100)
+    serial = analyzer.compute()
+    executor = LocalSubprocessExecutor(n_workers=2, scratch_dir=str(tmp_path))
+    result = analyzer.compute(executor=executor)
+
+    np.testing.assert_allclose(result.Gxx, serial.Gxx, rtol=1e-10)
+    np.testing.assert_allclose(result.Gyy, serial.Gyy, rtol=1e-10)
+    np.testing.assert_allclose(result.Gxy, serial.Gxy, rtol=1e-10)
+
+
+def test_data_source_sliced_and_strided_memmap(tmp_path):
+    """Slices of a memmap are located by their own byte offset in the file."""
+    path = tmp_path / "x.npy"
+    np.save(path, np.arange(200, dtype=np.float64))
+    mm = np.load(path, mmap_mode="r")
+
+    source = data_source(mm[50:60], None)
+    np.testing.assert_array_equal(open_source(source), np.arange(50, 60))
+
+    # Non-contiguous views cannot be mapped directly and are spilled
+    strided = mm[10:100:3]
+    with pytest.raises(ValueError):
+        data_source(strided, None)
+    source = data_source(strided, str(tmp_path))
+    assert source["spilled"] is True
+    np.testing.assert_array_equal(open_source(source), np.arange(10, 100, 3))
+
+
+def test_local_subprocess_executor_sliced_memmap(siso_data, tmp_path):
+    """A memmap slice (2 x N layout) is analysed at the right samples by workers."""
+    params = siso_data
+    stacked = np.vstack([params["input"], params["output"]])
+    path = tmp_path / "siso.npy"
+    # Pad with leading samples so the slice starts away from the file's data offset
+    n = stacked.shape[1]
+    padded = np.zeros((2, n + 500))
+    padded[:, 500:] = stacked
+    np.save(path, padded.T.copy())  # (N, 2) on disk
+    data = np.load(path, mmap_mode="r")[500:]
+
+    expected = speckit.SpectrumAnalyzer(stacked, params["fs"], Jdes=50).compute()
+    executor = LocalSubprocessExecutor(n_workers=2, scratch_dir=str(tmp_path))
+    result = speckit.SpectrumAnalyzer(data, params["fs"], Jdes=50).compute(
+        executor=executor
+    )
+    np.testing.assert_allclose(result.Gxx, expected.Gxx, rtol=1e-10)
+    np.testing.assert_allclose(result.Gyy, expected.Gyy, rtol=1e-10)
+    np.testing.assert_allclose(result.Gxy, expected.Gxy, rtol=1e-10)
+
+
+def test_local_subprocess_executor_scratch_dir_cleanup(tmp_path):
+    """Only a scratch directory created by the executor is removed on close."""
+    with LocalSubprocessExecutor() as executor:
+        owned = executor.scratch_dir
+        assert os.path.isdir(owned)
+    assert not os.path.exists(owned)
+    executor.close()  # Closing twice is harmless
+
+    executor = LocalSubprocessExecutor(scratch_dir=str(tmp_path))
+    executor.close()
+    assert os.path.isdir(tmp_path)
+
+    executor = LocalSubprocessExecutor()
+    owned = executor.scratch_dir
+    del executor
+    assert not os.path.exists(owned)
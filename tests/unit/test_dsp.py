@@ -36,12 +36,33 @@
 import pytest
 from pytest import approx
 import itertools
+import os
 
 import numpy as np
 import pandas as pd
 
 from speckit import dsp
 
+# --- Tests for band_powers ---
+
+def test_band_powers_matches_integral_rms():
+    """Tests prefix-sum band powers against per-band integration, also on stacks."""
+    rng = np.random.default_rng(3)
+    f = np.geomspace(1e-3, 10, 400)
+    psd = 1 / f + rng.uniform(0, 1, f.size)
+    bands = [(1e-3, 10), (0.01, 0.1), (0.5, 2.0), (3.0, 100.0)]
+
+    expected = [dsp.integral_rms(f, np.sqrt(psd), band) ** 2 for band in bands]
+    assert dsp.band_powers(f, psd, bands) == approx(expected, rel=1e-12)
+    assert dsp.band_powers(f, psd, bands[1]) == approx(expected[1], rel=1e-12)
+    # Bands with fewer than two frequencies carry no power
+    assert dsp.band_powers(f, psd, [(20.0, 30.0), (f[5], f[5])]) == approx([0, 0])
+
+    stacked = dsp.band_powers(f, np.stack([psd, 3 * psd]), bands)
+    assert stacked.shape == (2, len(bands))
+    assert stacked[1] == approx(3 * np.array(expected), rel=1e-12)
+
+
 # --- Tests for polynomial_detrend ---
 
 def test_polynomial_detrend():
@@ -114,6 +135,65 @@ def test_optimal_linear_combination_siso():
     assert np.std(residual) == pytest.approx(np.std(noise), rel=0.1)
 
 
+@pytest.mark.parametrize("domain, estimator", [
+    ("time", "welch"), ("frequency", "welch"), ("frequency", "lpsd"),
+])
+def test_optimal_linear_combination_fast_matches_direct(domain, estimator):
+    """Tests that the precomputed objective finds the same coefficients."""
+    rng = np.random.default_rng(seed=3)
+    x1, x2, noise = rng.normal(size=(3, 2000))
+    y = 1.5 * x1 - 0.5 * x2 + 0.1 * noise
+    df = pd.DataFrame({'x1': x1, 'x2': x2, 'y': y})
+    kwargs = {"Jdes": 50, "Kdes": 20} if estimator == "lpsd" else {"nperseg": 256}
+
+    fast, _ = dsp.optimal_linear_combination(
+        df, ['x1', 'x2'], 'y', domain=domain, estimator=estimator, **kwargs
+    )
+    direct, _ = dsp.optimal_linear_combination(
+        df, ['x1', 'x2'], 'y', domain=domain, estimator=estimator, fast=False, **kwargs
+    )
+    assert fast.x == pytest.approx([-1.5, 0.5], rel=0.02)
+    assert fast.x == pytest.approx(direct.x, abs=1e-3)
+    assert fast.fun == pytest.approx(direct.fun, rel=1e-4)
+
+
+@pytest.mark.parametrize("domain", ["time", "frequency"])
+def test_optimal_linear_combination_timeshift(domain):
+    """Tests that a fractional delay and gain are recovered."""
+    rng = np.random.default_rng(seed=2)
+    x = np.convolve(rng.normal(size=4000), np.hanning(16), "same")
+    y = -2.0 * dsp.timeshift(x, 0.6) + 0.01 * rng.normal(size=4000)
+    df = pd.DataFrame({'input': x, 'output': y})
+
+    res, residual = dsp.optimal_linear_combination(
+        df, ['input'], 'output', timeshifts=True, domain=domain
+    )
+    assert res.x == pytest.approx([0.6, 2.0], abs=0.01)
+    assert np.std(residual) < 0.05 * np.std(y)
+
+
+@pytest.mark.parametrize("domain", ["time", "frequency"])
+def test_optimal_linear_combination_timeshift_random_walk(domain):
+    """
+    Tests that fitting a delay on non-periodic (random-walk) data gives the
+    same result with the default `fast=True` as with the direct objective.
+    """
+    rng = np.random.default_rng(seed=0)
+    x = np.cumsum(rng.normal(size=4000))
+    y = -dsp.timeshift(x, 2.3) + 0.05 * rng.normal(size=4000)
+    df = pd.DataFrame({'input': x, 'output': y})
+
+    fast, fast_residual = dsp.optimal_linear_combination(
+        df, ['input'], 'output', timeshifts=True, domain=domain
+    )
+    direct, direct_residual = dsp.optimal_linear_combination(
+        df, ['input'], 'output', timeshifts=True, domain=domain, fast=False
+    )
+    assert fast.x == pytest.approx([2.3, 1.0], abs=0.01)
+    assert fast.x == pytest.approx(direct.x, abs=1e-6)
+    assert np.std(fast_residual) == pytest.approx(np.std(direct_residual), rel=1e-6)
+
+
 # BSD 3-Clause License
 #
 # Copyright (c) 2022, California Institute of Technology and
@@ -302,3 +382,352 @@ def test_variable_fractional_timeshift():
         assert np.all(
             shifted[valid_mask] == approx(func((times + shifts)[valid_mask], fs))
         )
+
+
+def test_variable_timeshift_matches_tap_matrix():
+    """Test the on-the-fly kernel against the explicit (N, 2 * halfp) tap matrix."""
+    rng = np.random.default_rng(5)
+    size = 3000
+    data = rng.normal(size=size)
+    shifts = rng.uniform(-40, 40, size=size)
+
+    for order in [1, 5, 31]:
+        halfp = (order + 1) // 2
+        shift_ints = np.floor(shifts).astype(int)
+        taps = dsp.lagrange_taps(shifts - shift_ints, halfp)
+        padded = np.pad(data, 2 * halfp)
+        starts = np.clip(np.arange(size) + shift_ints, -(halfp + 1), size + halfp - 1)
+        windows = np.lib.stride_tricks.sliding_window_view(padded, 2 * halfp)
+        expected = np.einsum("ij,ij->i", taps, windows[starts + halfp + 1])
+
+        assert dsp.timeshift(data, shifts, order=order) == approx(expected, abs=1e-12)
+        # Complex data goes through the blocked NumPy path
+        shifted = dsp.timeshift(data + 1j * data, shifts, order=order)
+        assert shifted.real == approx(expected, abs=1e-12)
+        assert shifted.imag == approx(expected, abs=1e-12)
+
+
+def test_constant_timeshift_fft_path():
+    """Test that large orders (FFT convolution) match the direct correlation."""
+    rng = np.random.default_rng(6)
+    data = rng.normal(size=5000)
+    order = 301
+    halfp = (order + 1) // 2
+    shift = 7.25
+    taps = dsp.lagrange_taps(np.array([0.25]), halfp)[0]
+    padded = np.pad(data, 2 * halfp, mode="edge")
+    start = 2 * halfp + 7 - (halfp - 1)
+    window = padded[start : start + data.size + 2 * halfp - 1]
+    expected = np.correlate(window, taps, "valid")
+    assert dsp.timeshift(data, shift, order=order) == approx(expected, abs=1e-10)
+
+
+def test_timeshifter_matches_timeshift():
+    """Test that TimeShifter reproduces timeshift for many constant shifts."""
+    rng = np.random.default_rng(7)
+    data = rng.normal(size=2000)
+    shifter = dsp.TimeShifter(data, order=31)
+    buf = np.empty_like(data)
+    for shift in [0.0, 3, -2, 0.4, -7.65, 25.1, 1500.3, -2500.0]:
+        expected = dsp.timeshift(data, shift, order=31)
+        assert shifter(shift) == approx(expected, abs=1e-12)
+        assert shifter(shift, out=buf) is buf
+        assert buf == approx(expected, abs=1e-12)
+
+
+def test_timeshifter_out_is_allocation_free():
+    """Test that shifting into a buffer does not allocate a data-sized temporary."""
+    import tracemalloc
+
+    data = np.random.default_rng(9).normal(size=100_000)
+    shifter = dsp.TimeShifter(data, order=31, max_shift=10)
+    buf = np.empty_like(data)
+    shifter(2.37, out=buf)  # Warm the taps cache
+    tracemalloc.start()
+    try:
+        shifter(2.37, out=buf)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert peak < data.nbytes // 10
+
+
+def test_timeshifter_resolution():
+    """Test that TimeShifter rounds fractional shifts to the given resolution."""
+    rng = np.random.default_rng(8)
+    data = rng.normal(size=1000)
+    shifter = dsp.TimeShifter(data, order=15, resolution=0.25)
+    expected = dsp.timeshift(data, 4.25, order=15)
+    assert shifter(4.26) == approx(expected, abs=1e-12)
+    with pytest.raises(ValueError):
+        dsp.TimeShifter(data, order=4)
+
+
+def test_constant_taps_cached():
+    """Test that constant-shift taps are cached and read-only."""
+    dsp._constant_taps.cache_clear()
+    taps = dsp._constant_taps(0.3, 8)
+    assert dsp._constant_taps(0.3, 8) is taps
+    assert dsp._constant_taps.cache_info().hits == 1
+    assert not taps.flags.writeable
+    assert taps == approx(dsp.lagrange_taps(np.array([0.3]), 8)[0])
+
+
+# --- Tests for multi_file_timeseries_loader ---
+
+def _write_timeseries(path, n, seed):
+    import gzip
+    import zipfile
+
+    rng = np.random.default_rng(seed)
+    rows = "\n".join(f"{i} {v:.9g}" for i, v in enumerate(rng.normal(size=n)))
+    text = f"# comment\n% comment\nidx value\n{rows}\n"
+    if path.endswith(".gz"):
+        with gzip.open(path, "wt") as f:
+            f.write(text)
+    elif path.endswith(".zip"):
+        with zipfile.ZipFile(path, "w") as z:
+            z.writestr("data.txt", text)
+    else:
+        with open(path, "w") as f:
+            f.write(text)
+    return text
+
+
+def test_multi_file_loader_formats_and_cache(tmp_path):
+    """Tests header detection across formats and reuse of the binary cache."""
+    files = [str(tmp_path / name) for name in ("a.txt", "b.gz", "c.zip")]
+    for seed, file in enumerate(files):
+        _write_timeseries(file, 500, seed)
+    cache_dir = str(tmp_path / "cache")
+
+    # The cache is opt-in
+    dsp.multi_file_timeseries_loader(files, [1.0, 1.0, 2.0], cache_dir=cache_dir)
+    assert not os.path.exists(cache_dir)
+
+    first = dsp.multi_file_timeseries_loader(
+        files, [1.0, 1.0, 2.0], start_time=5.0, cache=True, cache_dir=cache_dir
+    )
+    assert len(os.listdir(cache_dir)) == 3
+    assert list(first[0].columns) == ["idx", "value", "time"]
+    assert first[0]["idx"].iloc[0] == 5
+    assert first[2]["idx"].iloc[0] == 10
+    assert first[0]["time"].iloc[-1] == first[2]["time"].iloc[-1]
+
+    cached = dsp.multi_file_timeseries_loader(
+        files, [1.0, 1.0, 2.0], start_time=5.0, cache=True, cache_dir=cache_dir,
+        n_workers=1,
+    )
+    for a, b in zip(first, cached):
+        pd.testing.assert_frame_equal(a, b)
+
+    # Modified files are parsed again
+    _write_timeseries(files[0], 400, 9)
+    os.utime(files[0], ns=(0, 0))
+    updated = dsp.multi_file_timeseries_loader(
+        files[:1], [1.0], cache=True, cache_dir=cache_dir
+    )
+    assert len(updated[0]) == 400
+    assert len(os.listdir(cache_dir)) == 4
+
+
+def test_skip_header_rows_unseekable():
+    """Tests that the first data row is replayed on streams that cannot seek."""
+    import io
+
+    class Unseekable(io.BytesIO):
+        def seekable(self):
+            return False
+
+    count, stream = dsp._skip_header_rows(Unseekable(b"# a\n! b\nx y\n1 2\n"))
+    assert count == 2
+    assert stream.read() == b"x y\n1 2\n"
+
+
+@pytest.mark.parametrize("cache", [False, True])
+def test_multi_file_loader_range_reads(tmp_path, cache):
+    """Tests that range-restricted reads match slicing fully loaded files."""
+    files = [str(tmp_path / name) for name in ("a.gz", "b.txt")]
+    for seed, file in enumerate(files):
+        _write_timeseries(file, 3000, seed)
+    cache_dir = str(tmp_path / "cache")
+    if cache:
+        # Populate the cache with full reads
+        dsp.multi_file_timeseries_loader(files, [1.0, 2.0], cache=True, cache_dir=cache_dir)
+
+    options = dict(start_time=600.0, timeshifts=[2.5, -1.25], cache=cache, cache_dir=cache_dir)
+    ranged = dsp.multi_file_timeseries_loader(
+        files, [1.0, 2.0], duration_hours=0.1, **options
+    )
+    full = dsp.multi_file_timeseries_loader(files, [1.0, 2.0], **options)
+    for r, f in zip(ranged, full):
+        assert r["time"].iloc[0] == 600.0
+        assert r["time"].iloc[-1] == 960.0
+        data = [c for c in r.columns if c != "time"]
+        pd.testing.assert_frame_equal(r[data], f[data].iloc[: len(r)])
+
+
+def test_multi_file_loader_range_reads_populate_cache(tmp_path, monkeypatch):
+    """Tests that a ranged read fills the cache in the background and later
+    ranged reads use it."""
+    files = [str(tmp_path / name) for name in ("a.gz", "b.txt")]
+    for seed, file in enumerate(files):
+        _write_timeseries(file, 3000, seed)
+    cache_dir = str(tmp_path / "cache")
+    options = dict(start_time=600.0, duration_hours=0.1, cache=True, cache_dir=cache_dir)
+
+    opened = []
+    open_timeseries = dsp._open_timeseries
+
+    def counting_open(file):
+        opened.append(file)
+        return open_timeseries(file)
+
+    monkeypatch.setattr(dsp, "_open_timeseries", counting_open)
+    first = dsp.multi_file_timeseries_loader(files, [1.0, 2.0], **options)
+    dsp._wait_for_cache_fills()
+    assert len(os.listdir(cache_dir)) == 2
+    # One ranged parse and one background fill per file
+    assert sorted(opened) == sorted(files * 2)
+
+    def not_parsed(file):
+        raise AssertionError(f"{file} was parsed instead of read from the cache")
+
+    monkeypatch.setattr(dsp, "_open_timeseries", not_parsed)
+    second = dsp.multi_file_timeseries_loader(files, [1.0, 2.0], **options)
+    for a, b in zip(first, second):
+        pd.testing.assert_frame_equal(a, b)
+
+
+def test_skip_lines():
+    """Tests skipping lines across chunk boundaries."""
+    import io
+
+    stream = io.BytesIO(b"".join(b"%d\n" % i for i in range(100)))
+    rest = dsp._skip_lines(stream, 42, chunk_size=7)
+    assert (rest + stream.read()).startswith(b"42\n43\n")
+    assert dsp._skip_lines(io.BytesIO(b"1\n2\n"), 5) == b""
+
+
+# --- Tests for resample_to_common_grid ---
+
+def _sampled(fs, n, func, t0=0.0, name="x"):
+    t = t0 + np.arange(n) / fs
+    return pd.DataFrame({"time": t, name: func(t)})
+
+
+def test_resample_matches_np_interp():
+    """Tests that the vectorized linear resampler matches per-column np.interp."""
+    rng = np.random.default_rng(10)
+    a = pd.DataFrame({"time": np.arange(1000) / 10.0, "x": rng.normal(size=1000),
+                      "y": rng.normal(size=1000)})
+    b = pd.DataFrame({"time": 0.35 + np.arange(100), "x": rng.normal(size=100)})
+    out = dsp.resample_to_common_grid([a, b], fs=3.0)
+    # The first DataFrame wins on name conflicts
+    assert list(out.columns) == ["common_time", "time", "x", "y"]
+    t = out["common_time"].to_numpy()
+    for col in ["time", "x", "y"]:
+        assert out[col].to_numpy() == approx(np.interp(t, a["time"], a[col]), abs=1e-12)
+
+    out = dsp.resample_to_common_grid([a, b], fs=3.0, suffixes=True)
+    assert list(out.columns) == ["common_time", "time_1", "x_1", "y_1", "time_2", "x_2"]
+    assert out["x_2"].to_numpy() == approx(np.interp(t, b["time"], b["x"]), abs=1e-12)
+
+
+def test_resample_lagrange_order():
+    """Tests that Lagrange interpolation is more accurate than linear on smooth data."""
+    df = _sampled(10.0, 2000, lambda t: np.sin(2 * np.pi * 0.7 * t))
+    expected = lambda t: np.sin(2 * np.pi * 0.7 * t)
+    linear = dsp.resample_to_common_grid([df], fs=7.3)
+    lagrange = dsp.resample_to_common_grid([df], fs=7.3, order=15)
+    t = linear["common_time"].to_numpy()
+    inner = slice(20, -20)
+    err_linear = np.max(np.abs(linear["x"].to_numpy() - expected(t))[inner])
+    err_lagrange = np.max(np.abs(lagrange["x"].to_numpy() - expected(t))[inner])
+    assert err_lagrange < 1e-6 < err_linear
+    with pytest.raises(ValueError):
+        dsp.resample_to_common_grid([df], fs=7.3, order=4)
+
+
+def test_resample_antialias():
+    """Tests that anti-aliasing removes content above the new Nyquist frequency."""
+    fast = _sampled(100.0, 20000, lambda t: np.sin(2 * np.pi * 0.5 * t)
+                    + np.sin(2 * np.pi * 23.0 * t))
+    slow = _sampled(2.0, 400, np.cos, name="y")
+    aliased = dsp.resample_to_common_grid([fast, slow], fs=5.0)
+    clean = dsp.resample_to_common_grid([fast, slow], fs=5.0, antialias=True)
+    t = clean["common_time"].to_numpy()
+    inner = slice(50, -50)
+    target = np.sin(2 * np.pi * 0.5 * t)
+    assert np.max(np.abs(aliased["x"].to_numpy() - target)[inner]) > 0.5
+    assert np.max(np.abs(clean["x"].to_numpy() - target)[inner]) < 1e-3
+    # Time columns and slower streams are not filtered
+    assert clean["time"].to_numpy() == approx(t, abs=1e-9)
+    assert clean["y"].to_numpy() == approx(aliased["y"].to_numpy())
+
+
+# --- Tests for streaming resampling ---
+
+@pytest.mark.parametrize("up, down", [(1, 100), (3, 7), (7, 3), (1, 1)])
+def test_polyphase_resampler_matches_resample_poly(up, down):
+    """Tests that chunked streaming equals resampling the whole signal."""
+    from scipy.signal import resample_poly
+
+    rng = np.random.default_rng(11)
+    x = rng.normal(size=(5003, 2))
+    rs = dsp.PolyphaseResampler(up, down)
+    parts, i = [], 0
+    while i < len(x):
+        n = int(rng.integers(1, 700))
+        parts.append(rs.process(x[i : i + n]))
+        i += n
+    parts.append(rs.flush())
+    expected = resample_poly(x, up, down, axis=0)
+    assert np.concatenate(parts) == approx(expected, abs=1e-12)
+
+    rs.reset()
+    single = np.concatenate([rs.process(x[:, 0]), rs.flush()])
+    assert single == approx(expected[:, 0], abs=1e-12)
+
+
+def test_polyphase_resampler_from_rates():
+    rs = dsp.PolyphaseResampler.from_rates(10_000.0, 10.0)
+    assert (rs.up, rs.down) == (1, 1000)
+    rs = dsp.PolyphaseResampler.from_rates(100.0, 250.0)
+    assert (rs.up, rs.down) == (5, 2)
+    with pytest.raises(ValueError):
+        dsp.PolyphaseResampler.from_rates(np.pi, 1.0, max_denominator=100)
+
+
+def test_resample_streams():
+    """Tests streams at different rates converted to a common rate."""
+    f0, fs = 0.2, 2.0
+    t_fast = np.arange(100_000) / 1000.0
+    t_slow = np.arange(1000) / 10.0
+    fast = np.column_stack([np.sin(2 * np.pi * f0 * t_fast),
+                            np.sin(2 * np.pi * 300.0 * t_fast)])
+    slow = np.cos(2 * np.pi * f0 * t_slow)
+    chunks = (slow[i : i + 64] for i in range(0, slow.size, 64))
+
+    out = dsp.resample_streams([fast, chunks], [1000.0, 10.0], fs, chunk_size=4096)
+    assert out.shape == (3, 200)
+    t = np.arange(200) / fs
+    inner = slice(20, -20)
+    assert out[0, inner] == approx(np.sin(2 * np.pi * f0 * t)[inner], abs=1e-3)
+    assert out[1, inner] == approx(0.0, abs=1e-3)  # Above Nyquist, filtered
+    assert out[2, inner] == approx(np.cos(2 * np.pi * f0 * t)[inner], abs=1e-3)
+
+    buf = np.zeros((3, 250))
+    view = dsp.resample_streams([fast, slow], [1000.0, 10.0], fs, out=buf)
+    assert np.shares_memory(view, buf)
+    assert view == approx(out)
+
+    # Without array streams the output length is not known in advance
+    chunked = [(fast[i : i + 1000] for i in range(0, len(fast), 1000)),
+               (slow[i : i + 64] for i in range(0, slow.size, 64))]
+    grown = dsp.resample_streams(chunked, [1000.0, 10.0], fs, chunk_size=16)
+    assert grown == approx(out)
+    with pytest.raises(ValueError):
+        dsp.resample_streams([fast], [1000.0, 10.0], fs)
+    with pytest.raises(ValueError):
+        dsp.resample_streams([fast, slow], [1000.0, 10.0], fs, out=np.zeros((3, 100)))
@@ -0,0 +1,138 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2025, Miguel Dovale
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# This software may be subject to U.S. export control laws. By accepting this
+# software, the user agrees to comply with all applicable U.S. export laws and
+# regulations. User has the responsibility to obtain export licenses, or other
+# export authority as may be required before exporting such information to
+# foreign countries or providing access to foreign persons.
+#
+import os
+
+import numpy as np
+import pytest
+
+from speckit import SpectrumAnalyzer, SpectrumResult, compute_spectrum
+from speckit.io import (
+    load_plan, load_table, pack_ragged, save_plan, save_table, unpack_ragged,
+)
+
+
+def test_pack_ragged_roundtrip():
+    rows = [np.array([0, 5, 10]), np.array([0]), np.array([], dtype=int)]
+    values, offsets = pack_ragged(rows)
+    assert values.dtype == np.int32
+    assert list(offsets) == [0, 3, 4, 4]
+    for a, b in zip(unpack_ragged(values, offsets), rows):
+        np.testing.assert_array_equal(a, b)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+@pytest.mark.parametrize("compress", [False, True])
+def test_result_save_load(siso_data, tmp_path, mmap, compress):
+    params = siso_data
+    data_stack = np.vstack([params["input"], params["output"]])
+    result = compute_spectrum(data_stack, fs=params["fs"], Jdes=100, Kdes=20)
+    path = tmp_path / "result.npz"
+    result.save(path, compress=compress)
+
+    loaded = SpectrumResult.load(path, mmap=mmap)
+    assert loaded.iscsd and loaded.fs == result.fs
+    assert isinstance(loaded.XX, np.memmap) == (mmap and not compress)
+    for name in ["f", "XX", "XY", "navg", "coh", "Hxy_dev"]:
+        np.testing.assert_array_equal(getattr(loaded, name), getattr(result, name))
+    for a, b in zip(loaded.D, result.D):
+        np.testing.assert_array_equal(a, b)
+    assert loaded._config["win"] == result._config["win"].__module__ + ".kaiser"
+
+
+def test_plan_save_load(short_white_noise_data, tmp_path):
+    params = short_white_noise_data
+    analyzer = SpectrumAnalyzer(params["data"], fs=params["fs"], Jdes=100, Kdes=20)
+    path = tmp_path / "plan.npz"
+    save_plan(analyzer.plan(), path)
+
+    with pytest.raises(ValueError):
+        SpectrumResult.load(path)
+
+    reused = SpectrumAnalyzer(params["data"], fs=params["fs"], Jdes=100, Kdes=20)
+    reused.set_plan(load_plan(path, mmap=True))
+    np.testing.assert_allclose(reused.compute().psd, analyzer.compute().psd, rtol=1e-12)
+
+    short = SpectrumAnalyzer(params["data"][:100], fs=params["fs"])
+    with pytest.raises(ValueError):
+        short.set_plan(load_plan(path))
+
+
+def test_result_save_load_hdf5(short_white_noise_data, tmp_path):
+    pytest.importorskip("h5py")
+    params = short_white_noise_data
+    result = compute_spectrum(params["data"], fs=params["fs"], Jdes=100, Kdes=20)
+    path = tmp_path / "result.h5"
+    result.save(path)
+    loaded = SpectrumResult.load(path, mmap=True)
+    np.testing.assert_array_equal(loaded.asd, result.asd)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_table_save_load(tmp_path, mmap):
+    import pandas as pd
+
+    df = pd.DataFrame({
+        "t": np.arange(100, dtype=np.int64),
+        "x": np.linspace(0.0, 1.0, 100),
+        "ok": np.arange(100) % 2 == 0,
+    })
+    path = tmp_path / "table.npz"
+    save_table(df, path)
+    pd.testing.assert_frame_equal(load_table(path, mmap=mmap), df)
+
+    with pytest.raises(TypeError):
+        save_table(pd.DataFrame({"s": ["a", "b"]}), tmp_path / "bad.npz")
+
+
+def test_save_load_keeps_non_npz_suffix(short_white_noise_data, tmp_path):
+    """Files are written at exactly the given path, whatever its suffix."""
+    import pandas as pd
+
+    df = pd.DataFrame({"x": np.linspace(0.0, 1.0, 10)})
+    path = tmp_path / "table.bin"
+    save_table(df, path)
+    assert os.listdir(tmp_path) == ["table.bin"]
+    pd.testing.assert_frame_equal(load_table(path), df)
+
+    params = short_white_noise_data
+    result = compute_spectrum(params["data"], fs=params["fs"], Jdes=50)
+    result.save(tmp_path / "result.dat")
+    loaded = SpectrumResult.load(tmp_path / "result.dat")
+    np.testing.assert_array_equal(loaded.asd, result.asd)
+
+    plan = SpectrumAnalyzer(params["data"], fs=params["fs"], Jdes=50).plan()
+    save_plan(plan, tmp_path / "plan")
+    np.testing.assert_array_equal(load_plan(tmp_path / "plan")["f"], plan["f"])
@@ -171,3 +171,254 @@ def test_red_noise_spectral_slope(n_samples_large):
     expected_slope = -2.0
     # The new implementation should be more accurate, so we can tighten the tolerance.
     assert result.slope == pytest.approx(expected_slope, abs=0.1)
+
+
+def test_multichannel_alpha_noise_matches_single_channel():
+    """
+    Tests that each channel of the multi-channel generator equals an
+    alpha_noise generator seeded with the corresponding spawned seed,
+    including the filter state carried across calls.
+    """
+    n_channels = 4
+    gen = noise.multichannel_alpha_noise(
+        n_channels, f_sample=1000.0, f_min=5.0, f_max=400.0, alpha=1.5, seed=7,
+        init_filter=False,
+    )
+    first = gen.get_series(70_000)
+    second = gen.get_series(123)
+    assert first.shape == (n_channels, 70_000)
+
+    children = np.random.SeedSequence(7).spawn(n_channels)
+    for c in range(n_channels):
+        ref = noise.alpha_noise(1000.0, 5.0, 400.0, alpha=1.5, seed=children[c],
+                                init_filter=False)
+        np.testing.assert_array_equal(first[c], ref.get_series(70_000))
+        np.testing.assert_array_equal(second[c], ref.get_series(123))
+
+
+def test_multichannel_alpha_noise_independent_channels():
+    """Tests that the channels are uncorrelated and individually reproducible."""
+    gen = noise.multichannel_alpha_noise(16, 1000.0, 10.0, 400.0, alpha=1.0, seed=3)
+    block = gen.get_series(2**14)
+    corr = np.corrcoef(block)
+    off_diagonal = corr[~np.eye(16, dtype=bool)]
+    assert np.max(np.abs(off_diagonal)) < 0.1
+
+    sample = gen.get_sample()
+    assert sample.shape == (16,)
+    again = noise.multichannel_alpha_noise(16, 1000.0, 10.0, 400.0, alpha=1.0, seed=3)
+    np.testing.assert_array_equal(again.get_series(2**14), block)
+
+
+def test_alpha_noise_out_buffer_and_blocks():
+    """
+    Tests that alpha_noise writes into a caller-provided buffer and that
+    generating in several calls (and across internal blocks) continues the
+    same stream as a single call.
+    """
+    npts = 3 * 2**16 + 11  # Spans several internal blocks
+    gen1 = noise.alpha_noise(1000.0, 5.0, 400.0, alpha=0.8, seed=21, init_filter=False)
+    gen2 = noise.alpha_noise(1000.0, 5.0, 400.0, alpha=0.8, seed=21, init_filter=False)
+
+    full = gen1.get_series(npts)
+    buf = np.empty(npts - 100)
+    head = gen2.get_series(npts - 100, out=buf)
+    tail = gen2.get_series(100)
+    assert head is buf
+    np.testing.assert_array_equal(np.concatenate([head, tail]), full)
+
+    with pytest.raises(ValueError):
+        gen1.get_series(10, out=np.empty(5))
+    with pytest.raises(ValueError):
+        gen1.get_series(10, out=np.empty(10, dtype=np.float32))
+
+
+@pytest.mark.parametrize("alpha", [0.5, 1.7])
+def test_alpha_noise_stationary_initialization(alpha):
+    """
+    Tests that the initial filter states are drawn from the stationary
+    distribution: the first samples have the same variance as samples
+    generated long after the start-up transient.
+    """
+    n_channels = 4000
+    gen = noise.multichannel_alpha_noise(
+        n_channels, f_sample=100.0, f_min=0.05, f_max=10.0, alpha=alpha, seed=5
+    )
+    block = gen.get_series(10_000)
+    ratio = np.var(block[:, :5]) / np.var(block[:, -5:])
+    assert ratio == pytest.approx(1.0, abs=0.06)
+
+
+def test_red_noise_stationary_initialization():
+    """Tests that red noise starts in steady state across independent seeds."""
+    first, last = [], []
+    for seed in range(2000):
+        series = noise.red_noise(100.0, 0.05, seed=seed).get_series(5000)
+        first.append(series[0])
+        last.append(series[-1])
+    assert np.var(first) / np.var(last) == pytest.approx(1.0, abs=0.15)
+
+
+@pytest.mark.parametrize(
+    "make",
+    [
+        lambda: noise.white_noise(100.0, psd=2.0, seed=4),
+        lambda: noise.red_noise(100.0, 0.5, seed=4),
+        lambda: noise.alpha_noise(100.0, 0.5, 20.0, alpha=1.2, seed=4),
+    ],
+)
+def test_get_sample_buffer_and_iter_blocks(make):
+    """
+    Tests that buffered samples, blocks from iter_blocks and get_series with
+    a preallocated buffer all reproduce the same stream for any buffer size.
+    """
+    reference = make().get_series(1000)
+
+    gen = make()
+    gen.buffer_size = 7
+    samples = [gen.get_sample() for _ in range(300)]
+    gen.buffer_size = 64  # Applies from the next refill on
+    samples += [gen.get_sample() for _ in range(700)]
+    np.testing.assert_array_equal(samples, reference)
+
+    gen = make()
+    blocks = [block.copy() for block in gen.iter_blocks(100, n_blocks=10)]
+    np.testing.assert_array_equal(np.concatenate(blocks), reference)
+
+    gen = make()
+    buf = np.empty(400)
+    assert gen.get_series(400, out=buf) is buf
+    np.testing.assert_array_equal(buf, reference[:400])
+
+    with pytest.raises(ValueError):
+        gen.buffer_size = 0
+    with pytest.raises(ValueError):
+        next(gen.iter_blocks(0))
+
+
+def test_multichannel_get_sample_out():
+    """Tests the multi-channel sample buffer and its `out` argument."""
+    reference = noise.multichannel_alpha_noise(3, 100.0, 0.5, 20.0, 1.0, seed=8)
+    block = reference.get_series(50)
+
+    gen = noise.multichannel_alpha_noise(3, 100.0, 0.5, 20.0, 1.0, seed=8)
+    gen.buffer_size = 16
+    first = gen.get_sample()
+    out = np.empty(3)
+    samples = [first] + [gen.get_sample(out=out).copy() for _ in range(49)]
+    np.testing.assert_array_equal(np.stack(samples, axis=1), block)
+    assert first.base is None  # Not a view into the internal buffer
+
+
+@pytest.mark.parametrize("N", [1000, 1001])
+def test_fftnoise_matches_full_complex_ifft(N):
+    """
+    Tests that the real-FFT synthesis equals the reference construction with
+    explicit Hermitian mirroring and a full complex inverse FFT.
+    """
+    f = np.random.default_rng(0).normal(size=N) + 1j
+    phases = np.random.default_rng(5).random((N - 1) // 2) * 2.0 * np.pi
+    F = f.copy()
+    Np = phases.size
+    F[1 : Np + 1] *= np.exp(1j * phases)
+    F[-1 : -1 - Np : -1] = np.conj(F[1 : Np + 1])
+    F[0] = F[0].real
+    if N % 2 == 0:
+        F[N // 2] = F[N // 2].real
+    expected = np.fft.ifft(F).real
+
+    x = noise.fftnoise(f, rng=np.random.default_rng(5))
+    np.testing.assert_allclose(x, expected, rtol=0, atol=1e-14 * np.std(expected))
+
+    x32 = noise.fftnoise(f, rng=np.random.default_rng(5), dtype=np.float32, workers=2)
+    assert x32.dtype == np.float32
+    np.testing.assert_allclose(x32, expected, rtol=0, atol=1e-5 * np.std(expected))
+
+    with pytest.raises(ValueError):
+        noise.fftnoise(f, dtype=np.int32)
+
+
+def test_band_limited_noise_chunked_statistics():
+    """
+    Tests that the chunked overlap-add mode has the variance and passband of
+    the single-FFT synthesis and writes into a caller-provided buffer.
+    """
+    N, fs = 2**19, 1000.0
+    x = noise.band_limited_noise(10.0, 50.0, N, fs, rng=np.random.default_rng(1))
+    out = np.empty(N, dtype=np.float32)
+    y = noise.band_limited_noise(
+        10.0, 50.0, N, fs, rng=np.random.default_rng(1), dtype=np.float32,
+        chunk_size=8192, out=out,
+    )
+    assert y is out
+    assert np.var(y) == pytest.approx(np.var(x), rel=0.05)
+    # Stationary from the first sample (no filter start-up transient)
+    assert np.var(y[:4096]) == pytest.approx(np.var(y), rel=0.25)
+
+    f, p_fft = welch(x, fs, nperseg=4096)
+    _, p_ola = welch(y.astype(float), fs, nperseg=4096)
+    passband = (f > 12.0) & (f < 48.0)
+    stopband = (f < 5.0) | (f > 60.0)
+    assert np.mean(p_ola[passband]) == pytest.approx(np.mean(p_fft[passband]), rel=0.05)
+    assert np.max(p_ola[stopband]) < 1e-3 * np.mean(p_ola[passband])
+
+    with pytest.raises(ValueError):
+        noise.band_limited_noise(0.001, 0.01, N, fs, chunk_size=64)
+    with pytest.raises(ValueError):
+        noise.band_limited_noise(10.0, 50.0, N, fs, out=np.empty(N, dtype=np.float32))
+
+
+def test_psd_noise_matches_target_spectrum():
+    """
+    Tests that noise generated from a fitted target PSD has that spectrum,
+    and that the stream continues across calls.
+    """
+    fs = 100.0
+
+    def target(f):
+        return 1e-2 / f**1.5 + 1e-3
+
+    gen = noise.psd_noise(fs, target, f_min=0.01, seed=1)
+    assert gen.fit_error < 0.5  # dB
+    f_check = np.geomspace(0.02, 45.0, 50)
+    np.testing.assert_allclose(gen.model_psd(f_check), target(f_check), rtol=0.05)
+
+    x = gen.get_series(2**20)
+    f, pxx = welch(x, fs, nperseg=2**14)
+    for lo, hi in [(0.05, 0.2), (0.5, 2.0), (5.0, 20.0), (20.0, 45.0)]:
+        band = (f >= lo) & (f <= hi)
+        assert np.mean(pxx[band]) == pytest.approx(np.mean(target(f[band])), rel=0.1)
+
+    gen1 = noise.psd_noise(fs, target, f_min=0.01, seed=2)
+    gen2 = noise.psd_noise(fs, target, f_min=0.01, seed=2)
+    full = gen1.get_series(5000)
+    parts = np.concatenate([gen2.get_series(1234), gen2.get_series(3766)])
+    np.testing.assert_array_equal(parts, full)
+
+
+def test_psd_noise_from_spectrum_result_and_cache():
+    """
+    Tests fitting a measured SpectrumResult, that (f, psd) samples give the
+    same fit and that fits are reused for the same target.
+    """
+    from speckit import compute_spectrum
+
+    fs = 100.0
+    data = noise.alpha_noise(fs, 0.05, 40.0, alpha=1.2, seed=3).get_series(2**18)
+    result = compute_spectrum(data, fs=fs)
+
+    gen = noise.psd_noise(fs, result, seed=4)
+    assert gen.fmin == pytest.approx(result.f[0])
+    assert gen.fit_error < 1.5  # dB, the estimate itself is noisy
+    simulated = compute_spectrum(gen.get_series(2**18), fs=fs)
+    band = (result.f > 0.1) & (result.f < 40.0)
+    ratio_db = 10.0 * np.log10(simulated.psd[band] / result.psd[band])
+    assert abs(np.median(ratio_db)) < 0.5
+
+    again = noise.psd_noise(fs, (result.f, result.psd), seed=5)
+    assert again._f_zeros is gen._f_zeros  # Served from the fit cache
+
+    with pytest.raises(ValueError):
+        noise.psd_noise(fs, lambda f: 1.0 / f)
+    with pytest.raises(TypeError):
+        noise.psd_noise(fs, 1.0)
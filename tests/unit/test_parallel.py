@@ -0,0 +1,184 @@
+# BSD 3-Clause License
+
+# Copyright (c) 2025, Miguel Dovale
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# 1. Redistributions of source code must retain the above copyright notice, this
+#    list of conditions and the following disclaimer.
+
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from
+#    this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+# FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+# DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+# SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+# OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# This software may be subject to U.S. export control laws. By accepting this
+# software, the user agrees to comply with all applicable U.S. export laws and
+# regulations. User has the responsibility to obtain export licenses, or other
+# export authority as may be required before exporting such information to
+# foreign countries or providing access to foreign persons.
+#
+import pytest
+import numpy as np
+
+import speckit
+from speckit import parallel
+
+
+def test_set_num_threads_roundtrip():
+    """set_num_threads returns the previous value so it can be restored."""
+    original = speckit.get_num_threads()
+    previous = speckit.set_num_threads(1)
+    try:
+        assert previous == original
+        assert speckit.get_num_threads() == 1
+    finally:
+        speckit.set_num_threads(original)
+    assert speckit.get_num_threads() == original
+
+
+def test_set_num_threads_clips_and_validates():
+    original = speckit.get_num_threads()
+    try:
+        speckit.set_num_threads(10 * parallel.max_threads())
+        assert speckit.get_num_threads() == parallel.max_threads()
+    finally:
+        speckit.set_num_threads(original)
+    with pytest.raises(ValueError):
+        speckit.set_num_threads(0)
+
+
+def test_num_threads_context_restores():
+    original = speckit.get_num_threads()
+    with speckit.num_threads(1) as n:
+        assert n == 1
+        assert speckit.get_num_threads() == 1
+    assert speckit.get_num_threads() == original
+
+    with speckit.num_threads(None) as n:
+        assert n == original
+
+
+def test_blas_limits_are_scoped(monkeypatch):
+    """BLAS limits apply inside num_threads only, and are restored on exit."""
+    calls = []
+
+    class FakeLimits:
+        def __init__(self, limits):
+            calls.append(("limit", limits))
+
+        def restore_original_limits(self):
+            calls.append(("restore", None))
+
+    monkeypatch.setattr(parallel, "_HAS_THREADPOOLCTL", True)
+    monkeypatch.setattr(parallel, "threadpool_limits", FakeLimits, raising=False)
+
+    original = speckit.get_num_threads()
+    try:
+        speckit.set_num_threads(1)
+    finally:
+        speckit.set_num_threads(original)
+    assert calls == []
+
+    with speckit.num_threads(1):
+        assert calls == [("limit", 1)]
+    assert calls == [("limit", 1), ("restore", None)]
+
+
+@pytest.mark.parametrize(
+    "n_workers, budget, expected", [(4, 16, 4), (3, 16, 5), (32, 16, 1), (1, 8, 8)]
+)
+def test_threads_per_worker(n_workers, budget, expected):
+    assert speckit.threads_per_worker(n_workers, budget) == expected
+
+
+def test_compute_n_threads_matches_default(short_white_noise_data):
+    """The thread count must not change the result."""
+    params = short_white_noise_data
+    analyzer = speckit.SpectrumAnalyzer(params["data"], params["fs"], Jdes=100)
+    original = speckit.get_num_threads()
+    res_default = analyzer.compute()
+    res_single = analyzer.compute(n_threads=1)
+    assert speckit.get_num_threads() == original
+    np.testing.assert_allclose(res_single.Gxx, res_default.Gxx, rtol=1e-10)
+
+
+def test_bin_groups_partition_plan(short_white_noise_data):
+    """Every bin lands in exactly one group."""
+    params = short_white_noise_data
+    analyzer = speckit.SpectrumAnalyzer(params["data"], params["fs"], Jdes=100)
+    nf = analyzer.plan()["nf"]
+    groups = analyzer._bin_groups(7)
+    assert len(groups) == 7
+    np.testing.assert_array_equal(np.sort(np.concatenate(groups)), np.arange(nf))
+
+
+@pytest.mark.parametrize("order", [-1, 0, 1])
+def test_compute_with_process_pool_matches_serial(siso_data, order):
+    """Distributing bin groups over processes reproduces the serial result."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    params = siso_data
+    data = np.vstack([params["input"], params["output"]])
+    analyzer = speckit.SpectrumAnalyzer(data, params["fs"], Jdes=100, order=order)
+    serial = analyzer.compute()
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        pooled = analyzer.compute(executor=pool)
+    np.testing.assert_allclose(pooled.f, serial.f)
+    np.testing.assert_allclose(pooled.Gxx, serial.Gxx, rtol=1e-10)
+    np.testing.assert_allclose(pooled.Gxy, serial.Gxy, rtol=1e-10)
+    np.testing.assert_allclose(pooled.M2, serial.M2, rtol=1e-10)
+
+
+def test_compute_with_generic_executor_n_workers(short_white_noise_data):
+    """Executors without a pool size take the worker count from `n_workers`."""
+    from concurrent.futures import Executor, Future
+
+    class InlineExecutor(Executor):
+        def __init__(self):
+            self.calls = []
+
+        def submit(self, fn, *args, **kwargs):
+            self.calls.append(args)
+            future = Future()
+            future.set_result(fn(*args, **kwargs))
+            return future
+
+    params = short_white_noise_data
+    analyzer = speckit.SpectrumAnalyzer(params["data"], params["fs"], Jdes=100)
+    serial = analyzer.compute()
+
+    executor = InlineExecutor()
+    result = analyzer.compute(executor=executor, n_workers=3)
+    np.testing.assert_allclose(result.Gxx, serial.Gxx, rtol=1e-10)
+    assert len(executor.calls) == 12  # Four bin groups per worker
+    assert all(args[-1] == speckit.threads_per_worker(3) for args in executor.calls)
+
+    with pytest.raises(ValueError):
+        analyzer.compute(executor=executor, n_workers=0)
+
+
+def test_shared_array_roundtrip():
+    arr = np.arange(12, dtype=np.float64).reshape(3, 4)
+    shm, spec = parallel.share_array(arr)
+    try:
+        total = parallel.call_with_shared_array(spec, lambda a: float(a.sum()))
+        assert total == arr.sum()
+    finally:
+        shm.close()
+        shm.unlink()